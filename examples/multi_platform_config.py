@@ -6,113 +6,164 @@ This script shows how to use the new multi-platform path functionality
 to manage configuration files that have different locations on different operating systems.
 """
 
+import asyncio
+import importlib.util
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Set SUPERDOTS_DEBUG to get full tracebacks on failure
+_DEBUG = bool(os.environ.get('SUPERDOTS_DEBUG'))
+if _DEBUG:
+    import traceback
+
+if importlib.util.find_spec('superdots') is None:
+    raise SystemExit("Run `pip install -e .` from the repository root before running the examples")
 
 from superdots.core.config import ConfigManager, ConfigFile
-from superdots.utils.platform import OSType
+from superdots.utils.platform import OSType, platform_detector
+
+# Symlink on POSIX, copy on Windows where symlinks need extra privileges
+_USE_SYMLINK = not platform_detector.is_windows
+
+# Shared repository location and per-OS source paths used by the examples
+HOME = Path.home()
+REPO_PATH = HOME / '.superdots'
+
+# Bash config lives in different places per OS
+BASH_PATHS = {
+    OSType.LINUX: HOME / '.bashrc',
+    OSType.MACOS: HOME / '.bash_profile',
+    OSType.WINDOWS: HOME / '.bashrc',  # WSL or Git Bash
+}
+
+# Windows vim uses _vimrc
+VIM_PATHS = dict.fromkeys((OSType.LINUX, OSType.MACOS), HOME / '.vimrc')
+VIM_PATHS[OSType.WINDOWS] = HOME / '_vimrc'
+
+# Git config is the same on all platforms
+GIT_PATHS = dict.fromkeys((OSType.LINUX, OSType.MACOS, OSType.WINDOWS), HOME / '.gitconfig')
+
+# Platforms paired with their display labels, in report order
+_OS_LABELS = tuple((os_type, os_type.value) for os_type in OSType)
+
+# Report line templates
+_PLATFORM_LINE = "   %s: %s %s"
+_CFG_HEADER = "\n📁 %s"
+
+# Configurations added by the examples above, deployed by the deploy example
+_DEPLOYABLE = frozenset({'bash_config', 'vim_config', 'git_config'})
+
+
+@lru_cache(maxsize=1)
+def _cm() -> ConfigManager:
+    """Get the config manager shared by all examples."""
+    return ConfigManager(REPO_PATH)
+
+
+def _exists(path: Path, entries: dict) -> bool:
+    """Check existence against a _scan_parent_dirs() result, falling back to stat()."""
+    names = entries.get(path.parent)
+    if names is None:
+        return path.exists()
+    return path.name in names
+
+
+def _write_lines(lines):
+    """Write a block of output lines with a single stdout write."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 def example_bash_config():
-    """Example: Bash configuration with different paths per OS."""
-    print("=== Example: Bash Configuration ===")
+    """Example: Bash configuration with different paths per OS.
 
-    # Initialize config manager
-    repo_path = Path.home() / '.superdots'
-    config_manager = ConfigManager(repo_path)
+    Returns the output lines so concurrent examples can be printed in order.
+    """
+    lines = ["=== Example: Bash Configuration ==="]
 
-    # Define different bash config paths for different OS
-    bash_paths = {
-        OSType.LINUX: Path.home() / '.bashrc',
-        OSType.MACOS: Path.home() / '.bash_profile',
-        OSType.WINDOWS: Path.home() / '.bashrc',  # WSL or Git Bash
-    }
+    config_manager = _cm()
 
     # Add configuration with multiple OS paths
     success = config_manager.add_config(
-        source_paths=bash_paths,
+        source_paths=dict(BASH_PATHS),
         name='bash_config',
         description='Bash shell configuration for multiple platforms',
         tags=['shell', 'bash'],
-        use_symlink=True
+        use_symlink=_USE_SYMLINK,
+        skip_if_unchanged=True
     )
 
     if success:
-        print("✅ Successfully added bash configuration with multi-platform paths")
+        lines.append("✅ Successfully added bash configuration with multi-platform paths")
 
         # Show platform paths
         paths = config_manager.list_platform_paths('bash_config')
-        for platform, (path, exists) in paths.items():
-            status = "✅" if exists else "❌"
-            print(f"  {platform.value}: {path} {status}")
+        for os_key, label in _OS_LABELS:
+            if os_key in paths:
+                path, exists = paths[os_key]
+                lines.append(_PLATFORM_LINE % (label, path, "✅" if exists else "❌"))
     else:
-        print("❌ Failed to add bash configuration")
+        lines.append("❌ Failed to add bash configuration")
+    return lines
 
 
 def example_vim_config():
-    """Example: Vim configuration with different paths per OS."""
-    print("\n=== Example: Vim Configuration ===")
+    """Example: Vim configuration with different paths per OS.
 
-    repo_path = Path.home() / '.superdots'
-    config_manager = ConfigManager(repo_path)
+    Returns the output lines so concurrent examples can be printed in order.
+    """
+    lines = ["\n=== Example: Vim Configuration ==="]
 
-    # Define different vim config paths for different OS
-    vim_paths = {
-        OSType.LINUX: Path.home() / '.vimrc',
-        OSType.MACOS: Path.home() / '.vimrc',
-        OSType.WINDOWS: Path.home() / '_vimrc',  # Windows vim uses _vimrc
-    }
+    config_manager = _cm()
 
     success = config_manager.add_config(
-        source_paths=vim_paths,
+        source_paths=dict(VIM_PATHS),
         name='vim_config',
         description='Vim editor configuration',
         tags=['editor', 'vim'],
-        use_symlink=True
+        use_symlink=_USE_SYMLINK,
+        skip_if_unchanged=True
     )
 
     if success:
-        print("✅ Successfully added vim configuration")
+        lines.append("✅ Successfully added vim configuration")
+    return lines
 
 
 def example_git_config():
-    """Example: Git configuration (same path on all platforms)."""
-    print("\n=== Example: Git Configuration ===")
+    """Example: Git configuration (same path on all platforms).
 
-    repo_path = Path.home() / '.superdots'
-    config_manager = ConfigManager(repo_path)
+    Returns the output lines so concurrent examples can be printed in order.
+    """
+    lines = ["\n=== Example: Git Configuration ==="]
 
-    # Git config is the same on all platforms
-    git_paths = {
-        OSType.LINUX: Path.home() / '.gitconfig',
-        OSType.MACOS: Path.home() / '.gitconfig',
-        OSType.WINDOWS: Path.home() / '.gitconfig',
-    }
+    config_manager = _cm()
 
     success = config_manager.add_config(
-        source_paths=git_paths,
+        source_paths=dict(GIT_PATHS),
         name='git_config',
         description='Git configuration file',
         tags=['git', 'vcs'],
-        use_symlink=True
+        use_symlink=_USE_SYMLINK,
+        skip_if_unchanged=True
     )
 
     if success:
-        print("✅ Successfully added git configuration")
+        lines.append("✅ Successfully added git configuration")
+    return lines
 
 
 def example_add_platform_later():
     """Example: Adding platform-specific path later."""
     print("\n=== Example: Adding Platform Path Later ===")
 
-    repo_path = Path.home() / '.superdots'
-    config_manager = ConfigManager(repo_path)
+    config_manager = _cm()
 
     # First, add config for current platform only
-    current_bashrc = Path.home() / '.bashrc'
+    current_bashrc = HOME / '.bashrc'
     if current_bashrc.exists():
         success = config_manager.add_config(
             source_paths=str(current_bashrc),  # Single path for current platform
@@ -125,88 +176,115 @@ def example_add_platform_later():
 
             # Later, add paths for other platforms
             other_platforms = {
-                OSType.MACOS: Path.home() / '.bash_profile',
-                OSType.WINDOWS: Path.home() / '.bashrc',
+                OSType.MACOS: HOME / '.bash_profile',
+                OSType.WINDOWS: current_bashrc,
             }
 
-            for platform, path in other_platforms.items():
-                # Note: This will fail if the path doesn't exist
-                # In real usage, you'd create the file first or copy from repo
-                result = config_manager.add_platform_path(
-                    'bashrc_example',
-                    platform,
-                    path,
-                    force=False
-                )
-                if result:
-                    print(f"✅ Added {platform.value} path: {path}")
-                else:
-                    print(f"❌ Failed to add {platform.value} path: {path}")
-
-
-def example_deploy_current_platform():
+            # batch() writes the index once for all platforms
+            with config_manager.batch():
+                for platform, path in other_platforms.items():
+                    # Note: This will fail if the path doesn't exist
+                    # In real usage, you'd create the file first or copy from repo
+                    result = config_manager.add_platform_path(
+                        'bashrc_example',
+                        platform,
+                        path,
+                        force=False
+                    )
+                    pv = platform.value
+                    if result:
+                        print(f"✅ Added {pv} path: {path}")
+                    else:
+                        print(f"❌ Failed to add {pv} path: {path}")
+
+
+def example_deploy_current_platform(configs):
     """Example: Deploying configuration for current platform."""
     print("\n=== Example: Deploying Configuration ===")
 
-    repo_path = Path.home() / '.superdots'
-    config_manager = ConfigManager(repo_path)
-
-    # List all configurations
-    configs = config_manager.list_configs()
+    config_manager = _cm()
 
     if configs:
-        print(f"Found {len(configs)} configurations:")
+        current_pv = configs[0].current_platform.value
+        lines = [f"Found {len(configs)} configurations:"]
+        entries = config_manager._scan_parent_dirs(
+            path for path in (c.get_source_path() for c in configs) if path
+        )
 
         for config in configs:
-            print(f"\n📁 {config.name}")
-            print(f"   Type: {config.config_type.value}")
-            print(f"   Platforms: {[p.value for p in config.platforms]}")
+            lines.append(_CFG_HEADER % config.name)
+            lines.append(f"   Type: {config.config_type.value}")
+            lines.append(f"   Platforms: {list(config.platform_values)}")
 
             # Show current platform path
             current_path = config.get_source_path()
             if current_path:
-                exists = "✅" if current_path.exists() else "❌"
-                print(f"   Current platform path: {current_path} {exists}")
+                exists = "✅" if _exists(current_path, entries) else "❌"
+                lines.append(f"   Current platform path: {current_path} {exists}")
             else:
-                print(f"   ❌ No path defined for current platform ({config.current_platform.value})")
-
-            # Try to deploy
-            if config.name in ['bash_config', 'vim_config', 'git_config']:
-                print(f"   Deploying {config.name}...")
-                success = config_manager.deploy_config(config.name, force=True)
-                if success:
-                    print(f"   ✅ Deployed successfully")
-                else:
-                    print(f"   ❌ Deployment failed")
+                lines.append(f"   ❌ No path defined for current platform ({current_pv})")
+
+        # Deploy the example configurations in one batch
+        to_deploy = [c.name for c in configs if c.name in _DEPLOYABLE]
+        lines.append(f"\nDeploying {len(to_deploy)} configurations...")
+        _write_lines(lines)
+
+        results = config_manager.deploy_configs(to_deploy, force=True)
+        _write_lines([
+            f"   ✅ {name}: deployed successfully" if success else f"   ❌ {name}: deployment failed"
+            for name, success in results.items()
+        ])
     else:
         print("No configurations found")
 
 
-def example_cross_platform_status():
+def example_cross_platform_status(configs, status):
     """Example: Checking status across platforms."""
     print("\n=== Example: Cross-Platform Status ===")
 
-    repo_path = Path.home() / '.superdots'
-    config_manager = ConfigManager(repo_path)
-
-    # Get overall status
-    status = config_manager.check_status()
+    # Membership sets for O(1) status lookups per config
+    status_sets = {k: frozenset(v) for k, v in status.items()}
+    missing = status_sets.get('missing', frozenset())
 
-    print("Configuration Status:")
+    lines = ["Configuration Status:"]
     for status_type, config_names in status.items():
         if config_names:
-            print(f"  {status_type.upper()}: {', '.join(config_names)}")
+            lines.append(f"  {status_type.upper()}: {', '.join(config_names)}")
 
     # Show detailed platform info for each config
-    configs = config_manager.list_configs()
+    entries = _cm()._scan_parent_dirs(
+        path for config in configs for path in config.source_paths.values()
+    )
     for config in configs:
-        print(f"\n📁 {config.name}")
-
-        for platform in config.get_supported_platforms():
-            path = config.source_paths[platform]
-            exists = path.exists()
+        lines.append(_CFG_HEADER % config.name)
+        if config.name in missing:
+            lines.append("   ⚠ Source missing on every platform")
+
+        source_paths = config.source_paths
+        path_strs = config.source_path_strs
+        supported = [(os_key, label) for os_key, label in _OS_LABELS if os_key in source_paths]
+        for os_key, label in supported:
+            exists = _exists(source_paths[os_key], entries)
             status_icon = "✅" if exists else "❌"
-            print(f"   {platform.value}: {path} {status_icon}")
+            lines.append(_PLATFORM_LINE % (label, path_strs[os_key], status_icon))
+
+    _write_lines(lines)
+
+
+async def add_examples():
+    """Run the independent add_config examples concurrently.
+
+    Output is collected from each example and written afterwards in
+    example order, so the reports never interleave.
+    """
+    loop = asyncio.get_running_loop()
+    reports = await asyncio.gather(
+        loop.run_in_executor(None, example_bash_config),
+        loop.run_in_executor(None, example_vim_config),
+        loop.run_in_executor(None, example_git_config),
+    )
+    for lines in reports:
+        _write_lines(lines)
 
 
 def main():
@@ -215,20 +293,25 @@ def main():
     print("=" * 50)
 
     try:
-        example_bash_config()
-        example_vim_config()
-        example_git_config()
+        # Build the shared manager before handing it to worker threads
+        _cm()
+        asyncio.run(add_examples())
+
+        # These depend on the configurations added above
         example_add_platform_later()
-        example_deploy_current_platform()
-        example_cross_platform_status()
+
+        # List once and share with the remaining examples
+        configs = _cm().list_configs()
+        example_deploy_current_platform(configs)
+        example_cross_platform_status(configs, _cm().check_status())
 
         print("\n" + "=" * 50)
         print("All examples completed!")
 
     except Exception as e:
         print(f"❌ Error running examples: {e}")
-        import traceback
-        traceback.print_exc()
+        if _DEBUG:
+            traceback.print_exc()
 
 
 if __name__ == '__main__':
@@ -5,40 +5,48 @@ This package provides tools for managing configuration files across different
 operating systems using Git repositories for synchronization.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "SuperDots Team"
 __email__ = "admin@superdots.dev"
 __description__ = "A cross-platform dotfiles and configuration management tool"
 
-# Core imports - use try/except to handle import errors gracefully
-try:
-    from .core.config import ConfigManager
-except ImportError:
-    ConfigManager = None
+# Core imports - resolved lazily on first attribute access (PEP 562) so that
+# importing the package does not load every submodule up front
+_lazy_map = {
+    'ConfigManager': ('.core.config', 'ConfigManager'),
+    'SyncManager': ('.core.sync', 'SyncManager'),
+    'GitHandler': ('.core.git_handler', 'GitHandler'),
+    'PlatformDetector': ('.utils.platform', 'PlatformDetector'),
+    'get_logger': ('.utils.logger', 'get_logger'),
+}
+
+
+def __getattr__(name):
+    entry = _lazy_map.get(name)
+    if entry is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        module = importlib.import_module(entry[0], __name__)
+    except ImportError:
+        # Missing optional dependency - expose None rather than failing
+        obj = None
+    else:
+        obj = getattr(module, entry[1])
 
-try:
-    from .core.sync import SyncManager
-except ImportError:
-    SyncManager = None
+    globals()[name] = obj
+    return obj
 
-try:
-    from .core.git_handler import GitHandler
-except ImportError:
-    GitHandler = None
 
-try:
-    from .utils.platform import PlatformDetector
-except ImportError:
-    PlatformDetector = None
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_map))
 
-try:
-    from .utils.logger import get_logger
-except ImportError:
-    get_logger = None
 
 # Version info
 VERSION = __version__
-VERSION_INFO = tuple(map(int, __version__.split('.')))
+VERSION_INFO = (1, 0, 0)  # keep in sync with __version__
 
 # Package metadata
 __all__ = [
@@ -50,13 +58,3 @@ __all__ = [
     'VERSION',
     'VERSION_INFO',
 ]
-
-# Initialize logger
-try:
-    if get_logger:
-        logger = get_logger(__name__)
-        logger.info(f"SuperDots v{__version__} initialized")
-    else:
-        logger = None
-except Exception:
-    logger = None
@@ -9,27 +9,54 @@ across different platforms using Git repositories for synchronization.
 import os
 import sys
 import json
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import click
-from rich.console import _STD_STREAMS_OUTPUT, Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt, Confirm
-
-from .core.config import ConfigManager, ConfigFile, ConfigStatus, ConfigType, OSType
-from .core.sync import SyncManager, SyncStatus, ConflictResolution
-from .core.git_handler import GitHandler, GitError
+from rich.console import Console
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+from . import __version__
 from .utils.logger import get_logger, setup_logging
-from .utils.platform import platform_detector
+from .utils.platform import platform_detector, OSType
 from .utils.path import normalize_path
 
+# Heavier modules (rich widgets, the core managers and GitPython behind them)
+# are imported inside the commands that use them to keep CLI startup fast
+if TYPE_CHECKING:
+    from rich.progress import Progress
+    from rich.table import Table
+    from .core.config import ConfigFile
+
 # Rich console for formatted output
 console = Console()
 
+# Table colors keyed by ConfigStatus value
+_STATUS_COLOR = {
+    'tracked': "green",
+    'modified': "yellow",
+    'missing': "red",
+    'conflicted': "red bold",
+    'untracked': "dim",
+}
+_DEFAULT_COLOR = "white"
 
+# Shared option choices and their value -> OSType mapping
+_OS_CHOICE = click.Choice(['linux', 'darwin', 'windows'])
+_STATUS_CHOICE = click.Choice(['tracked', 'modified', 'missing', 'conflicted', 'untracked'])
+_OS_MAP = {os_type.value: os_type for os_type in OSType}
+
+
+@lru_cache(maxsize=None)
 def get_default_repo_path() -> Path:
     """Get the default repository path."""
     return platform_detector.home_dir / '.superdots'
@@ -37,6 +64,10 @@ def get_default_repo_path() -> Path:
 
 def initialize_managers(repo_path: Path, remote_url: Optional[str] = None):
     """Initialize configuration and sync managers."""
+    from .core.config import ConfigManager
+    from .core.git_handler import GitHandler
+    from .core.sync import SyncManager
+
     try:
         git_handler = GitHandler(repo_path, remote_url)
         config_manager = ConfigManager(repo_path)
@@ -47,46 +78,96 @@ def initialize_managers(repo_path: Path, remote_url: Optional[str] = None):
         sys.exit(1)
 
 
-def format_config_table(configs: List[ConfigFile]) -> tuple[Table, int]:
+def create_progress(refresh_per_second: float = 10) -> 'Progress':
+    """Create the spinner progress display used by long-running commands."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        refresh_per_second=refresh_per_second
+    )
+
+
+def iter_config_rows(configs: List['ConfigFile']):
+    """Yield (name, type, status, source path, platforms) rows for the current platform."""
+    current_os = platform_detector.os_type
+
+    for config in configs:
+        source_path = config.source_paths.get(current_os)
+        if not source_path:
+            continue
+
+        yield (
+            config.name,
+            config.config_type.value,
+            config.status.value,
+            str(source_path),
+            ", ".join(config.platform_values),
+        )
+
+
+def format_config_table(configs: List['ConfigFile']) -> 'tuple[Table, int]':
     """Format configurations as a rich table."""
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold blue")
     table.add_column("Name", style="cyan", no_wrap=True)
     table.add_column("Type", style="green")
     table.add_column("Status", style="yellow")
     table.add_column("Source Path", style="magenta")
     table.add_column("Platforms", style="blue")
-    
+
+    get_color = _STATUS_COLOR.get
+
     total = 0
-    for config in configs:
+    for name, config_type, status_value, source_path, platforms_text in iter_config_rows(configs):
         # Format status with color
-        status_color = {
-            ConfigStatus.TRACKED: "green",
-            ConfigStatus.MODIFIED: "yellow",
-            ConfigStatus.MISSING: "red",
-            ConfigStatus.CONFLICTED: "red bold",
-            ConfigStatus.UNTRACKED: "dim",
-        }
-
-        status_text = f"[{status_color.get(config.status, 'white')}]{config.status.value}[/]"
-        platforms_text = ", ".join([p.value for p in config.platforms])
-        source_path = config.source_paths.get(platform_detector.os_type) 
-        if not source_path:
-            continue
-        
+        status_text = f"[{get_color(status_value, _DEFAULT_COLOR)}]{status_value}[/]"
+
         total += 1
-        table.add_row(
-            config.name,
-            config.config_type.value,
-            status_text,
-            str(source_path),
-            platforms_text
-        )
+        table.add_row(name, config_type, status_text, source_path, platforms_text)
 
     return table, total
 
 
+def write_config_rows(configs: List['ConfigFile']) -> int:
+    """Stream configurations as tab-separated rows, one write per row."""
+    write = sys.stdout.write
+
+    total = 0
+    for row in iter_config_rows(configs):
+        write("\t".join(row) + "\n")
+        total += 1
+
+    return total
+
+
+def _json_default(obj):
+    """Serialize values the JSON encoders do not handle natively."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (Path, datetime)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(data) -> None:
+    """Write data as indented JSON straight to stdout, bypassing Rich markup."""
+    if HAS_ORJSON:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        sys.stdout.write(json.dumps(data, indent=2, default=_json_default) + "\n")
+
+
 def format_sync_result(result) -> None:
     """Format and display sync result."""
+    from .core.sync import SyncStatus
+
     if result.status == SyncStatus.SUCCESS:
         console.print(f"[green]✓ {result.message}[/green]")
     elif result.status == SyncStatus.CONFLICT:
@@ -110,7 +191,7 @@ def format_sync_result(result) -> None:
 # Main CLI group
 @click.group()
 @click.option('--repo-path', type=click.Path(path_type=Path),
-              default=get_default_repo_path(),
+              default=get_default_repo_path, show_default=False,
               help='Path to SuperDots repository')
 @click.option('--remote-url', type=str, help='Remote repository URL')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
@@ -126,6 +207,7 @@ def cli(ctx, repo_path: Path, remote_url: Optional[str], verbose: bool, log_file
         log_file=log_file,
         verbose=verbose
     )
+    get_logger().debug("SuperDots v%s initialized", __version__)
 
     # Store common options in context
     ctx.obj['repo_path'] = repo_path
@@ -143,6 +225,7 @@ def init(ctx, remote_url: Optional[str], force: bool):
     repo_path = ctx.obj['repo_path']
 
     if repo_path.exists() and not force:
+        from rich.prompt import Confirm
         if not Confirm.ask(f"Directory {repo_path} already exists. Continue?"):
             console.print("Initialization cancelled.")
             return
@@ -152,17 +235,14 @@ def init(ctx, remote_url: Optional[str], force: bool):
         remote_url = ctx.obj['remote_url']
 
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with create_progress() as progress:
             task = progress.add_task("Initializing SuperDots repository...\n", total=None)
 
             config_manager, sync_manager, git_handler = initialize_managers(repo_path, remote_url)
 
             progress.update(task, description="Repository initialized successfully!")
 
+        from rich.panel import Panel
         console.print(Panel(
             f"[green]✓ SuperDots repository initialized at:[/green]\n"
             f"[cyan]{repo_path}[/cyan]\n\n"
@@ -183,11 +263,11 @@ def init(ctx, remote_url: Optional[str], force: bool):
 # Add command
 @cli.command()
 @click.argument('source_path', type=click.Path(exists=True, path_type=Path))
-@click.option('--extra_paths', type=(click.Choice(['linux', 'darwin', 'windows']), click.Path(exists=False, path_type=Path)), multiple=True, help='Optional additional source paths. <os> <path>')
+@click.option('--extra_paths', type=(_OS_CHOICE, click.Path(exists=False, path_type=Path)), multiple=True, help='Optional additional source paths. <os> <path>')
 @click.option('--name', type=str, help='Custom name for the configuration')
 @click.option('--description', type=str, help='Description of the configuration')
 @click.option('--tags', type=str, multiple=True, help='Tags for categorization')
-@click.option('--platforms', type=click.Choice(['linux', 'darwin', 'windows']),
+@click.option('--platforms', type=_OS_CHOICE,
               multiple=True, help='Target platforms')
 @click.option('--use-symlink', is_flag=True, help='Use symlinks instead of file copies')
 @click.option('--force', is_flag=True, help='Overwrite existing configurations')
@@ -208,17 +288,13 @@ def add(ctx, source_path: Path, extra_paths: tuple[tuple[str, Path], ...], name:
     source_paths = {platform_detector.os_type: source_path}
     if not extra_paths:
         for p in platforms:
-            source_paths[OSType(p)] = source_path
+            source_paths[_OS_MAP[p]] = source_path
     else:
         for platform, path in extra_paths:
-            source_paths[OSType(platform)] = normalize_path(path, platform_detector.home_dir)
+            source_paths[_OS_MAP[platform]] = normalize_path(path, platform_detector.home_dir)
 
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with create_progress() as progress:
             console.print(source_path, source_paths)
             task = progress.add_task(f"Adding configuration {name or source_path.name}...", total=None)
 
@@ -267,6 +343,8 @@ def remove(ctx, name: str, keep_files: bool, force: bool):
 
     # Confirmation
     if not force:
+        from rich.prompt import Confirm
+
         console.print(f"Configuration: [cyan]{config.name}[/cyan]")
         console.print(f"Source path: [magenta]{config.source_path}[/magenta]")
         console.print(f"Repository path: [magenta]{config.repo_path}[/magenta]")
@@ -288,16 +366,16 @@ def remove(ctx, name: str, keep_files: bool, force: bool):
 
 
 # List command
-@cli.command()
-@click.option('--platform', type=click.Choice(['linux', 'darwin', 'windows']),
+@cli.command('list')
+@click.option('--platform', type=_OS_CHOICE,
               help='Filter by platform')
-@click.option('--status', type=click.Choice(['tracked', 'modified', 'missing', 'conflicted', 'untracked']),
+@click.option('--status', type=_STATUS_CHOICE,
               help='Filter by status')
 @click.option('--tags', type=str, multiple=True, help='Filter by tags')
 @click.option('--format', 'output_format', type=click.Choice(['table', 'json']),
               default='table', help='Output format')
 @click.pass_context
-def list(ctx, platform: Optional[str], status: Optional[str], tags: tuple, output_format: str):
+def list_cmd(ctx, platform: Optional[str], status: Optional[str], tags: tuple, output_format: str):
     """List managed configurations."""
     repo_path = ctx.obj['repo_path']
 
@@ -307,8 +385,10 @@ def list(ctx, platform: Optional[str], status: Optional[str], tags: tuple, outpu
 
     config_manager, sync_manager, git_handler = initialize_managers(repo_path)
 
+    from .core.config import ConfigStatus
+
     # Apply filters
-    platform_filter = OSType(platform) if platform else None
+    platform_filter = _OS_MAP[platform] if platform else None
     status_filter = ConfigStatus(status) if status else None
 
     configs = config_manager.list_configs(
@@ -324,7 +404,10 @@ def list(ctx, platform: Optional[str], status: Optional[str], tags: tuple, outpu
     if output_format == 'json':
         # JSON output
         data = [config.to_dict() for config in configs]
-        console.print(json.dumps(data, indent=2, default=str))
+        write_json(data)
+    elif not console.is_terminal:
+        # Plain rows when piped, without building a Rich table
+        write_config_rows(configs)
     else:
         # Table output
         table, total = format_config_table(configs)
@@ -337,6 +420,9 @@ def list(ctx, platform: Optional[str], status: Optional[str], tags: tuple, outpu
 @click.pass_context
 def status(ctx):
     """Show status of configurations and repository."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     repo_path = ctx.obj['repo_path']
 
     if not repo_path.exists():
@@ -390,7 +476,7 @@ def status(ctx):
 @cli.command()
 @click.argument('name', type=str, required=False)
 @click.option('--all', 'deploy_all', is_flag=True, help='Deploy all configurations')
-@click.option('--platform', type=click.Choice(['linux', 'darwin', 'windows']),
+@click.option('--platform', type=_OS_CHOICE,
               help='Target platform')
 @click.option('--force', is_flag=True, help='Overwrite existing files')
 @click.pass_context
@@ -410,13 +496,9 @@ def deploy(ctx, name: Optional[str], deploy_all: bool, platform: Optional[str],
 
     try:
         if deploy_all:
-            target_platform = OSType(platform) if platform else None
+            target_platform = _OS_MAP[platform] if platform else None
 
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
+            with create_progress() as progress:
                 task = progress.add_task("Deploying configurations...", total=None)
 
                 deployed = config_manager.deploy_all(platform=target_platform, force=force)
@@ -425,11 +507,7 @@ def deploy(ctx, name: Optional[str], deploy_all: bool, platform: Optional[str],
 
             console.print(f"[green]✓ Deployed {deployed} configurations[/green]")
         else:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
+            with create_progress() as progress:
                 task = progress.add_task(f"Deploying {name}...", total=None)
 
                 success = config_manager.deploy_config(name, force=force)
@@ -466,11 +544,7 @@ def sync(ctx, pull_only: bool, push_only: bool, message: Optional[str],
     config_manager, sync_manager, git_handler = initialize_managers(repo_path)
 
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with create_progress() as progress:
 
             if pull_only:
                 task = progress.add_task("Pulling changes...", total=None)
@@ -588,6 +662,7 @@ def clone(ctx, url: str, path: Optional[Path]):
         path = ctx.obj['repo_path']
 
     if path.exists():
+        from rich.prompt import Confirm
         if not Confirm.ask(f"Directory {path} already exists. Overwrite?"):
             console.print("Clone cancelled.")
             return
@@ -596,11 +671,7 @@ def clone(ctx, url: str, path: Optional[Path]):
         # Initialize with the URL to clone
         config_manager, sync_manager, git_handler = initialize_managers(path)
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with create_progress() as progress:
             task = progress.add_task("Cloning repository...", total=None)
 
             if sync_manager.clone_repository(url, path):
@@ -636,21 +707,13 @@ def update(ctx, name: Optional[str], update_all: bool):
 
     try:
         if update_all:
-            updated = 0
-            failed = 0
-
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
+            # Updates run in worker threads; keep spinner repaints from competing with them
+            with create_progress(refresh_per_second=4) as progress:
                 task = progress.add_task("Updating configurations...", total=None)
 
-                for config_name in config_manager._configs:
-                    if config_manager.update_config(config_name):
-                        updated += 1
-                    else:
-                        failed += 1
+                results = config_manager.update_configs(config_manager.configs_by_name())
+                updated = sum(results.values())
+                failed = len(results) - updated
 
                 progress.update(task, description=f"Updated {updated} configurations!")
 
@@ -658,11 +721,7 @@ def update(ctx, name: Optional[str], update_all: bool):
             if failed > 0:
                 console.print(f"[yellow]⚠ {failed} configurations failed to update[/yellow]")
         else:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
+            with create_progress() as progress:
                 task = progress.add_task(f"Updating {name}...", total=None)
 
                 if config_manager.update_config(name):
@@ -7,23 +7,51 @@ tracking, backup, restoration, and cross-platform handling.
 """
 
 import os
+import copy
 import shutil
 import hashlib
 import json
+import mmap
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from rich.console import Console
 import yaml
 import toml
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Union, Any, Tuple
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from enum import Enum
+from operator import attrgetter
 
-from superdots.utils.path import normalize_path
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from superdots.utils.path import clone_file, copy_tree, normalize_path, resolve_path
 
 from ..utils.logger import get_logger
 from ..utils.platform import platform_detector, OSType
 
+_BLAKE3_PREFIX = "blake3:"
+
+# Checksum caches hold machine-specific paths, inodes and mtimes, so they live
+# in the per-user cache directory rather than the synced repository
+_CHECKSUM_CACHE_DIR = platform_detector.get_config_dir('cache') / 'superdots'
+_entry_name = attrgetter('name')  # Sort key for os.DirEntry lists
+
 
 class ConfigType(Enum):
     """Configuration file types."""
@@ -43,6 +71,35 @@ class ConfigStatus(Enum):
     UNTRACKED = "untracked"
 
 
+# Value -> member lookups used when loading the index (cheaper than Enum calls)
+_OS_TYPES = {os_type.value: os_type for os_type in OSType}
+_CONFIG_TYPES = {config_type.value: config_type for config_type in ConfigType}
+_CONFIG_STATUSES = {status.value: status for status in ConfigStatus}
+
+
+def _expand_home(path: str, home: Path) -> Path:
+    """Expand a stored '~/...' path against a known home directory."""
+    if path[:2] in ('~/', '~' + os.sep):
+        # Joining onto home skips the per-call environment lookup of expanduser()
+        return home / path[2:]
+    return Path(path).expanduser()
+
+
+def _with_slots(cls):
+    """
+    Rebuild a dataclass with ``__slots__`` for its fields and any ``_slots``.
+
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    for name in field_names + ('__dict__', '__weakref__', '_slots'):
+        cls_dict.pop(name, None)
+    cls_dict['__slots__'] = field_names + cls._slots
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@_with_slots
 @dataclass
 class ConfigFile:
     """Represents a configuration file or directory."""
@@ -60,6 +117,7 @@ class ConfigFile:
     # Status information
     status: ConfigStatus
     checksum: Optional[str] = None
+    fingerprint: Optional[str] = None  # Size plus hash of the first/last 4KB
     backup_path: Optional[Path] = None
 
     # Metadata
@@ -73,8 +131,14 @@ class ConfigFile:
     executable: bool = False
     template_vars: Optional[Dict[str, Any]] = None
 
+    # Non-field slots backing the cached path properties and ISO timestamps
+    _slots = ('_platform_values', '_source_path_strs', '_created_at_iso', '_updated_at_iso')
+
     def __post_init__(self):
         """Post-initialization processing."""
+        self._clear_cached_paths()
+        self._created_at_iso: Optional[Tuple[datetime, str]] = None
+        self._updated_at_iso: Optional[Tuple[datetime, str]] = None
         if self.tags is None:
             self.tags = []
         if self.created_at is None:
@@ -84,49 +148,105 @@ class ConfigFile:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        data = asdict(self)
-        # Convert Path objects to strings
-        data['source_paths'] = {os_type.value: str(normalize_path(path, expanduser=False)) for os_type, path in self.source_paths.items()}
-        data['repo_path'] = str(normalize_path(self.repo_path, expanduser=False))
-        if self.backup_path:
-            data['backup_path'] = str(normalize_path(self.backup_path, expanduser=False))
-
-        # Convert enums to values
-        data['config_type'] = self.config_type.value
-        data['status'] = self.status.value
-        data['current_platform'] = self.current_platform.value
-        data['platforms'] = [p.value for p in self.platforms]
-
-        # Convert datetime to ISO string
-        if self.created_at:
-            data['created_at'] = self.created_at.isoformat()
-        if self.updated_at:
-            data['updated_at'] = self.updated_at.isoformat()
-
-        return data
+        # Resolve home once; normalize_path would otherwise look it up per path
+        home = platform_detector.home_dir
+        created_at, updated_at = self._iso_timestamps()
+        return {
+            'name': self.name,
+            'source_paths': {os_type.value: str(normalize_path(path, home, expanduser=False))
+                             for os_type, path in self.source_paths.items()},
+            'repo_path': str(normalize_path(self.repo_path, home, expanduser=False)),
+            'config_type': self.config_type.value,
+            'platforms': list(self.platform_values),
+            'current_platform': self.current_platform.value,
+            'status': self.status.value,
+            'checksum': self.checksum,
+            'fingerprint': self.fingerprint,
+            'backup_path': str(normalize_path(self.backup_path, home, expanduser=False)) if self.backup_path else None,
+            'description': self.description,
+            'tags': list(self.tags),
+            'created_at': created_at,
+            'updated_at': updated_at,
+            'use_symlink': self.use_symlink,
+            'executable': self.executable,
+            'template_vars': copy.deepcopy(self.template_vars),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ConfigFile':
         """Create instance from dictionary."""
         # Convert strings back to Path objects
-        data['source_paths'] = {OSType(os_type): Path(path).expanduser() for os_type, path in data['source_paths'].items()}
-        data['repo_path'] = Path(data['repo_path']).expanduser()
+        home = platform_detector.home_dir
+        data['source_paths'] = {_OS_TYPES[os_type]: _expand_home(path, home) for os_type, path in data['source_paths'].items()}
+        data['repo_path'] = _expand_home(data['repo_path'], home)
         if data.get('backup_path'):
-            data['backup_path'] = Path(data['backup_path']).expanduser()
+            data['backup_path'] = _expand_home(data['backup_path'], home)
 
         # Convert values back to enums
-        data['config_type'] = ConfigType(data['config_type'])
-        data['status'] = ConfigStatus(data['status'])
-        data['current_platform'] = OSType(data['current_platform'])
-        data['platforms'] = [OSType(p) for p in data['platforms']]
+        data['config_type'] = _CONFIG_TYPES[data['config_type']]
+        data['status'] = _CONFIG_STATUSES[data['status']]
+        data['current_platform'] = _OS_TYPES[data['current_platform']]
+        data['platforms'] = [_OS_TYPES[p] for p in data['platforms']]
 
         # Convert ISO strings back to datetime
-        if data.get('created_at'):
-            data['created_at'] = datetime.fromisoformat(data['created_at'])
-        if data.get('updated_at'):
-            data['updated_at'] = datetime.fromisoformat(data['updated_at'])
-
-        return cls(**data)
+        created_at_iso = data.get('created_at')
+        updated_at_iso = data.get('updated_at')
+        if created_at_iso:
+            data['created_at'] = datetime.fromisoformat(created_at_iso)
+        if updated_at_iso:
+            data['updated_at'] = datetime.fromisoformat(updated_at_iso)
+
+        config = cls(**data)
+
+        # Keep the loaded strings so unchanged timestamps are not reformatted
+        if created_at_iso:
+            config._created_at_iso = (config.created_at, created_at_iso)
+        if updated_at_iso:
+            config._updated_at_iso = (config.updated_at, updated_at_iso)
+        return config
+
+    def _iso_timestamps(self) -> Tuple[Optional[str], Optional[str]]:
+        """Get created_at/updated_at as ISO strings, formatting only values that changed."""
+        created = self._created_at_iso
+        if created is None or created[0] is not self.created_at:
+            created = (self.created_at, self.created_at.isoformat() if self.created_at else None)
+            self._created_at_iso = created
+
+        updated = self._updated_at_iso
+        if updated is None or updated[0] is not self.updated_at:
+            updated = (self.updated_at, self.updated_at.isoformat() if self.updated_at else None)
+            self._updated_at_iso = updated
+
+        return created[1], updated[1]
+
+    @property
+    def platform_values(self) -> Tuple[str, ...]:
+        """Get the platform names (enum values), cached until platforms change."""
+        # Keyed on the list itself and its length, so reassigning the field or
+        # adding/removing a platform in place both rebuild the names
+        platforms = self.platforms
+        cached = self._platform_values
+        if cached is None or cached[0] is not platforms or cached[1] != len(platforms):
+            cached = (platforms, len(platforms), tuple(p.value for p in platforms))
+            self._platform_values = cached
+        return cached[2]
+
+    @property
+    def source_path_strs(self) -> Dict[OSType, str]:
+        """Get source paths rendered as strings, cached until paths change."""
+        # Keyed like platform_values, so reassigning source_paths rebuilds them
+        source_paths = self.source_paths
+        cached = self._source_path_strs
+        if cached is None or cached[0] is not source_paths or cached[1] != len(source_paths):
+            cached = (source_paths, len(source_paths),
+                      {platform: str(path) for platform, path in source_paths.items()})
+            self._source_path_strs = cached
+        return cached[2]
+
+    def _clear_cached_paths(self):
+        """Drop cached values derived from source_paths and platforms."""
+        self._platform_values = None
+        self._source_path_strs = None
 
     def get_source_path(self, platform: Optional[OSType] = None) -> Optional[Path]:
         """Get source path for the specified platform."""
@@ -139,6 +259,7 @@ class ConfigFile:
         self.source_paths[platform] = path
         if platform not in self.platforms:
             self.platforms.append(platform)
+        self._clear_cached_paths()
 
     def remove_source_path(self, platform: OSType):
         """Remove source path for a platform."""
@@ -146,6 +267,7 @@ class ConfigFile:
             del self.source_paths[platform]
         if platform in self.platforms:
             self.platforms.remove(platform)
+        self._clear_cached_paths()
 
     def has_source_for_platform(self, platform: OSType) -> bool:
         """Check if configuration has a source path for the specified platform."""
@@ -171,7 +293,7 @@ class ConfigManager:
             repo_path: Path to the SuperDots repository
         """
         self.logger = get_logger(f"{__name__}.ConfigManager")
-        self.repo_path = Path(repo_path).resolve()
+        self.repo_path = resolve_path(repo_path)
         self.configs_dir = self.repo_path / 'configs'
         self.backups_dir = self.repo_path / 'backups'
         self.templates_dir = self.repo_path / 'templates'
@@ -179,6 +301,23 @@ class ConfigManager:
         # Configuration tracking
         self.config_index_file = self.repo_path / '.superdots' / 'config_index.json'
         self._configs: Dict[str, ConfigFile] = {}
+        self._lock = threading.RLock()  # Guards _configs and index writes
+        self._batch_depth = 0  # Index writes are deferred while > 0, see batch()
+        self._index_dirty = False
+        self._batch_time: Optional[datetime] = None  # Shared updated_at of the current batch()
+
+        # Serialized index entries reused across saves. Changes made here go
+        # through _mutate(), which drops the entry; configs handed out by the
+        # public getters may be edited in place, so they are never cached
+        self._serialized_cache: Dict[str, bytes] = {}
+        self._exposed_names: set = set()
+        self._all_exposed = False
+
+        # Checksums keyed by path, reused while (size, mtime_ns, inode) match
+        repo_key = hashlib.blake2b(str(self.repo_path).encode(), digest_size=8).hexdigest()
+        self.checksum_cache_file = _CHECKSUM_CACHE_DIR / f'checksums-{repo_key}.json'
+        self._checksum_cache: Dict[str, Tuple[int, int, int, str]] = {}
+        self._checksum_cache_dirty = False
 
         # Platform detection
         self.current_platform = platform_detector.os_type
@@ -187,6 +326,7 @@ class ConfigManager:
         self._setup_directories()
 
         # Load existing configurations
+        self._load_checksum_cache()
         self._load_config_index()
 
     def _setup_directories(self):
@@ -198,8 +338,17 @@ class ConfigManager:
             self.config_index_file.parent,
         ]
 
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        # Create the repository root once, then each missing level below it
+        # exactly once, shallowest first, so no mkdir has to walk its parents
+        self.repo_path.mkdir(parents=True, exist_ok=True)
+        pending = {
+            path
+            for directory in directories
+            for path in (directory, *directory.parents)
+            if self.repo_path in path.parents
+        }
+        for directory in sorted(pending, key=lambda path: len(path.parts)):
+            directory.mkdir(exist_ok=True)
 
         # Create platform-specific subdirectories
         # for platform in OSType:
@@ -207,6 +356,58 @@ class ConfigManager:
         #         platform_dir = self.configs_dir / platform.value
         #         platform_dir.mkdir(exist_ok=True)
 
+    @staticmethod
+    def _read_json(path: Path) -> Any:
+        """Read a JSON file, using orjson when it is installed."""
+        if HAS_ORJSON:
+            return orjson.loads(path.read_bytes())
+
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _dumps(data: Any, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+        if HAS_ORJSON:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+    @classmethod
+    def _write_json(cls, path: Path, data: Any, indent: bool = False):
+        """Write a JSON file, using orjson when it is installed."""
+        path.write_bytes(cls._dumps(data, indent))
+
+    def _write_index(self, f, header: Dict[str, Any], configs: Mapping[str, 'ConfigFile']):
+        """
+        Write the index as indented JSON, serializing one config at a time.
+
+        The output matches ``json.dump(..., indent=2)`` of the whole index, but
+        the combined dict of every serialized config is never built.
+        """
+        dumps = self._dumps
+        f.write(b'{\n')
+        for key, value in header.items():
+            f.write(b'  ' + dumps(key) + b': ' + dumps(value) + b',\n')
+
+        if not configs:
+            f.write(b'  "configs": {}\n}')
+            return
+
+        f.write(b'  "configs": {')
+        separator = b'\n    '
+        cache = self._serialized_cache
+        for name, config in configs.items():
+            # Reuse the previous serialization unless the config was changed
+            body = cache.get(name)
+            if body is None:
+                # Newlines only occur as formatting, so re-indent by replacing them
+                body = dumps(config.to_dict(), indent=True).replace(b'\n', b'\n    ')
+                if not (self._all_exposed or name in self._exposed_names):
+                    cache[name] = body
+            f.write(separator + dumps(name) + b': ' + body)
+            separator = b',\n    '
+        f.write(b'\n  }\n}')
+
     def _load_config_index(self):
         """Load configuration index from file."""
         if not self.config_index_file.exists():
@@ -214,10 +415,10 @@ class ConfigManager:
             return
 
         try:
-            with open(self.config_index_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_json(self.config_index_file)
 
             self._configs = {}
+            self._serialized_cache.clear()
             for name, config_data in data.get('configs', {}).items():
                 try:
                     self._configs[name] = ConfigFile.from_dict(config_data)
@@ -231,53 +432,333 @@ class ConfigManager:
             self._configs = {}
 
     def _save_config_index(self):
-        """Save configuration index to file."""
+        """Save configuration index to file, or defer it inside batch()."""
         try:
-            data = {
-                'version': '1.0',
-                'platform': self.current_platform.value,
-                'updated_at': datetime.now().isoformat(),
-                'configs': {name: config.to_dict() for name, config in self._configs.items()}
-            }
-
-            with open(self.config_index_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                if self._batch_depth:
+                    self._index_dirty = True
+                    return
+
+                header = {
+                    'version': '1.0',
+                    'platform': self.current_platform.value,
+                    'updated_at': datetime.now().isoformat(),
+                }
+
+                # Write beside the index and swap it in, so readers never see
+                # a partially written file
+                tmp_file = self.config_index_file.with_name(self.config_index_file.name + '.tmp')
+                with open(tmp_file, 'wb') as f:
+                    self._write_index(f, header, self._configs)
+                os.replace(tmp_file, self.config_index_file)
+                self._index_dirty = False
+
+                self._save_checksum_cache()
 
             self.logger.debug("Saved configuration index")
 
         except Exception as e:
             self.logger.error(f"Failed to save config index: {e}")
 
-    def _calculate_checksum(self, file_path: Path) -> str:
-        """Calculate MD5 checksum of a file."""
+    @contextmanager
+    def batch(self):
+        """
+        Group several changes into a single index write.
+
+        Index saves requested inside the block are deferred until the
+        outermost ``batch()`` exits, even if the block raises. Changes made
+        in the block share one ``updated_at`` timestamp. Batches are shared
+        by all threads using this manager.
+
+        Example:
+            with manager.batch():
+                for platform, path in paths.items():
+                    manager.add_platform_path(name, platform, path)
+        """
+        with self._lock:
+            if not self._batch_depth:
+                self._batch_time = datetime.now()
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._batch_time = None
+                    if self._index_dirty:
+                        self._save_config_index()
+
+    def _now(self) -> datetime:
+        """Get the timestamp for a change, shared by all changes in a batch()."""
+        return self._batch_time or datetime.now()
+
+    def flush(self):
+        """Write any deferred index changes now, even inside batch()."""
+        with self._lock:
+            depth, self._batch_depth = self._batch_depth, 0
+            try:
+                if self._index_dirty:
+                    self._save_config_index()
+            finally:
+                self._batch_depth = depth
+
+    def _load_checksum_cache(self):
+        """Load cached checksums from file, starting empty if it is unreadable."""
+        if not self.checksum_cache_file.exists():
+            return
+
+        try:
+            data = self._read_json(self.checksum_cache_file)
+            self._checksum_cache = {path: tuple(entry) for path, entry in data.items()}
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable checksum cache: {e}")
+            self._checksum_cache = {}
+
+    def _save_checksum_cache(self):
+        """Write cached checksums to file if any were added since the last save."""
+        if not self._checksum_cache_dirty:
+            return
+
+        try:
+            self.checksum_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self._write_json(self.checksum_cache_file, self._checksum_cache)
+            self._checksum_cache_dirty = False
+        except Exception as e:
+            self.logger.warning(f"Failed to save checksum cache: {e}")
+
+    def _checksum_key(self, path: Path) -> Tuple[int, int, int]:
+        """
+        Build the (size, mtime_ns, inode) cache key for a path.
+
+        Directories use the total size of their files and the newest mtime of
+        any entry, so adding, removing or editing files changes the key.
+        """
+        st = path.stat()
+        if not path.is_dir():
+            return st.st_size, st.st_mtime_ns, st.st_ino
+
+        total_size = 0
+        newest = st.st_mtime_ns
+        for root, dirs, files in os.walk(path):
+            for name in dirs:
+                newest = max(newest, os.lstat(os.path.join(root, name)).st_mtime_ns)
+            for name in files:
+                entry_stat = os.lstat(os.path.join(root, name))
+                newest = max(newest, entry_stat.st_mtime_ns)
+                total_size += entry_stat.st_size
+        return total_size, newest, st.st_ino
+
+    def _cached_checksum(self, path: Path) -> str:
+        """
+        Calculate a checksum with the default algorithm, reusing cached results.
+
+        Args:
+            path: File or directory to hash
+
+        Returns:
+            Checksum string, or an empty string if the path does not exist
+        """
+        try:
+            key = self._checksum_key(path)
+        except OSError:
+            return self._calculate_checksum(path)
+
+        cache_key = str(path)
+        cached = self._checksum_cache.get(cache_key)
+        if cached and cached[:3] == key and cached[3].startswith(_BLAKE3_PREFIX) == HAS_BLAKE3:
+            return cached[3]
+
+        checksum = self._calculate_checksum(path)
+
+        # Entries modified within the last couple of seconds could change again
+        # without a visible mtime change, so only cache settled content
+        if checksum and time.time_ns() - key[1] > 2_000_000_000:
+            with self._lock:
+                self._checksum_cache[cache_key] = (*key, checksum)
+                self._checksum_cache_dirty = True
+
+        return checksum
+
+    def _calculate_checksum(self, file_path: Path, algorithm: Optional[str] = None) -> str:
+        """
+        Calculate the content checksum of a file or directory.
+
+        BLAKE3 digests carry a ``blake3:`` prefix; MD5 digests are unprefixed
+        so indexes written by older releases keep comparing equal.
+
+        Args:
+            file_path: File or directory to hash
+            algorithm: 'blake3' or 'md5'; defaults to BLAKE3 when installed
+
+        Returns:
+            Checksum string, or an empty string if the path does not exist
+        """
         if not file_path.exists():
             return ""
 
+        if algorithm is None:
+            algorithm = 'blake3' if HAS_BLAKE3 else 'md5'
+
+        if algorithm == 'blake3':
+            return _BLAKE3_PREFIX + self._calculate_blake3(file_path)
+
         hash_md5 = hashlib.md5()
 
         if file_path.is_file():
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
+            self._update_hash_from_file(hash_md5, file_path)
         elif file_path.is_dir():
             # For directories, hash the structure and file checksums
-            for root, dirs, files in os.walk(file_path):
-                # Sort to ensure consistent ordering
-                dirs.sort()
-                files.sort()
-
-                for name in files:
-                    file_path_obj = Path(root) / name
-                    rel_path = file_path_obj.relative_to(file_path)
-                    hash_md5.update(str(rel_path).encode())
+            for rel_path, path, is_file in self._iter_tree_files(file_path):
+                hash_md5.update(rel_path.encode())
 
-                    if file_path_obj.is_file():
-                        with open(file_path_obj, 'rb') as f:
-                            for chunk in iter(lambda: f.read(4096), b""):
-                                hash_md5.update(chunk)
+                if is_file:
+                    self._update_hash_from_file(hash_md5, path)
 
         return hash_md5.hexdigest()
 
+    @staticmethod
+    def _update_hash_from_file(hasher: Any, path: Path) -> None:
+        """Feed a file into a hashlib object, mapping it instead of reading in chunks."""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        hasher.update(mapped)
+                    return
+                except (OSError, ValueError):
+                    # Not mappable (special files, some network filesystems)
+                    pass
+
+            for chunk in iter(lambda: f.read(4096), b""):
+                hasher.update(chunk)
+
+    def _calculate_blake3(self, file_path: Path) -> str:
+        """Hash a file or directory tree with BLAKE3, mapping file contents."""
+        if file_path.is_file():
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(file_path)
+            return hasher.hexdigest()
+
+        # Directories combine each relative path with that file's digest
+        entries = list(self._iter_tree_files(file_path))
+
+        hasher = blake3.blake3()
+        if not entries:
+            return hasher.hexdigest()
+
+        # Hash files concurrently; digests are combined in walk order
+        workers = min(32, (os.cpu_count() or 1) * 4, len(entries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            digests = executor.map(self._blake3_file_digest, [path if is_file else None for _, path, is_file in entries])
+            for (rel_path, _, _), digest in zip(entries, digests):
+                hasher.update(rel_path.encode())
+                if digest:
+                    hasher.update(digest)
+
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _blake3_file_digest(path: Optional[str]) -> bytes:
+        """Return the BLAKE3 digest of a file, or empty bytes for non-files."""
+        if path is None:
+            return b""
+        return blake3.blake3().update_mmap(path).digest()
+
+    @classmethod
+    def _iter_tree_files(cls, root: Path, prefix: str = "") -> Iterator[Tuple[str, str, bool]]:
+        """
+        Yield the non-directory entries of a tree in checksum order.
+
+        Each directory yields its files sorted by name, then descends into its
+        sorted subdirectories (symlinked directories are not followed), which
+        is the order ``os.walk`` produced with sorted names. File types come
+        from the scandir entries, so no extra stat() is needed per file.
+
+        Args:
+            root: Directory to walk
+            prefix: Relative path of ``root`` within the tree being hashed
+
+        Yields:
+            (relative path, absolute path, whether it is a regular file)
+        """
+        files = []
+        dirs = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if not entry.is_symlink():
+                            dirs.append(entry)
+                    else:
+                        files.append(entry)
+        except OSError:
+            return
+
+        for entry in sorted(files, key=_entry_name):
+            try:
+                is_file = entry.is_file()
+            except OSError:
+                is_file = False
+            yield prefix + entry.name, entry.path, is_file
+
+        for entry in sorted(dirs, key=_entry_name):
+            yield from cls._iter_tree_files(entry.path, prefix + entry.name + os.sep)
+
+    def _matches_checksum(self, file_path: Path, checksum: Optional[str]) -> bool:
+        """Check a path against a stored checksum using the algorithm it was made with."""
+        if not checksum:
+            return False
+
+        if checksum.startswith(_BLAKE3_PREFIX):
+            # Without blake3 the stored digest cannot be verified
+            return HAS_BLAKE3 and self._cached_checksum(file_path) == checksum
+
+        if not HAS_BLAKE3:
+            return self._cached_checksum(file_path) == checksum
+        return self._calculate_checksum(file_path, 'md5') == checksum
+
+    def _calculate_fingerprint(self, file_path: Path) -> Optional[str]:
+        """
+        Calculate a cheap identity for a file from its size and edges.
+
+        Only the first and last 4KB are hashed, so equal fingerprints do not
+        prove equal content; use it to rule out changes before a full checksum.
+        """
+        if not file_path.is_file():
+            return None
+
+        size = file_path.stat().st_size
+        digest = hashlib.blake2b(digest_size=8)
+        with open(file_path, 'rb') as f:
+            digest.update(f.read(4096))
+            if size > 4096:
+                f.seek(max(size - 4096, 4096))
+                digest.update(f.read(4096))
+
+        return f"{size}:{digest.hexdigest()}"
+
+    def _is_unchanged(self, config: ConfigFile, source_path: Path) -> bool:
+        """Check whether the repository copy of a config already matches its source."""
+        if not config.checksum or not config.repo_path.exists():
+            return False
+
+        if source_path.is_file():
+            if not config.repo_path.is_file():
+                return False
+            if source_path.stat().st_size != config.repo_path.stat().st_size:
+                return False
+
+            stored = config.fingerprint or self._calculate_fingerprint(config.repo_path)
+            if self._calculate_fingerprint(source_path) != stored:
+                return False
+
+        return self._matches_checksum(source_path, config.checksum)
+
     def _detect_config_type(self, path: Path) -> ConfigType:
         """Detect the type of configuration based on path and content."""
         if path.is_dir():
@@ -294,12 +775,14 @@ class ConfigManager:
         if os.access(path, os.X_OK):
             return ConfigType.BINARY
 
-        # Check for template patterns
+        # Check for template patterns; markers are expected near the top, so
+        # only the first 64KB is scanned rather than decoding the whole file
         try:
-            content = path.read_text(encoding='utf-8', errors='ignore')
-            if '{{' in content and '}}' in content:
+            with open(path, 'rb') as f:
+                head = f.read(65536)
+            if b'{{' in head and b'}}' in head:
                 return ConfigType.TEMPLATE
-        except:
+        except OSError:
             pass
 
         return ConfigType.DOTFILE
@@ -334,7 +817,8 @@ class ConfigManager:
         description: Optional[str] = None,
         tags: Optional[List[str]] = None,
         use_symlink: bool = True,
-        force: bool = False
+        force: bool = False,
+        skip_if_unchanged: bool = False
     ) -> bool:
         """
         Add a configuration file or directory to management.
@@ -348,6 +832,8 @@ class ConfigManager:
             platforms: Target platforms (auto-detected from source_paths if not provided)
             use_symlink: Whether to use symlinks for deployment
             force: Whether to overwrite existing configurations
+            skip_if_unchanged: Treat re-adding an existing configuration whose
+                               repository copy matches the source as a no-op
 
         Returns:
             True if successful, False otherwise
@@ -365,6 +851,14 @@ class ConfigManager:
             if not name:
                 name = source_paths[self.current_platform].name
 
+            # Nothing to do if the managed copy already matches the source
+            if skip_if_unchanged and name in self._configs:
+                current_path = source_paths.get(self.current_platform)
+                source = current_path if current_path and current_path.exists() else next(iter(existing_paths.values()))
+                if self._is_unchanged(self._configs[name], source):
+                    self.logger.debug(f"Configuration '{name}' is unchanged, skipping")
+                    return True
+
             # Check if already managed
             if name in self._configs and not force:
                 self.logger.error(f"Configuration '{name}' already exists. Use --force to overwrite.")
@@ -407,11 +901,14 @@ class ConfigManager:
             source_for_repo = current_path if current_path and current_path.exists() else first_existing_path
             if self._copy_to_repo(source_for_repo, repo_path):
                 config.checksum = self._calculate_checksum(repo_path)
+                config.fingerprint = self._calculate_fingerprint(repo_path)
                 config.status = ConfigStatus.TRACKED
 
                 # Add to tracking
-                self._configs[name] = config
-                self._save_config_index()
+                with self._lock:
+                    self._configs[name] = config
+                    self._serialized_cache.pop(name, None)
+                    self._save_config_index()
 
                 self.logger.info(f"Added configuration '{name}' ({config_type.value})")
                 return True
@@ -435,12 +932,11 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
-            if name not in self._configs:
+            config = self._configs.get(name)
+            if config is None:
                 self.logger.error(f"Configuration '{name}' not found")
                 return False
 
-            config = self._configs[name]
-
             # Remove from repository if requested
             if not keep_files and config.repo_path.exists():
                 if config.repo_path.is_file():
@@ -449,8 +945,10 @@ class ConfigManager:
                     shutil.rmtree(config.repo_path)
 
             # Remove from tracking
-            del self._configs[name]
-            self._save_config_index()
+            with self._lock:
+                del self._configs[name]
+                self._serialized_cache.pop(name, None)
+                self._save_config_index()
 
             self.logger.info(f"Removed configuration '{name}'")
             return True
@@ -469,7 +967,7 @@ class ConfigManager:
             if source_path.is_file():
                 shutil.copy2(source_path, backup_path)
             elif source_path.is_dir():
-                shutil.copytree(source_path, backup_path)
+                copy_tree(source_path, backup_path)
 
             self.logger.debug(f"Created backup: {backup_path}")
             return backup_path
@@ -490,9 +988,11 @@ class ConfigManager:
                     shutil.rmtree(repo_path)
 
             if source_path.is_file():
-                shutil.copy2(source_path, repo_path)
+                # The repository copy needs content and mode, not timestamps
+                if not clone_file(source_path, repo_path):
+                    shutil.copy(source_path, repo_path)
             elif source_path.is_dir():
-                shutil.copytree(source_path, repo_path)
+                copy_tree(source_path, repo_path)
 
             return True
 
@@ -511,13 +1011,69 @@ class ConfigManager:
         Returns:
             True if successful, False otherwise
         """
+        success = self._deploy_config(name, force=force)
+        if success:
+            self._save_config_index()
+        return success
+
+    def deploy_configs(self, names: Iterable[str], force: bool = False) -> Dict[str, bool]:
+        """
+        Deploy several configurations in one pass.
+
+        Target directories are listed once up front and the configuration
+        index is saved once at the end, instead of once per configuration.
+
+        Args:
+            names: Names of the configurations to deploy
+            force: Whether to overwrite existing files
+
+        Returns:
+            Dictionary mapping each configuration name to its deploy result
+        """
+        names = list(names)
+        targets = [
+            self._configs[name].get_source_path(self.current_platform)
+            for name in names if name in self._configs
+        ]
+        entries = self._scan_parent_dirs(path for path in targets if path)
+
+        results = {name: self._deploy_config(name, force=force, entries=entries) for name in names}
+
+        if any(results.values()):
+            self._save_config_index()
+        return results
+
+    def _scan_parent_dirs(self, paths: Iterable[Path]) -> Dict[Path, set]:
+        """
+        List each distinct parent directory once, mapping it to its entry names.
+
+        Broken symlinks are left out, so a name is listed exactly when
+        ``Path.exists()`` would report it.
+        """
+        entries: Dict[Path, set] = {}
+        for path in paths:
+            parent = path.parent
+            if parent in entries:
+                continue
+            try:
+                with os.scandir(parent) as it:
+                    entries[parent] = {
+                        entry.name for entry in it
+                        if not entry.is_symlink() or os.path.exists(entry.path)
+                    }
+            except OSError:
+                entries[parent] = set()
+        return entries
+
+    def _deploy_config(self, name: str, force: bool = False,
+                       entries: Optional[Dict[Path, set]] = None) -> bool:
+        """Deploy a configuration without saving the index."""
         try:
-            if name not in self._configs:
+            config = self._configs.get(name)
+            if config is None:
                 self.logger.error(f"Configuration '{name}' not found")
                 return False
 
-            config = self._configs[name]
-
             # Check if current platform is supported
             if self.current_platform not in config.platforms:
                 self.logger.warning(
@@ -532,7 +1088,12 @@ class ConfigManager:
                 return False
 
             # Check if source exists
-            if source_path.exists() and not force:
+            if entries is not None and source_path.parent in entries:
+                target_exists = source_path.name in entries[source_path.parent]
+            else:
+                target_exists = source_path.exists()
+
+            if target_exists and not force:
                 self.logger.warning(
                     f"Target already exists: {source_path}. Use --force to overwrite."
                 )
@@ -553,7 +1114,7 @@ class ConfigManager:
                     shutil.copy2(config.repo_path, source_path)
                     success = True
                 elif config.repo_path.is_dir():
-                    if source_path.exists():
+                    if target_exists:
                         shutil.rmtree(source_path)
                     shutil.copytree(config.repo_path, source_path)
                     success = True
@@ -563,9 +1124,7 @@ class ConfigManager:
                 os.chmod(source_path, 0o755)
 
             if success:
-                config.status = ConfigStatus.TRACKED
-                config.updated_at = datetime.now()
-                self._save_config_index()
+                self._mutate(name, status=ConfigStatus.TRACKED, updated_at=self._now())
                 self.logger.info(f"Deployed configuration '{name}'")
 
             return success
@@ -588,11 +1147,8 @@ class ConfigManager:
         if platform is None:
             platform = self.current_platform
 
-        deployed = 0
-        for name, config in self._configs.items():
-            if platform in config.platforms:
-                if self.deploy_config(name, force=force):
-                    deployed += 1
+        names = [name for name, config in self._configs.items() if platform in config.platforms]
+        deployed = sum(self.deploy_configs(names, force=force).values())
 
         self.logger.info(f"Deployed {deployed}/{len(self._configs)} configurations")
         return deployed
@@ -607,30 +1163,69 @@ class ConfigManager:
         Returns:
             True if successful, False otherwise
         """
+        success, changed = self._update_config(name)
+        if changed:
+            self._save_config_index()
+        return success
+
+    def update_configs(self, names: Iterable[str], max_workers: Optional[int] = None) -> Dict[str, bool]:
+        """
+        Update several configurations from their source locations.
+
+        Configurations are checksummed and copied in parallel worker threads,
+        since each update is independent and I/O bound. The configuration
+        index is saved once at the end instead of once per configuration.
+
+        Args:
+            names: Names of the configurations to update
+            max_workers: Number of worker threads (defaults to min(8, CPU count))
+
+        Returns:
+            Dictionary mapping each configuration name to its update result
+        """
+        names = list(dict.fromkeys(names))
+        if max_workers is None:
+            max_workers = min(8, os.cpu_count() or 1)
+
+        if max_workers > 1 and len(names) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(self._update_config, names))
+        else:
+            outcomes = [self._update_config(name) for name in names]
+
+        results = {}
+        any_changed = False
+        for name, (success, changed) in zip(names, outcomes):
+            results[name] = success
+            any_changed = any_changed or changed
+
+        if any_changed:
+            self._save_config_index()
+        return results
+
+    def _update_config(self, name: str) -> Tuple[bool, bool]:
+        """Update a configuration without saving the index; returns (success, changed)."""
         try:
-            if name not in self._configs:
+            config = self._configs.get(name)
+            if config is None:
                 self.logger.error(f"Configuration '{name}' not found")
-                return False
-
-            config = self._configs[name]
+                return False, False
 
             # Get source path for current platform
             source_path = config.get_source_path(self.current_platform)
             if not source_path:
                 self.logger.error(f"No source path defined for {self.current_platform.value}")
-                return False
+                return False, False
 
             if not source_path.exists():
                 self.logger.error(f"Source path does not exist: {source_path}")
-                config.status = ConfigStatus.MISSING
-                self._save_config_index()
-                return False
+                self._mutate(name, status=ConfigStatus.MISSING)
+                return False, True
 
             # Check if file has changed
-            current_checksum = self._calculate_checksum(source_path)
-            if current_checksum == config.checksum:
+            if self._matches_checksum(source_path, config.checksum):
                 self.logger.debug(f"Configuration '{name}' is up to date")
-                return True
+                return True, False
 
             # Create backup of current repo version
             if config.repo_path.exists():
@@ -638,19 +1233,22 @@ class ConfigManager:
 
             # Copy updated version to repository
             if self._copy_to_repo(source_path, config.repo_path):
-                config.checksum = current_checksum
-                config.status = ConfigStatus.TRACKED
-                config.updated_at = datetime.now()
-                self._save_config_index()
+                self._mutate(
+                    name,
+                    checksum=self._calculate_checksum(config.repo_path),
+                    fingerprint=self._calculate_fingerprint(config.repo_path),
+                    status=ConfigStatus.TRACKED,
+                    updated_at=self._now(),
+                )
 
                 self.logger.info(f"Updated configuration '{name}'")
-                return True
+                return True, True
 
-            return False
+            return False, False
 
         except Exception as e:
             self.logger.error(f"Failed to update configuration '{name}': {e}")
-            return False
+            return False, False
 
     def list_configs(
         self,
@@ -683,11 +1281,37 @@ class ConfigManager:
         if status:
             configs = [c for c in configs if c.status == status]
 
-        return sorted(configs, key=lambda c: c.name)
+        configs = sorted(configs, key=lambda c: c.name)
+        self._expose(c.name for c in configs)
+        return configs
 
     def get_config(self, name: str) -> Optional[ConfigFile]:
         """Get a configuration by name."""
-        return self._configs.get(name)
+        config = self._configs.get(name)
+        if config is not None:
+            self._expose((name,))
+        return config
+
+    def configs_by_name(self) -> Mapping[str, ConfigFile]:
+        """Get a read-only, always current view of configurations keyed by name."""
+        with self._lock:
+            self._all_exposed = True
+            self._serialized_cache.clear()
+        return MappingProxyType(self._configs)
+
+    def _expose(self, names: Iterable[str]):
+        """Stop caching the index entries of configs handed out to callers."""
+        with self._lock:
+            for name in names:
+                self._exposed_names.add(name)
+                self._serialized_cache.pop(name, None)
+
+    def _mutate(self, name: str, **changes: Any):
+        """Set fields on a tracked configuration and drop its cached index entry."""
+        config = self._configs[name]
+        for field_name, value in changes.items():
+            setattr(config, field_name, value)
+        self._serialized_cache.pop(name, None)
 
     def check_status(self) -> Dict[str, List[str]]:
         """
@@ -703,43 +1327,59 @@ class ConfigManager:
             'conflicted': [],
             'untracked': [],
         }
+        current_platform = self.current_platform
+        changed = False
+
+        # The same path can be checked more than once below (and shared between
+        # configs), so remember existence for the duration of this check
+        exists_cache: Dict[Path, bool] = {}
+
+        def exists(path: Path) -> bool:
+            if path not in exists_cache:
+                exists_cache[path] = path.exists()
+            return exists_cache[path]
 
         for name, config in self._configs.items():
             # Get source path for current platform
-            source_path = config.get_source_path(self.current_platform)
+            source_path = config.get_source_path(current_platform)
 
             # Check if source exists for current platform
-            if not source_path or not source_path.exists():
+            if not source_path or not exists(source_path):
                 # Check if any platform has an existing source
-                has_existing_source = any(path.exists() for path in config.source_paths.values())
-                if has_existing_source:
+                if any(exists(path) for path in config.source_paths.values()):
                     # Has sources on other platforms but not current
-                    config.status = ConfigStatus.TRACKED
-                    status_map['tracked'].append(name)
+                    status = ConfigStatus.TRACKED
                 else:
                     # No sources exist anywhere
-                    config.status = ConfigStatus.MISSING
-                    status_map['missing'].append(name)
-                continue
+                    status = ConfigStatus.MISSING
 
             # Check if repo version exists
-            if not config.repo_path.exists():
-                config.status = ConfigStatus.UNTRACKED
-                status_map['untracked'].append(name)
-                continue
+            elif not exists(config.repo_path):
+                status = ConfigStatus.UNTRACKED
+
+            # Files of different sizes differ without hashing either one
+            elif (source_path.is_file() and config.repo_path.is_file()
+                  and source_path.stat().st_size != config.repo_path.stat().st_size):
+                status = ConfigStatus.MODIFIED
 
             # Check for modifications
-            source_checksum = self._calculate_checksum(source_path)
-            repo_checksum = self._calculate_checksum(config.repo_path)
+            elif self._cached_checksum(source_path) != self._cached_checksum(config.repo_path):
+                status = ConfigStatus.MODIFIED
+            else:
+                status = ConfigStatus.TRACKED
+
+            if config.status != status:
+                self._mutate(name, status=status)
+                changed = True
+            status_map[status.value].append(name)
 
-            if source_checksum != repo_checksum:
-                config.status = ConfigStatus.MODIFIED
-                status_map['modified'].append(name)
+        # Only rewrite the index when a status actually changed
+        with self._lock:
+            if changed:
+                self._save_config_index()
             else:
-                config.status = ConfigStatus.TRACKED
-                status_map['tracked'].append(name)
+                self._save_checksum_cache()
 
-        self._save_config_index()
         return status_map
 
     def restore_config(self, name: str, from_backup: bool = False) -> bool:
@@ -754,12 +1394,11 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
-            if name not in self._configs:
+            config = self._configs.get(name)
+            if config is None:
                 self.logger.error(f"Configuration '{name}' not found")
                 return False
 
-            config = self._configs[name]
-
             # Get source path for current platform
             source_path = config.get_source_path(self.current_platform)
             if not source_path:
@@ -796,8 +1435,7 @@ class ConfigManager:
             if config.executable and source_path.is_file():
                 os.chmod(source_path, 0o755)
 
-            config.status = ConfigStatus.TRACKED
-            config.updated_at = datetime.now()
+            self._mutate(name, status=ConfigStatus.TRACKED, updated_at=self._now())
             self._save_config_index()
 
             self.logger.info(f"Restored configuration '{name}' from {'backup' if from_backup else 'repository'}")
@@ -809,35 +1447,16 @@ class ConfigManager:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about managed configurations."""
-        stats = {
+        configs = self._configs.values()
+
+        return {
             'total_configs': len(self._configs),
-            'by_type': {},
-            'by_platform': {},
-            'by_status': {},
-            'last_updated': None,
+            'by_type': dict(Counter(config.config_type.value for config in configs)),
+            'by_platform': dict(Counter(value for config in configs for value in config.platform_values)),
+            'by_status': dict(Counter(config.status.value for config in configs)),
+            'last_updated': max((config.updated_at for config in configs if config.updated_at), default=None),
         }
 
-        for config in self._configs.values():
-            # Count by type
-            type_name = config.config_type.value
-            stats['by_type'][type_name] = stats['by_type'].get(type_name, 0) + 1
-
-            # Count by platform
-            for platform in config.platforms:
-                platform_name = platform.value
-                stats['by_platform'][platform_name] = stats['by_platform'].get(platform_name, 0) + 1
-
-            # Count by status
-            status_name = config.status.value
-            stats['by_status'][status_name] = stats['by_status'].get(status_name, 0) + 1
-
-            # Track latest update
-            if config.updated_at:
-                if not stats['last_updated'] or config.updated_at > stats['last_updated']:
-                    stats['last_updated'] = config.updated_at
-
-        return stats
-
     def add_platform_path(
         self,
         name: str,
@@ -858,12 +1477,12 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
-            if name not in self._configs:
+            config = self._configs.get(name)
+            if config is None:
                 self.logger.error(f"Configuration '{name}' not found")
                 return False
 
-            config = self._configs[name]
-            path = Path(source_path).expanduser().resolve()
+            path = resolve_path(Path(source_path).expanduser())
 
             # Check if platform already has a path
             if platform in config.source_paths and not force:
@@ -877,7 +1496,7 @@ class ConfigManager:
 
             # Add the path
             config.add_source_path(platform, path)
-            config.updated_at = datetime.now()
+            self._mutate(name, updated_at=self._now())
             self._save_config_index()
 
             self.logger.info(f"Added {platform.value} path for configuration '{name}': {path}")
@@ -899,19 +1518,18 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
-            if name not in self._configs:
+            config = self._configs.get(name)
+            if config is None:
                 self.logger.error(f"Configuration '{name}' not found")
                 return False
 
-            config = self._configs[name]
-
             if platform not in config.source_paths:
                 self.logger.error(f"Configuration '{name}' has no path for {platform.value}")
                 return False
 
             # Remove the path
             config.remove_source_path(platform)
-            config.updated_at = datetime.now()
+            self._mutate(name, updated_at=self._now())
             self._save_config_index()
 
             self.logger.info(f"Removed {platform.value} path for configuration '{name}'")
@@ -931,11 +1549,18 @@ class ConfigManager:
         Returns:
             Dictionary mapping platform to (path, exists) tuple
         """
-        if name not in self._configs:
+        config = self._configs.get(name)
+        if config is None:
             return {}
 
-        config = self._configs[name]
+        source_paths = config.source_paths
+
+        # Paths sharing a parent are checked with one directory listing; a
+        # lone path is cheaper to stat than to list its (often large) parent
+        parents = Counter(path.parent for path in source_paths.values())
+        entries = self._scan_parent_dirs(path for path in source_paths.values() if parents[path.parent] > 1)
+
         return {
-            platform: (path, path.exists())
-            for platform, path in config.source_paths.items()
+            platform: (path, path.name in entries[path.parent] if path.parent in entries else path.exists())
+            for platform, path in source_paths.items()
         }
@@ -9,8 +9,12 @@ and synchronizing dotfiles and configuration files across different systems.
 import os
 import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple, Union
+from typing import Any, Callable, Iterator, Optional, List, Dict, Tuple, Union
 from urllib.parse import urlparse
 
 try:
@@ -23,17 +27,138 @@ except ImportError:
     Repo = Remote = InvalidGitRepositoryError = GitCommandError = None
 
 from ..utils.logger import get_logger
+from ..utils.path import resolve_path
 from ..utils.platform import platform_detector
 
 
+# Contents of the files created in a new repository, stored encoded so
+# they are written as-is
+_README_BYTES = b"""# SuperDots Configuration Repository
+
+This repository contains dotfiles and configuration files managed by SuperDots.
+
+## Structure
+
+- `configs/`: Configuration files organized by category
+- `scripts/`: Installation and setup scripts
+- `templates/`: Configuration templates
+- `backups/`: Backup copies of original files
+
+## Usage
+
+Use the `superdots` command-line tool to manage configurations:
+
+```bash
+# Initialize or sync configurations
+superdots sync
+
+# Add new configuration
+superdots add ~/.vimrc
+
+# List managed configurations
+superdots list
+
+# Deploy configurations
+superdots deploy
+```
+
+## Platform Support
+
+This repository supports synchronization across:
+- Linux
+- macOS
+- Windows
+
+Platform-specific configurations are automatically handled.
+"""
+
+_GITIGNORE_BYTES = b"""# SuperDots gitignore
+
+# Temporary files
+*.tmp
+*.temp
+*~
+.DS_Store
+Thumbs.db
+
+# Logs
+*.log
+logs/
+
+# Cache files
+.cache/
+__pycache__/
+*.pyc
+*.pyo
+
+# Editor files
+.vscode/
+.idea/
+*.swp
+*.swo
+
+# OS specific
+.Trash-*/
+ehthumbs.db
+
+# Sensitive files (customize as needed)
+# **/secrets.*
+# **/*_secret*
+# **/*.key
+# **/*.pem
+"""
+
+
 class GitError(Exception):
     """Custom exception for Git-related errors."""
     pass
 
 
+# Errors expected from a missing or broken repository or git executable;
+# queries answer a default for these and let anything else propagate
+_QUERY_ERRORS: Tuple[type, ...] = (GitError, OSError)
+if HAS_GITPYTHON:
+    _QUERY_ERRORS += (GitCommandError, InvalidGitRepositoryError)
+
+
+def _cached_query(ttl: float = 0.5) -> Callable:
+    """
+    Cache a read-only query on a GitHandler for ``ttl`` seconds.
+
+    Results are keyed by method name and arguments and are dropped early by
+    any method decorated with :func:`_invalidates_cache`.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, *args):
+            key = (func.__name__, args)
+            now = time.monotonic()
+            entry = self._cache.get(key)
+            if entry is not None and now - entry[0] < ttl:
+                return entry[1]
+            value = func(self, *args)
+            self._cache[key] = (now, value)
+            return value
+        return wrapper
+    return decorator
+
+
+def _invalidates_cache(func: Callable) -> Callable:
+    """Clear a GitHandler's query cache after a method that changes the repository."""
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._cache.clear()
+    return wrapper
+
+
 class GitHandler:
     """Handles Git repository operations for SuperDots."""
 
+    __slots__ = ('logger', 'repo_path', 'remote_url', 'repo', '_git_proc', '_git_proc_lock', '_cache')
+
     def __init__(self, repo_path: Union[str, Path], remote_url: Optional[str] = None):
         """
         Initialize Git handler.
@@ -43,10 +168,18 @@ class GitHandler:
             remote_url: Optional remote repository URL
         """
         self.logger = get_logger(f"{__name__}.GitHandler")
-        self.repo_path = Path(repo_path).resolve()
+        self.repo_path = resolve_path(repo_path)
         self.remote_url = remote_url
         self.repo: Optional[Repo] = None
 
+        # Persistent 'git cat-file --batch-check' used for read-only lookups
+        # when GitPython is unavailable (GitPython keeps its own)
+        self._git_proc: Optional[subprocess.Popen] = None
+        self._git_proc_lock = threading.Lock()
+
+        # Short-lived results of read-only queries, see _cached_query
+        self._cache: Dict[Tuple[str, tuple], Tuple[float, Any]] = {}
+
         if not HAS_GITPYTHON:
             self.logger.warning("GitPython not available, falling back to subprocess")
 
@@ -101,106 +234,37 @@ class GitHandler:
             dir_path.mkdir(exist_ok=True)
 
             # Create .gitkeep files to ensure directories are tracked
-            gitkeep = dir_path / '.gitkeep'
-            if not gitkeep.exists():
-                gitkeep.touch()
-
-        # Create README if it doesn't exist
-        readme_path = self.repo_path / 'README.md'
-        if not readme_path.exists():
-            readme_content = self._generate_readme()
-            readme_path.write_text(readme_content, encoding='utf-8')
-
-        # Create .gitignore if it doesn't exist
-        gitignore_path = self.repo_path / '.gitignore'
-        if not gitignore_path.exists():
-            gitignore_content = self._generate_gitignore()
-            gitignore_path.write_text(gitignore_content, encoding='utf-8')
+            self._create_if_missing(dir_path / '.gitkeep', b'')
+
+        # Create README and .gitignore if they don't exist
+        self._create_if_missing(self.repo_path / 'README.md', self._generate_readme())
+        self._create_if_missing(self.repo_path / '.gitignore', self._generate_gitignore())
 
         # Initial commit
         self.add_all()
         self.commit("Initial SuperDots repository structure")
 
-    def _generate_readme(self) -> str:
-        """Generate default README content."""
-        return """# SuperDots Configuration Repository
-
-This repository contains dotfiles and configuration files managed by SuperDots.
-
-## Structure
-
-- `configs/`: Configuration files organized by category
-- `scripts/`: Installation and setup scripts
-- `templates/`: Configuration templates
-- `backups/`: Backup copies of original files
-
-## Usage
-
-Use the `superdots` command-line tool to manage configurations:
-
-```bash
-# Initialize or sync configurations
-superdots sync
-
-# Add new configuration
-superdots add ~/.vimrc
-
-# List managed configurations
-superdots list
-
-# Deploy configurations
-superdots deploy
-```
-
-## Platform Support
-
-This repository supports synchronization across:
-- Linux
-- macOS
-- Windows
+    @staticmethod
+    def _create_if_missing(path: Path, content: bytes):
+        """Create a file with the given content unless it already exists."""
+        # Exclusive create checks and creates in one call, without a
+        # separate exists() round trip or touching an existing file
+        try:
+            with open(path, 'xb') as f:
+                f.write(content)
+        except FileExistsError:
+            pass
 
-Platform-specific configurations are automatically handled.
-"""
+    def _generate_readme(self) -> bytes:
+        """Generate default README content."""
+        return _README_BYTES
 
-    def _generate_gitignore(self) -> str:
+    def _generate_gitignore(self) -> bytes:
         """Generate default .gitignore content."""
-        return """# SuperDots gitignore
-
-# Temporary files
-*.tmp
-*.temp
-*~
-.DS_Store
-Thumbs.db
-
-# Logs
-*.log
-logs/
-
-# Cache files
-.cache/
-__pycache__/
-*.pyc
-*.pyo
-
-# Editor files
-.vscode/
-.idea/
-*.swp
-*.swo
+        return _GITIGNORE_BYTES
 
-# OS specific
-.Trash-*/
-ehthumbs.db
-
-# Sensitive files (customize as needed)
-# **/secrets.*
-# **/*_secret*
-# **/*.key
-# **/*.pem
-"""
-
-    def _run_git_command(self, args: List[str], cwd: Optional[Path] = None) -> str:
+    def _run_git_command(self, args: List[str], cwd: Optional[Path] = None,
+                         env: Optional[Dict[str, str]] = None) -> str:
         """Run a Git command using subprocess."""
         if cwd is None:
             cwd = self.repo_path
@@ -212,60 +276,233 @@ ehthumbs.db
                 cwd=cwd,
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                env=env
             )
             return result.stdout.strip()
         except subprocess.CalledProcessError as e:
             error_msg = e.stderr.strip() if e.stderr else str(e)
             raise GitError(f"Git command failed: {error_msg}")
 
+    def _stream_git_command(self, args: List[str], sep: bytes = b'\0') -> Iterator[str]:
+        """
+        Run a Git command and yield its output records as they arrive.
+
+        Args:
+            args: Git arguments
+            sep: Record separator (NUL for '-z' output)
+
+        Yields:
+            Records decoded like file system paths, without the separator
+
+        Raises:
+            GitError: If the command fails
+        """
+        proc = subprocess.Popen(
+            ['git'] + args,
+            cwd=self.repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        try:
+            pending = b''
+            for chunk in iter(lambda: proc.stdout.read1(65536), b''):
+                *records, pending = (pending + chunk).split(sep)
+                for record in records:
+                    yield os.fsdecode(record)
+            if pending:
+                yield os.fsdecode(pending)
+
+            stderr = proc.stderr.read()
+            if proc.wait() != 0:
+                raise GitError(f"Git command failed: {stderr.decode(errors='replace').strip()}")
+        finally:
+            # Stop git if the caller abandoned the iteration early
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
+
+    def _get_worker(self) -> subprocess.Popen:
+        """Get the batch lookup process, starting it if it is not running."""
+        if self._git_proc is None or self._git_proc.poll() is not None:
+            self._git_proc = subprocess.Popen(
+                ['git', 'cat-file', '--batch-check=%(objectname) %(objecttype)'],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0
+            )
+        return self._git_proc
+
+    def _resolve_object(self, rev: str) -> Optional[Tuple[str, str]]:
+        """
+        Resolve a revision through the persistent batch lookup process.
+
+        Args:
+            rev: Revision or object name (e.g. 'HEAD')
+
+        Returns:
+            (object name, object type), or None if the revision does not exist
+
+        Raises:
+            GitError: If the lookup process is not running (e.g. not a repository)
+        """
+        with self._git_proc_lock:
+            try:
+                proc = self._get_worker()
+                proc.stdin.write(rev.encode() + b'\n')
+                line = proc.stdout.readline()
+            except OSError as e:
+                raise GitError(f"Git lookup failed: {e}")
+
+        if not line:
+            raise GitError("Git lookup process exited")
+
+        parts = line.decode().split()
+        if len(parts) != 2 or parts[1] == 'missing':
+            return None
+        return parts[0], parts[1]
+
+    def close(self):
+        """Stop the persistent lookup process, if one was started."""
+        proc, self._git_proc = self._git_proc, None
+        if proc is None:
+            return
+
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        finally:
+            proc.stdout.close()
+
+    def __del__(self):
+        """Stop the lookup process when the handler is garbage collected."""
+        if getattr(self, '_git_proc', None) is not None:
+            self.close()
+
     @property
+    @_cached_query()
     def is_valid_repo(self) -> bool:
         """Check if the repository is valid."""
         try:
             if HAS_GITPYTHON and self.repo:
                 return not self.repo.bare
             else:
-                self._run_git_command(['status', '--porcelain'])
+                # Any answer (even "missing" for an unborn HEAD) means git
+                # recognised the repository; a dead worker raises instead
+                self._resolve_object('HEAD')
                 return True
-        except:
+        except _QUERY_ERRORS as e:
+            self.logger.debug(f"Not a valid repository: {e}")
             return False
 
     @property
+    @_cached_query()
     def is_dirty(self) -> bool:
         """Check if the repository has uncommitted changes."""
         try:
             if HAS_GITPYTHON and self.repo:
                 return self.repo.is_dirty()
             else:
-                output = self._run_git_command(['status', '--porcelain'])
-                return bool(output.strip())
-        except:
+                return any(self._snapshot().values())
+        except _QUERY_ERRORS as e:
+            self.logger.debug(f"Could not check for changes: {e}")
             return False
 
     @property
+    @_cached_query()
     def current_branch(self) -> str:
         """Get the current branch name."""
         try:
             if HAS_GITPYTHON and self.repo:
+                # active_branch raises on a detached HEAD
+                if self.repo.head.is_detached:
+                    return "main"
                 return self.repo.active_branch.name
             else:
+                # Read HEAD directly instead of starting git; linked worktrees
+                # (where .git is a file) still ask git
+                head_file = self.repo_path / '.git' / 'HEAD'
+                if head_file.is_file():
+                    head = head_file.read_text(encoding='utf-8').strip()
+                    return head[len('ref: refs/heads/'):] if head.startswith('ref: refs/heads/') else ""
                 return self._run_git_command(['branch', '--show-current'])
-        except:
+        except (*_QUERY_ERRORS, ValueError) as e:
+            self.logger.debug(f"Could not read current branch: {e}")
             return "main"
 
     @property
     def remotes(self) -> List[str]:
         """Get list of remote names."""
+        return list(self._remote_names())
+
+    @_cached_query()
+    def _remote_names(self) -> Tuple[str, ...]:
+        """Get remote names as an immutable (cacheable) tuple."""
         try:
             if HAS_GITPYTHON and self.repo:
-                return [remote.name for remote in self.repo.remotes]
+                return tuple(remote.name for remote in self.repo.remotes)
             else:
                 output = self._run_git_command(['remote'])
-                return output.split('\n') if output else []
-        except:
-            return []
+                return tuple(output.split('\n')) if output else ()
+        except _QUERY_ERRORS as e:
+            self.logger.debug(f"Could not list remotes: {e}")
+            return ()
+
+    @_cached_query()
+    def _snapshot(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        Parse one 'git status --porcelain=v2 -z' run into every status list.
+
+        Returns:
+            Tuples of paths keyed by 'staged', 'modified', 'untracked' and
+            'conflicts', shared by is_dirty, has_conflicts and get_status
+        """
+        staged, modified, untracked, conflicts = [], [], [], []
+
+        records = self._stream_git_command(['status', '--porcelain=v2', '-z'])
+        for record in records:
+            kind = record[:1]
+            if kind == '1':
+                # 1 XY sub mH mI mW hH hI path
+                fields = record.split(' ', 8)
+            elif kind == '2':
+                # 2 XY sub mH mI mW hH hI Xscore path, then the original path
+                fields = record.split(' ', 9)
+                next(records, None)
+            elif kind == 'u':
+                conflicts.append(record.split(' ', 10)[-1])
+                continue
+            elif kind == '?':
+                untracked.append(record[2:])
+                continue
+            else:
+                continue
+
+            state, path = fields[1], fields[-1]
+            if state[0] != '.':
+                staged.append(path)
+            if state[1] != '.':
+                modified.append(path)
+
+        return {
+            'staged': tuple(staged),
+            'modified': tuple(modified),
+            'untracked': tuple(untracked),
+            'conflicts': tuple(conflicts),
+        }
+
+    def invalidate_cache(self):
+        """Forget cached query results, e.g. after writing into the work tree."""
+        self._cache.clear()
 
+    @_invalidates_cache
     def add_remote(self, name: str, url: str) -> bool:
         """Add a remote repository."""
         try:
@@ -287,6 +524,7 @@ ehthumbs.db
             self.logger.error(f"Failed to add remote '{name}': {e}")
             return False
 
+    @_invalidates_cache
     def remove_remote(self, name: str) -> bool:
         """Remove a remote repository."""
         try:
@@ -301,6 +539,7 @@ ehthumbs.db
             self.logger.error(f"Failed to remove remote '{name}': {e}")
             return False
 
+    @_invalidates_cache
     def add_file(self, file_path: Union[str, Path]) -> bool:
         """Add a file to the staging area."""
         try:
@@ -317,6 +556,7 @@ ehthumbs.db
             self.logger.error(f"Failed to add file {file_path}: {e}")
             return False
 
+    @_invalidates_cache
     def add_all(self) -> bool:
         """Add all changes to the staging area."""
         try:
@@ -331,15 +571,32 @@ ehthumbs.db
             self.logger.error(f"Failed to add all changes: {e}")
             return False
 
-    def commit(self, message: str, author_name: Optional[str] = None, author_email: Optional[str] = None) -> bool:
-        """Create a commit with the given message."""
+    @_invalidates_cache
+    def commit(self, message: str, author_name: Optional[str] = None, author_email: Optional[str] = None,
+               fast_commit: bool = True) -> bool:
+        """
+        Create a commit with the given message.
+
+        Args:
+            message: Commit message
+            author_name: Optional author name
+            author_email: Optional author email
+            fast_commit: Without GitPython, write the commit with plumbing
+                commands instead of 'git commit'. This skips commit hooks;
+                pass False when a workflow relies on them.
+
+        Returns:
+            True if successful (or there was nothing to commit), False otherwise
+        """
         try:
-            # Set author if provided
-            env = os.environ.copy()
+            # Set author if provided; without one git inherits our environment
+            # as-is instead of receiving a copy
+            author = {}
             if author_name:
-                env['GIT_AUTHOR_NAME'] = author_name
+                author['GIT_AUTHOR_NAME'] = author_name
             if author_email:
-                env['GIT_AUTHOR_EMAIL'] = author_email
+                author['GIT_AUTHOR_EMAIL'] = author_email
+            env = {**os.environ, **author} if author else None
 
             if HAS_GITPYTHON and self.repo:
                 if author_name or author_email:
@@ -347,6 +604,8 @@ ehthumbs.db
                     self.repo.index.commit(message, author=actor)
                 else:
                     self.repo.index.commit(message)
+            elif fast_commit:
+                self._commit_plumbing(message, env)
             else:
                 cmd = ['commit', '-m', message]
                 result = subprocess.run(
@@ -367,6 +626,61 @@ ehthumbs.db
             self.logger.error(f"Failed to create commit: {e}")
             return False
 
+    def _commit_plumbing(self, message: str, env: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """
+        Commit the index with write-tree, commit-tree and update-ref.
+
+        Args:
+            message: Commit message
+            env: Environment carrying the author identity, or None to inherit ours
+
+        Returns:
+            SHA of the new commit, or None if the index matches HEAD
+        """
+        tree = self._run_git_command(['write-tree'])
+
+        head = self._resolve_object('HEAD')
+        if head is not None:
+            head_tree = self._resolve_object('HEAD^{tree}')
+            if head_tree is not None and head_tree[0] == tree:
+                return None
+
+        args = ['commit-tree', tree, '-m', message]
+        if head is not None:
+            args += ['-p', head[0]]
+        sha = self._run_git_command(args, env=env)
+
+        # Passing the old value makes the update fail if HEAD moved meanwhile
+        # (an unborn branch is checked against the empty value)
+        subject = message.split('\n', 1)[0]
+        self._run_git_command(['update-ref', '-m', f"commit: {subject}", 'HEAD', sha,
+                               head[0] if head is not None else ''])
+        return sha
+
+    @_invalidates_cache
+    def merge(self, rev: str) -> bool:
+        """
+        Merge a revision into the current branch without contacting a remote.
+
+        Args:
+            rev: Revision to merge, e.g. 'origin/main' after fetch()
+
+        Returns:
+            True if successful, False otherwise (including merge conflicts)
+        """
+        try:
+            if HAS_GITPYTHON and self.repo:
+                self.repo.git.merge('--no-edit', rev)
+            else:
+                self._run_git_command(['merge', '--no-edit', rev])
+
+            self.logger.info(f"Merged {rev}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to merge {rev}: {e}")
+            return False
+
+    @_invalidates_cache
     def push(self, remote: str = 'origin', branch: Optional[str] = None) -> bool:
         """Push changes to remote repository."""
         try:
@@ -385,6 +699,7 @@ ehthumbs.db
             self.logger.error(f"Failed to push to {remote}: {e}")
             return False
 
+    @_invalidates_cache
     def pull(self, remote: str = 'origin', branch: Optional[str] = None) -> bool:
         """Pull changes from remote repository."""
         try:
@@ -403,6 +718,7 @@ ehthumbs.db
             self.logger.error(f"Failed to pull from {remote}: {e}")
             return False
 
+    @_invalidates_cache
     def fetch(self, remote: str = 'origin') -> bool:
         """Fetch changes from remote repository."""
         try:
@@ -418,18 +734,66 @@ ehthumbs.db
             self.logger.error(f"Failed to fetch from {remote}: {e}")
             return False
 
-    def clone_repository(self, url: str, target_path: Path) -> bool:
-        """Clone a repository from URL."""
+    def fetch_all(self) -> Dict[str, bool]:
+        """
+        Fetch every configured remote concurrently.
+
+        Each remote is fetched by its own git process, so network waits
+        overlap instead of adding up.
+
+        Returns:
+            Dictionary mapping remote name to whether its fetch succeeded
+        """
+        remotes = self._remote_names()
+        if len(remotes) < 2:
+            return {name: self.fetch(name) for name in remotes}
+
+        with ThreadPoolExecutor(max_workers=min(8, len(remotes))) as executor:
+            futures = {name: executor.submit(self.fetch, name) for name in remotes}
+            return {name: future.result() for name, future in futures.items()}
+
+    @_invalidates_cache
+    def clone_repository(self, url: str, target_path: Path, shallow: bool = False) -> bool:
+        """
+        Clone a repository from URL.
+
+        An existing clone of the same URL at ``target_path`` is updated to the
+        remote's default branch in place instead of being deleted and cloned
+        again. New clones skip downloading file contents that are not checked
+        out (``--filter=blob:none``).
+
+        Args:
+            url: Repository URL
+            target_path: Directory to clone into
+            shallow: Fetch only the latest commit; later pulls may then need
+                     'git fetch --unshallow' to find a merge base
+
+        Returns:
+            True if successful, False otherwise
+        """
         try:
             target_path = Path(target_path)
+            depth = ['--depth=1'] if shallow else []
+
+            if self._origin_url(target_path) == url:
+                for args in (['fetch', *depth, 'origin', 'HEAD'], ['reset', '--hard', 'FETCH_HEAD'], ['clean', '-fd']):
+                    self._run_git_command(args, cwd=target_path)
+
+                self.logger.info(f"Updated existing clone of {url} at {target_path}")
+                return True
+
             if target_path.exists():
                 shutil.rmtree(target_path)
 
             if HAS_GITPYTHON:
-                Repo.clone_from(url, target_path)
+                options = {'filter': 'blob:none'}
+                if shallow:
+                    options.update(depth=1, single_branch=True)
+                Repo.clone_from(url, target_path, **options)
             else:
+                single_branch = ['--single-branch'] if shallow else []
                 subprocess.run(
-                    ['git', 'clone', url, str(target_path)],
+                    ['git', 'clone', '--filter=blob:none', *depth, *single_branch, url, str(target_path)],
                     check=True,
                     capture_output=True
                 )
@@ -440,6 +804,15 @@ ehthumbs.db
             self.logger.error(f"Failed to clone repository: {e}")
             return False
 
+    def _origin_url(self, path: Path) -> Optional[str]:
+        """Get the origin URL of the repository at ``path``, if it is one."""
+        if not (path / '.git').exists():
+            return None
+        try:
+            return self._run_git_command(['config', '--get', 'remote.origin.url'], cwd=path)
+        except GitError:
+            return None
+
     def get_status(self) -> Dict[str, List[str]]:
         """Get repository status."""
         status = {
@@ -449,60 +822,40 @@ ehthumbs.db
         }
 
         try:
-            if HAS_GITPYTHON and self.repo:
-                # Staged files
-                status['staged'] = [item.a_path for item in self.repo.index.diff("HEAD")]
-                # Modified files
-                status['modified'] = [item.a_path for item in self.repo.index.diff(None)]
-                # Untracked files
-                status['untracked'] = self.repo.untracked_files
-            else:
-                output = self._run_git_command(['status', '--porcelain'])
-                for line in output.split('\n'):
-                    if not line:
-                        continue
-
-                    status_code = line[:2]
-                    file_path = line[3:]
-
-                    if status_code[0] in ['A', 'M', 'D', 'R', 'C']:
-                        status['staged'].append(file_path)
-                    if status_code[1] in ['M', 'D']:
-                        status['modified'].append(file_path)
-                    if status_code == '??':
-                        status['untracked'].append(file_path)
+            # One porcelain status run for either backend; GitPython would
+            # build Diff objects for two separate index walks
+            snapshot = self._snapshot()
+            for key in status:
+                status[key] = list(snapshot[key])
         except Exception as e:
             self.logger.error(f"Failed to get repository status: {e}")
 
         return status
 
     def get_commits(self, max_count: int = 10) -> List[Dict[str, str]]:
-        """Get recent commits."""
+        """
+        Get recent commits.
+
+        Always reads ``git log`` output directly, even with GitPython, which
+        would otherwise build a full Commit object per entry.
+        """
         commits = []
 
         try:
-            if HAS_GITPYTHON and self.repo:
-                for commit in self.repo.iter_commits(max_count=max_count):
+            # NUL between records, unit separator between fields; %B is the
+            # full message as GitPython reported it, %cI its committed date
+            output = self._run_git_command([
+                'log', f'-{max_count}', '-z', '--abbrev=8', '--pretty=format:%h%x1f%B%x1f%an%x1f%cI'
+            ])
+            for record in output.split('\0'):
+                parts = record.split('\x1f')
+                if len(parts) == 4:
                     commits.append({
-                        'hash': commit.hexsha[:8],
-                        'message': commit.message.strip(),
-                        'author': str(commit.author),
-                        'date': commit.committed_datetime.isoformat(),
+                        'hash': parts[0],
+                        'message': parts[1].strip(),
+                        'author': parts[2],
+                        'date': parts[3],
                     })
-            else:
-                output = self._run_git_command([
-                    'log', f'-{max_count}', '--pretty=format:%h|%s|%an|%ai'
-                ])
-                for line in output.split('\n'):
-                    if line:
-                        parts = line.split('|', 3)
-                        if len(parts) == 4:
-                            commits.append({
-                                'hash': parts[0],
-                                'message': parts[1],
-                                'author': parts[2],
-                                'date': parts[3],
-                            })
         except Exception as e:
             self.logger.error(f"Failed to get commits: {e}")
 
@@ -514,11 +867,12 @@ ehthumbs.db
             if HAS_GITPYTHON and self.repo:
                 return len(list(self.repo.index.unmerged_blobs())) > 0
             else:
-                output = self._run_git_command(['status', '--porcelain'])
-                return 'UU' in output or 'AA' in output
-        except:
+                return bool(self._snapshot()['conflicts'])
+        except _QUERY_ERRORS as e:
+            self.logger.debug(f"Could not check for conflicts: {e}")
             return False
 
+    @_invalidates_cache
     def reset_hard(self, commit: str = 'HEAD') -> bool:
         """Reset repository to a specific commit."""
         try:
@@ -533,6 +887,7 @@ ehthumbs.db
             self.logger.error(f"Failed to reset repository: {e}")
             return False
 
+    @_invalidates_cache
     def create_branch(self, branch_name: str, checkout: bool = True) -> bool:
         """Create a new branch."""
         try:
@@ -550,6 +905,7 @@ ehthumbs.db
             self.logger.error(f"Failed to create branch '{branch_name}': {e}")
             return False
 
+    @_invalidates_cache
     def checkout_branch(self, branch_name: str) -> bool:
         """Checkout a branch."""
         try:
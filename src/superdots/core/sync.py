@@ -7,20 +7,51 @@ across different platforms using Git repositories, handling platform-specific
 differences and conflict resolution.
 """
 
+import copy
+import filecmp
 import os
+import platform
+import re
 import shutil
+import stat
 import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Tuple, Any
+from typing import Callable, Dict, List, Optional, Union, Tuple, Any
 from datetime import datetime
 from enum import Enum
+from functools import cached_property, wraps
 
 from .config import ConfigManager, ConfigFile, ConfigStatus, OSType
 from .git_handler import GitHandler, GitError
 from ..utils.logger import get_logger
+from ..utils.path import copy_file, copy_tree
 from ..utils.platform import platform_detector
 
 
+# Looked up once; os.uname() is a system call and does not exist on Windows
+_HOSTNAME = platform.node()
+
+# A '{{NAME}}' placeholder in a template configuration
+_TEMPLATE_VAR_RE = re.compile(rb'\{\{([^{}]+)\}\}')
+
+# Seconds a get_sync_status() result is reused, matching GitHandler's query cache
+_SYNC_STATUS_TTL = 0.5
+
+
+def _invalidates_sync_status(func: Callable) -> Callable:
+    """Drop a SyncManager's cached status after a method that changes the repository."""
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._sync_status = None
+    return wrapper
+
+
 class SyncStatus(Enum):
     """Synchronization status."""
     SUCCESS = "success"
@@ -97,8 +128,37 @@ class SyncManager:
         self.sync_config_file = config_manager.repo_path / '.superdots' / 'sync_config.json'
         self.conflict_resolution = ConflictResolution.MANUAL
 
-        # Platform mapping for cross-platform sync
-        self.platform_mappings = self._load_platform_mappings()
+        # Default template variables, encoded for _deploy_template; none of
+        # them change while SuperDots runs
+        self._template_defaults = {
+            key.encode('utf-8'): value.encode('utf-8')
+            for key, value in {
+                'HOME': str(platform_detector.home_dir),
+                'USER': os.environ.get('USER', os.environ.get('USERNAME', 'user')),
+                'PLATFORM': platform_detector.os_type.value,
+                'HOSTNAME': _HOSTNAME,
+                'CONFIG_DIR': str(platform_detector.get_config_dir()),
+            }.items()
+        }
+
+        # (time, result) of the last get_sync_status() call
+        self._sync_status: Optional[Tuple[float, Dict[str, Any]]] = None
+
+        # The prefix replaced by 'home_config_paths', see _map_path_for_platform
+        self._home_config_dir = str(Path('~/.config').expanduser())
+
+    @cached_property
+    def platform_mappings(self) -> Dict[str, Dict[str, str]]:
+        """Platform mapping for cross-platform sync, loaded on first use."""
+        return self._load_platform_mappings()
+
+    @cached_property
+    def _expanded_mappings(self) -> Dict[str, Dict[str, str]]:
+        """Mapping patterns with '~' expanded once, see _map_path_for_platform."""
+        return {
+            category: {platform: str(Path(pattern).expanduser()) for platform, pattern in mappings.items()}
+            for category, mappings in self.platform_mappings.items()
+        }
 
     def _load_platform_mappings(self) -> Dict[str, Dict[str, str]]:
         """Load platform-specific path mappings."""
@@ -138,6 +198,7 @@ class SyncManager:
         self.conflict_resolution = strategy
         self.logger.info(f"Conflict resolution strategy set to: {strategy.value}")
 
+    @_invalidates_sync_status
     def push_changes(self, message: Optional[str] = None, force: bool = False) -> SyncResult:
         """
         Push local changes to remote repository.
@@ -158,19 +219,34 @@ class SyncManager:
                 result.message = "No local changes to push"
                 return result
 
-            # Update configurations from their source locations
+            # Update configurations from their source locations in one batch;
+            # the copies run concurrently and the index is saved once
             self.logger.info("Updating configurations from source locations...")
-            updated_configs = []
+            current_platform = self.config_manager.current_platform
+            sources = {name: config.get_source_path(current_platform)
+                       for name, config in self.config_manager._configs.items()}
+
+            # Sources sharing a parent directory are checked with one listing
+            parents = Counter(path.parent for path in sources.values() if path)
+            entries = self.config_manager._scan_parent_dirs(
+                path for path in sources.values() if path and parents[path.parent] > 1
+            )
 
-            for name, config in self.config_manager._configs.items():
-                if config.source_path.exists():
-                    if self.config_manager.update_config(name):
-                        updated_configs.append(name)
-                        result.mark_success(name)
-                    else:
-                        result.add_error(name, "Failed to update from source")
+            names = []
+            for name, source_path in sources.items():
+                if source_path and (source_path.name in entries[source_path.parent]
+                                    if source_path.parent in entries else source_path.exists()):
+                    names.append(name)
                 else:
-                    self.logger.warning(f"Source path missing for '{name}': {config.source_path}")
+                    self.logger.warning(f"Source path missing for '{name}': {source_path}")
+
+            updated_configs = []
+            for name, success in self.config_manager.update_configs(names).items():
+                if success:
+                    updated_configs.append(name)
+                    result.mark_success(name)
+                else:
+                    result.add_error(name, "Failed to update from source")
 
             # Generate commit message
             if not message:
@@ -191,7 +267,7 @@ class SyncManager:
                 return result
 
             # Commit changes
-            platform_info = f"{platform_detector.os_type.value}@{os.uname().nodename}"
+            platform_info = f"{platform_detector.os_type.value}@{_HOSTNAME}"
             if not self.git_handler.commit(message, author_name=f"SuperDots-{platform_info}"):
                 result.add_error("git", "Failed to create commit")
                 result.finalize()
@@ -214,6 +290,7 @@ class SyncManager:
         result.finalize()
         return result
 
+    @_invalidates_sync_status
     def pull_changes(self, auto_resolve: bool = False) -> SyncResult:
         """
         Pull changes from remote repository and apply them.
@@ -245,9 +322,9 @@ class SyncManager:
                 result.finalize()
                 return result
 
-            # Pull changes
-            self.logger.info("Pulling changes...")
-            if not self.git_handler.pull('origin'):
+            # Merge what was just fetched; 'git pull' would fetch it again
+            self.logger.info("Merging fetched changes...")
+            if not self.git_handler.merge(f"origin/{self.git_handler.current_branch}"):
                 # Check if there are conflicts
                 if self.git_handler.has_conflicts():
                     self.logger.warning("Merge conflicts detected")
@@ -285,32 +362,58 @@ class SyncManager:
         result.finalize()
         return result
 
-    def _deploy_platform_configs(self) -> int:
-        """Deploy configurations suitable for the current platform."""
-        deployed = 0
+    def _deploy_platform_configs(self, max_workers: Optional[int] = None) -> int:
+        """
+        Deploy configurations suitable for the current platform.
+
+        Configurations are deployed concurrently; each one writes to its own
+        target, and the copies and symlinks spend their time in system calls.
+
+        Args:
+            max_workers: Number of worker threads (defaults to min(8, CPU count))
+
+        Returns:
+            Number of configurations deployed
+        """
         current_platform = platform_detector.os_type
+        configs = [(name, config) for name, config in self.config_manager._configs.items()
+                   if current_platform in config.platforms]
+
+        if max_workers is None:
+            max_workers = min(8, os.cpu_count() or 1)
 
-        for name, config in self.config_manager._configs.items():
-            if current_platform in config.platforms:
-                # Check if this configuration has platform-specific variants
-                platform_config = self._get_platform_specific_config(config)
+        if max_workers > 1 and len(configs) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(lambda item: self._deploy_platform_config(*item, current_platform), configs))
+        else:
+            outcomes = [self._deploy_platform_config(name, config, current_platform) for name, config in configs]
+
+        return sum(outcomes)
+
+    def _deploy_platform_config(self, name: str, config: ConfigFile, current_platform: OSType) -> bool:
+        """Deploy one configuration for the current platform, returning whether it was deployed."""
+        # Check if this configuration has platform-specific variants
+        platform_config = self._get_platform_specific_config(config, current_platform)
+        if not platform_config or not platform_config.repo_path.exists():
+            return False
 
-                if platform_config and platform_config.repo_path.exists():
-                    try:
-                        # Deploy using mapped paths if necessary
-                        target_path = self._map_path_for_platform(config.source_path, current_platform)
+        try:
+            # Deploy using mapped paths if necessary
+            target_path = self._map_path_for_platform(config.source_path, current_platform)
 
-                        if self._deploy_single_config(platform_config, target_path):
-                            deployed += 1
-                            self.logger.debug(f"Deployed {name} to {target_path}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to deploy {name}: {e}")
+            if self._deploy_single_config(platform_config, target_path):
+                self.logger.debug(f"Deployed {name} to {target_path}")
+                return True
+        except Exception as e:
+            self.logger.error(f"Failed to deploy {name}: {e}")
 
-        return deployed
+        return False
 
-    def _get_platform_specific_config(self, config: ConfigFile) -> Optional[ConfigFile]:
+    def _get_platform_specific_config(self, config: ConfigFile,
+                                      current_platform: Optional[OSType] = None) -> Optional[ConfigFile]:
         """Get platform-specific version of a configuration if it exists."""
-        current_platform = platform_detector.os_type
+        if current_platform is None:
+            current_platform = platform_detector.os_type
 
         # First, check if there's a platform-specific version
         platform_repo_path = (
@@ -347,20 +450,11 @@ class SyncManager:
         """Map a path from one platform to another using platform mappings."""
         original_str = str(original_path)
 
-        # Apply platform mappings
-        for category, mappings in self.platform_mappings.items():
-            for platform, path_pattern in mappings.items():
-                if platform == target_platform.value:
-                    # Simple substitution for now - can be extended for more complex mappings
-                    expanded_pattern = Path(path_pattern).expanduser()
-                    if category == 'home_config_paths':
-                        # Map .config paths
-                        if '.config' in original_str:
-                            mapped_path = str(original_path).replace(
-                                str(Path('~/.config').expanduser()),
-                                str(expanded_pattern)
-                            )
-                            return Path(mapped_path)
+        # Only '.config' paths are mapped for now - can be extended for more complex mappings
+        if '.config' in original_str:
+            expanded_pattern = self._expanded_mappings.get('home_config_paths', {}).get(target_platform.value)
+            if expanded_pattern is not None:
+                return Path(original_str.replace(self._home_config_dir, expanded_pattern))
 
         # If no mapping found, return original path
         return original_path
@@ -375,24 +469,35 @@ class SyncManager:
             if config.config_type.value == 'template':
                 return self._deploy_template(config, target_path)
 
-            # Remove existing target if it exists
-            if target_path.exists():
-                if target_path.is_symlink():
-                    target_path.unlink()
-                elif target_path.is_file():
-                    target_path.unlink()
-                elif target_path.is_dir():
+            use_symlink = config.use_symlink and platform_detector.can_symlink()
+
+            # Leave a target that already matches alone instead of rewriting it
+            if self._is_deployed(config, target_path, use_symlink):
+                self.logger.debug(f"{config.name} is already deployed to {target_path}")
+                return True
+
+            # Remove existing target if it exists; one lstat() tells links,
+            # files and directories apart (and finds dangling links too)
+            try:
+                mode = os.lstat(target_path).st_mode
+            except FileNotFoundError:
+                mode = None
+            if mode is not None:
+                if stat.S_ISLNK(mode) or stat.S_ISREG(mode):
+                    os.unlink(target_path)
+                elif stat.S_ISDIR(mode):
                     shutil.rmtree(target_path)
 
             # Deploy based on configuration preferences
-            if config.use_symlink and platform_detector.can_symlink():
+            if use_symlink:
                 return platform_detector.create_symlink(config.repo_path, target_path, force=True)
             else:
-                # Copy files
+                # Copy files, sharing blocks with the repository copy where
+                # the filesystem supports it
                 if config.repo_path.is_file():
-                    shutil.copy2(config.repo_path, target_path)
+                    copy_file(config.repo_path, target_path)
                 elif config.repo_path.is_dir():
-                    shutil.copytree(config.repo_path, target_path)
+                    copy_tree(config.repo_path, target_path)
 
                 # Set executable permission if needed
                 if config.executable and target_path.is_file():
@@ -404,33 +509,47 @@ class SyncManager:
             self.logger.error(f"Failed to deploy {config.name}: {e}")
             return False
 
-    def _deploy_template(self, config: ConfigFile, target_path: Path) -> bool:
-        """Deploy a template configuration with variable substitution."""
-        try:
-            # Load template content
-            template_content = config.repo_path.read_text(encoding='utf-8')
-
-            # Prepare template variables
-            template_vars = config.template_vars or {}
+    @staticmethod
+    def _is_deployed(config: ConfigFile, target_path: Path, use_symlink: bool) -> bool:
+        """Check whether a file configuration's target already matches its repository copy."""
+        if use_symlink:
+            return target_path.is_symlink() and target_path.resolve() == config.repo_path.resolve()
 
-            # Add default variables
-            default_vars = {
-                'HOME': str(platform_detector.home_dir),
-                'USER': os.environ.get('USER', os.environ.get('USERNAME', 'user')),
-                'PLATFORM': platform_detector.os_type.value,
-                'HOSTNAME': os.uname().nodename,
-                'CONFIG_DIR': str(platform_detector.get_config_dir()),
-            }
+        if target_path.is_symlink() or not target_path.is_file() or not config.repo_path.is_file():
+            return False
 
-            template_vars = {**default_vars, **template_vars}
+        # Same permissions as a fresh copy would get, then same bytes
+        # (filecmp rules out different sizes before reading either file)
+        expected_mode = 0o755 if config.executable else stat.S_IMODE(config.repo_path.stat().st_mode)
+        if stat.S_IMODE(target_path.stat().st_mode) != expected_mode:
+            return False
+        return filecmp.cmp(config.repo_path, target_path, shallow=False)
 
-            # Simple template substitution (can be extended to use Jinja2 if needed)
-            rendered_content = template_content
-            for key, value in template_vars.items():
-                rendered_content = rendered_content.replace(f'{{{{{key}}}}}', str(value))
+    def _deploy_template(self, config: ConfigFile, target_path: Path) -> bool:
+        """Deploy a template configuration with variable substitution."""
+        try:
+            # Load template content; placeholders are ASCII-delimited, so the
+            # UTF-8 bytes are substituted without decoding them
+            template_content = config.repo_path.read_bytes()
+
+            # Prepare template variables: the prebuilt defaults, overridden by
+            # the configuration's own variables when it has any
+            template_vars = self._template_defaults
+            if config.template_vars:
+                template_vars = {
+                    **template_vars,
+                    **{key.encode('utf-8'): str(value).encode('utf-8') for key, value in config.template_vars.items()},
+                }
+
+            # Simple template substitution (can be extended to use Jinja2 if needed),
+            # in one pass over the content; unknown placeholders are kept as-is
+            rendered_content = _TEMPLATE_VAR_RE.sub(
+                lambda match: template_vars.get(match[1], match[0]),
+                template_content
+            )
 
             # Write rendered content
-            target_path.write_text(rendered_content, encoding='utf-8')
+            target_path.write_bytes(rendered_content)
 
             # Set executable permission if needed
             if config.executable:
@@ -474,6 +593,7 @@ class SyncManager:
         result.finalize()
         return result
 
+    @_invalidates_sync_status
     def sync(self,
              pull_first: bool = True,
              auto_commit: bool = True,
@@ -531,6 +651,7 @@ class SyncManager:
         result.finalize()
         return result
 
+    @_invalidates_sync_status
     def clone_repository(self, url: str, target_path: Optional[Path] = None) -> bool:
         """
         Clone a SuperDots repository from a URL.
@@ -566,7 +687,18 @@ class SyncManager:
             return False
 
     def get_sync_status(self) -> Dict[str, Any]:
-        """Get detailed synchronization status."""
+        """
+        Get detailed synchronization status.
+
+        A result less than half a second old is reused, so callers that show
+        several views of the status do not check every configuration again.
+        Syncing through this manager discards it.
+        """
+        now = time.monotonic()
+        cached = self._sync_status
+        if cached is not None and now - cached[0] < _SYNC_STATUS_TTL:
+            return copy.deepcopy(cached[1])
+
         status = {
             'repository': {
                 'path': str(self.git_handler.repo_path),
@@ -591,7 +723,8 @@ class SyncManager:
             self.logger.debug(f"Failed to get recent commits: {e}")
             status['repository']['recent_commits'] = []
 
-        return status
+        self._sync_status = (now, status)
+        return copy.deepcopy(status)
 
     def create_platform_branch(self, platform: OSType) -> bool:
         """Create a platform-specific branch for managing configurations."""
@@ -8,10 +8,14 @@ log levels, colored output, and file logging.
 
 import os
 import sys
+import queue
+import atexit
+import functools
 import logging
 import logging.handlers
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Any
 from datetime import datetime
 
 try:
@@ -63,48 +67,145 @@ class ColoredFormatter(logging.Formatter):
             return super().format(record)
 
 
+class CachedSizeRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that tracks the log size instead of asking the stream.
+
+    ``RotatingFileHandler`` seeks and tells on every record to decide whether
+    to roll over. This handler reads the size once when the file is opened
+    and then adds the length of each written record, so the rollover check
+    costs no syscalls. Lengths are counted in characters, which makes the
+    threshold approximate for non-ASCII output.
+    """
+
+    _pending_size = 0
+
+    def _open(self):
+        stream = super()._open()
+        self._cached_size = stream.tell()
+        return stream
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0:
+            self._pending_size = 0
+            return False
+        self._pending_size = len(self.format(record)) + len(self.terminator)
+        return self._cached_size + self._pending_size >= self.maxBytes
+
+    def emit(self, record: logging.LogRecord):
+        super().emit(record)
+        self._cached_size += self._pending_size
+
+    def doRollover(self):
+        super().doRollover()
+        self._cached_size = 0
+
+
 class SuperDotsLogger:
-    """Main logger class for SuperDots."""
+    """Main logger class for SuperDots.
+
+    Console output is written synchronously so it stays in order with other
+    terminal output. File records are handed to a single shared
+    ``QueueListener`` thread, so formatting and disk writes for the log file
+    never run in the caller's thread.
+    """
+
+    _log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _listener: Optional[logging.handlers.QueueListener] = None
+    _console_handler: Optional[logging.Handler] = None
+    _queue_handler: Optional[logging.Handler] = None
+    _listener_lock = threading.Lock()
 
     def __init__(self, name: str = 'superdots'):
         self.name = name
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
 
+        # superdots.* loggers propagate to the package logger, so make sure
+        # it owns the handlers before deciding whether to add our own
+        if name.startswith('superdots.'):
+            get_logger()
+
         # Prevent duplicate handlers
-        if self.logger.handlers:
+        if self.logger.handlers or self._parent_has_handlers():
             return
 
         self._setup_handlers()
 
-    def _setup_handlers(self):
-        """Setup logging handlers for console and file output."""
-
-        # Console handler
-        if HAS_RICH:
-            console_handler = RichHandler(
-                console=Console(stderr=True),
-                show_time=False,
-                show_path=False,
-                rich_tracebacks=True
-            )
-            console_format = "%(message)s"
-        else:
-            console_handler = logging.StreamHandler(sys.stderr)
-            console_format = "[%(levelname)s] %(name)s: %(message)s"
-            console_handler.setFormatter(ColoredFormatter(console_format))
-
-        console_handler.setLevel(logging.INFO)
-        if HAS_RICH:
-            console_handler.setFormatter(logging.Formatter(console_format))
-
-        self.logger.addHandler(console_handler)
+    def _parent_has_handlers(self) -> bool:
+        """Check whether records already propagate to an ancestor with our handlers."""
+        console_handler = self._console_handler
+        if console_handler is None:
+            return False
 
-        # File handler (if log directory exists)
-        self._setup_file_handler()
+        logger = self.logger
+        while logger.propagate and logger.parent is not None:
+            logger = logger.parent
+            if console_handler in logger.handlers:
+                return True
+        return False
 
-    def _setup_file_handler(self):
-        """Setup file logging handler."""
+    def _setup_handlers(self):
+        """Attach the shared console handler and the file queue handler."""
+        self._start_listener()
+        self.logger.addHandler(self._console_handler)
+        if self._queue_handler is not None:
+            self.logger.addHandler(self._queue_handler)
+
+    @classmethod
+    def _start_listener(cls):
+        """Build the console and file handlers once and start the file listener."""
+        with cls._listener_lock:
+            if cls._console_handler is not None:
+                return
+
+            # Console handler
+            if HAS_RICH:
+                console_handler = RichHandler(
+                    console=Console(stderr=True),
+                    show_time=False,
+                    show_path=False,
+                    rich_tracebacks=True
+                )
+                console_handler.setFormatter(logging.Formatter("%(message)s"))
+            else:
+                console_handler = logging.StreamHandler(sys.stderr)
+                console_format = "[%(levelname)s] %(name)s: %(message)s"
+                console_handler.setFormatter(ColoredFormatter(console_format))
+
+            console_handler.setLevel(logging.INFO)
+
+            # File handler (if log directory exists), written on the listener thread
+            file_handler, file_error = cls._setup_file_handler()
+            if file_handler is not None:
+                listener = logging.handlers.QueueListener(
+                    cls._log_queue, file_handler, respect_handler_level=True
+                )
+                listener.start()
+                atexit.register(listener.stop)
+                cls._listener = listener
+                cls._queue_handler = logging.handlers.QueueHandler(cls._log_queue)
+
+            cls._console_handler = console_handler
+
+        if file_error is not None:
+            # If we can't setup file logging, just continue with console
+            console_handler.handle(logging.makeLogRecord({
+                'name': 'superdots',
+                'levelno': logging.WARNING,
+                'levelname': 'WARNING',
+                'msg': f"Could not setup file logging: {file_error}",
+            }))
+
+    @staticmethod
+    def _setup_file_handler():
+        """Setup file logging handler.
+
+        Returns:
+            Tuple of the handler (or None) and the error that prevented
+            creating it (or None).
+        """
         try:
             # Try to create logs directory
             log_dir = Path.home() / '.config' / 'superdots' / 'logs'
@@ -113,7 +214,7 @@ class SuperDotsLogger:
             log_file = log_dir / 'superdots.log'
 
             # Use rotating file handler
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = CachedSizeRotatingFileHandler(
                 log_file,
                 maxBytes=5 * 1024 * 1024,  # 5MB
                 backupCount=5
@@ -129,11 +230,10 @@ class SuperDotsLogger:
             ))
 
             file_handler.setLevel(logging.DEBUG)
-            self.logger.addHandler(file_handler)
+            return file_handler, None
 
         except Exception as e:
-            # If we can't setup file logging, just continue with console
-            self.logger.warning(f"Could not setup file logging: {e}")
+            return None, e
 
     def set_level(self, level: str):
         """Set the logging level."""
@@ -152,6 +252,8 @@ class SuperDotsLogger:
         for handler in self.logger.handlers:
             if isinstance(handler, (logging.StreamHandler, RichHandler if HAS_RICH else type(None))):
                 handler.setLevel(log_level)
+        if self._console_handler is not None:
+            self._console_handler.setLevel(log_level)
 
     def debug(self, message: str, *args, **kwargs):
         """Log debug message."""
@@ -178,15 +280,10 @@ class SuperDotsLogger:
         self.logger.exception(message, *args, **kwargs)
 
 
-# Global logger instances
-_loggers: Dict[str, SuperDotsLogger] = {}
-
-
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str = 'superdots') -> SuperDotsLogger:
     """Get or create a logger instance."""
-    if name not in _loggers:
-        _loggers[name] = SuperDotsLogger(name)
-    return _loggers[name]
+    return SuperDotsLogger(name)
 
 
 def set_log_level(level: str, logger_name: str = 'superdots'):
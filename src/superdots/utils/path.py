@@ -1,5 +1,10 @@
+import os
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple, Union
 
 def normalize_path(path: Path, home: Optional[Path] = None, expanduser: bool=True) -> Path:
     if not home:
@@ -14,4 +19,173 @@ def normalize_path(path: Path, home: Optional[Path] = None, expanduser: bool=Tru
     path = (Path('~') / path)
     if expanduser:
         path = path.expanduser()
-    return path 
\ No newline at end of file
+    return path
+
+
+@lru_cache(maxsize=1024)
+def _realpath(path: str) -> str:
+    return os.path.realpath(path)
+
+
+def resolve_path(path: Union[str, Path]) -> Path:
+    """
+    Resolve ``path`` like :meth:`Path.resolve`, remembering the answer.
+
+    realpath() stats every component of the path; SuperDots' repository and
+    config paths do not move while it runs, so each absolute path is resolved
+    once per process. Relative paths are made absolute first so the cache
+    stays correct if the working directory changes.
+
+    Args:
+        path: Path to resolve
+
+    Returns:
+        Absolute path with symlinks resolved
+    """
+    return Path(_realpath(os.path.abspath(path)))
+
+
+# ioctl request number for FICLONE (_IOW(0x94, 9, int)) on Linux
+_FICLONE = 0x40049409
+
+
+def clone_file(src: Path, dst: Path) -> bool:
+    """
+    Make ``dst`` a copy-on-write clone of ``src`` where the filesystem allows it.
+
+    Uses the FICLONE ioctl on Linux (Btrfs, XFS) and clonefile(2) on macOS
+    (APFS). ``dst`` must not exist. Permission bits are copied on success.
+
+    Args:
+        src: Source file
+        dst: Destination file
+
+    Returns:
+        True if a clone was made, False if the caller should copy instead
+    """
+    try:
+        if sys.platform.startswith('linux'):
+            import fcntl
+
+            with open(src, 'rb') as source, open(dst, 'xb') as target:
+                try:
+                    fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+                except OSError:
+                    cloned = False
+                else:
+                    cloned = True
+            if not cloned:
+                os.unlink(dst)
+                return False
+        elif sys.platform == 'darwin':
+            import ctypes
+
+            libc = ctypes.CDLL(None, use_errno=True)
+            if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+                return False
+        else:
+            return False
+
+        shutil.copymode(src, dst)
+        return True
+
+    except (OSError, AttributeError):
+        return False
+
+
+def _copy_file_range(src: Path, dst: Path) -> bool:
+    """Copy file data inside the kernel with copy_file_range(2); False if unsupported."""
+    if not hasattr(os, 'copy_file_range'):
+        return False
+
+    try:
+        with open(src, 'rb') as source, open(dst, 'xb') as target:
+            try:
+                # Short copies are allowed, so loop until end of file
+                while os.copy_file_range(source.fileno(), target.fileno(), 1 << 30):
+                    pass
+            except OSError:
+                copied = False
+            else:
+                copied = True
+    except OSError:
+        return False
+
+    if not copied:
+        os.unlink(dst)
+        return False
+    return True
+
+
+def copy_file(src: Path, dst: Path) -> None:
+    """
+    Copy a file with its metadata like ``shutil.copy2``, cloning it if possible.
+
+    A copy-on-write clone (see :func:`clone_file`) shares the source's blocks
+    instead of reading and writing them. Otherwise Linux copies the data with
+    copy_file_range(2), which stays in the kernel and lets filesystems such as
+    NFS copy server-side. ``dst`` must not exist.
+
+    Args:
+        src: Source file
+        dst: Destination file
+    """
+    if clone_file(src, dst) or _copy_file_range(src, dst):
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
+
+def copy_tree(src: Path, dst: Path, max_workers: Optional[int] = None) -> None:
+    """
+    Copy a directory tree like ``shutil.copytree``, copying files concurrently.
+
+    Directories are created up front, then files are copied with
+    :func:`copy_file` on a thread pool in inode order, so reads of a large tree
+    overlap instead of running one file at a time. Symlinks are recreated as
+    symlinks (like ``copytree(symlinks=True)``), so dangling links are kept
+    and links to directories are never recursed into.
+
+    Args:
+        src: Source directory
+        dst: Destination directory, which must not exist yet
+        max_workers: Number of copy threads (defaults to a few per CPU)
+    """
+    directories: List[Tuple[Path, Path]] = []
+    files: List[Tuple[int, Path, Path]] = []
+    links: List[Tuple[os.DirEntry, Path]] = []
+
+    def collect(source: Path, target: Path) -> None:
+        directories.append((source, target))
+        with os.scandir(source) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    links.append((entry, target / entry.name))
+                elif entry.is_dir(follow_symlinks=False):
+                    collect(Path(entry.path), target / entry.name)
+                else:
+                    files.append((entry.stat(follow_symlinks=False).st_ino, Path(entry.path), target / entry.name))
+
+    collect(src, dst)
+
+    dst.mkdir(parents=True)
+    for _, target in directories[1:]:
+        target.mkdir()
+
+    for entry, target in links:
+        os.symlink(os.readlink(entry.path), target, target_is_directory=entry.is_dir())
+        shutil.copystat(entry.path, target, follow_symlinks=False)
+
+    files.sort(key=lambda item: item[0])
+    if len(files) > 1:
+        workers = max_workers or min(32, (os.cpu_count() or 1) * 4, len(files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the results so the first copy error is raised here
+            list(executor.map(lambda item: copy_file(item[1], item[2]), files))
+    else:
+        for _, source, target in files:
+            copy_file(source, target)
+
+    # Directory times last, deepest first, so copying files does not reset them
+    for source, target in reversed(directories):
+        shutil.copystat(source, target)
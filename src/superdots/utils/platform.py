@@ -9,8 +9,9 @@ handle path differences, and manage OS-specific configuration locations.
 import os
 import sys
 import platform
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from enum import Enum
 
 
@@ -22,27 +23,29 @@ class OSType(Enum):
     UNKNOWN = "unknown"
 
 
+# platform.system() names mapped to the supported OS types
+_OS_TYPES: Dict[str, OSType] = {
+    "linux": OSType.LINUX,
+    "darwin": OSType.MACOS,
+    "windows": OSType.WINDOWS,
+}
+
+
 class PlatformDetector:
     """Handles platform detection and OS-specific operations."""
 
     def __init__(self):
         self._os_type = self._detect_os()
+        self._is_linux = self._os_type is OSType.LINUX
+        self._is_macos = self._os_type is OSType.MACOS
+        self._is_windows = self._os_type is OSType.WINDOWS
         self._home_dir = Path.home()
-        self._config_paths = self._get_config_paths()
+        self._can_symlink: Optional[bool] = None
 
     @staticmethod
     def _detect_os() -> OSType:
         """Detect the current operating system."""
-        system = platform.system().lower()
-
-        if system == "linux":
-            return OSType.LINUX
-        elif system == "darwin":
-            return OSType.MACOS
-        elif system == "windows":
-            return OSType.WINDOWS
-        else:
-            return OSType.UNKNOWN
+        return _OS_TYPES.get(platform.system().lower(), OSType.UNKNOWN)
 
     @property
     def os_type(self) -> OSType:
@@ -52,53 +55,55 @@ class PlatformDetector:
     @property
     def is_linux(self) -> bool:
         """Check if running on Linux."""
-        return self._os_type == OSType.LINUX
+        return self._is_linux
 
     @property
     def is_macos(self) -> bool:
         """Check if running on macOS."""
-        return self._os_type == OSType.MACOS
+        return self._is_macos
 
     @property
     def is_windows(self) -> bool:
         """Check if running on Windows."""
-        return self._os_type == OSType.WINDOWS
+        return self._is_windows
 
     @property
     def home_dir(self) -> Path:
         """Get the user's home directory."""
         return self._home_dir
 
-    def _get_config_paths(self) -> Dict[str, Path]:
-        """Get OS-specific configuration directory paths."""
+    @cached_property
+    def _config_paths(self) -> Dict[str, Path]:
+        """OS-specific configuration directory paths, built on first use."""
         paths = {}
+        home = self._home_dir
 
         if self.is_linux:
             paths.update({
-                'config': Path.home() / '.config',
-                'local_share': Path.home() / '.local' / 'share',
-                'cache': Path.home() / '.cache',
-                'bin': Path.home() / '.local' / 'bin',
-                'fonts': Path.home() / '.local' / 'share' / 'fonts',
+                'config': home / '.config',
+                'local_share': home / '.local' / 'share',
+                'cache': home / '.cache',
+                'bin': home / '.local' / 'bin',
+                'fonts': home / '.local' / 'share' / 'fonts',
             })
         elif self.is_macos:
             paths.update({
-                'config': Path.home() / '.config',  # Many tools use this on macOS too
-                'macos_config': Path.home() / 'Library' / 'Application Support',
-                'preferences': Path.home() / 'Library' / 'Preferences',
-                'cache': Path.home() / 'Library' / 'Caches',
+                'config': home / '.config',  # Many tools use this on macOS too
+                'macos_config': home / 'Library' / 'Application Support',
+                'preferences': home / 'Library' / 'Preferences',
+                'cache': home / 'Library' / 'Caches',
                 'bin': Path('/usr/local/bin'),
-                'fonts': Path.home() / 'Library' / 'Fonts',
+                'fonts': home / 'Library' / 'Fonts',
             })
         elif self.is_windows:
-            appdata = os.environ.get('APPDATA', str(Path.home() / 'AppData' / 'Roaming'))
-            localappdata = os.environ.get('LOCALAPPDATA', str(Path.home() / 'AppData' / 'Local'))
+            appdata = os.environ.get('APPDATA', str(home / 'AppData' / 'Roaming'))
+            localappdata = os.environ.get('LOCALAPPDATA', str(home / 'AppData' / 'Local'))
 
             paths.update({
                 'config': Path(appdata),
                 'local_config': Path(localappdata),
                 'cache': Path(localappdata) / 'Temp',
-                'bin': Path.home() / 'bin',
+                'bin': home / 'bin',
                 'fonts': Path(os.environ.get('WINDIR', 'C:\\Windows')) / 'Fonts',
             })
 
@@ -110,6 +115,11 @@ class PlatformDetector:
 
     def get_dotfiles_locations(self) -> Dict[str, List[Path]]:
         """Get common dotfile locations for the current OS."""
+        return {category: list(paths) for category, paths in self._dotfiles_locations.items()}
+
+    @cached_property
+    def _dotfiles_locations(self) -> Dict[str, Tuple[Path, ...]]:
+        """Dotfile locations for the current OS, built on first use."""
         locations = {
             'shell': [],
             'editors': [],
@@ -201,7 +211,7 @@ class PlatformDetector:
                 ],
             })
 
-        return locations
+        return {category: tuple(paths) for category, paths in locations.items()}
 
     def normalize_path(self, path: Union[str, Path]) -> Path:
         """Normalize a path for the current OS."""
@@ -249,11 +259,17 @@ class PlatformDetector:
 
     def can_symlink(self) -> bool:
         """Check if the current OS and user can create symbolic links."""
+        if self._can_symlink is None:
+            self._can_symlink = self._detect_symlink_support()
+        return self._can_symlink
+
+    def _detect_symlink_support(self) -> bool:
+        """Probe symlink support once; the answer does not change within a process."""
         if self.is_windows:
             # On Windows, symlinks require special permissions
             try:
                 import ctypes
-                return ctypes.windll.shell32.IsUserAnAdmin()
+                return bool(ctypes.windll.shell32.IsUserAnAdmin())
             except:
                 return False
         return True
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for SuperDots tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def checksum_cache_dir(tmp_path, monkeypatch):
+    """Keep ConfigManager checksum caches out of the real user cache directory."""
+    cache_dir = tmp_path / "user_cache"
+    monkeypatch.setattr("superdots.core.config._CHECKSUM_CACHE_DIR", cache_dir)
+    return cache_dir
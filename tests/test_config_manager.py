@@ -0,0 +1,658 @@
+#!/usr/bin/env python3
+"""
+Tests for ConfigManager deployment and lookup helpers.
+"""
+
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from superdots.core.config import ConfigManager, ConfigStatus
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    """Create a ConfigManager instance for testing."""
+    repo_path = tmp_path / "test_repo"
+    repo_path.mkdir()
+    return ConfigManager(repo_path)
+
+
+@pytest.fixture
+def home(tmp_path):
+    """Create a fake home directory with a couple of dotfiles."""
+    home = tmp_path / "home"
+    home.mkdir()
+    (home / ".bashrc").write_text("export A=1\n")
+    (home / ".vimrc").write_text("set number\n")
+    return home
+
+
+def add(config_manager, name, path):
+    """Add a single-platform configuration for the current platform."""
+    assert config_manager.add_config(
+        source_paths={config_manager.current_platform: path},
+        name=name,
+        use_symlink=False,
+    )
+
+
+class TestDeployConfigs:
+    """Test batched deployment."""
+
+    def test_deploy_configs_copies_all(self, config_manager, home):
+        """Test that every named configuration is deployed."""
+        add(config_manager, "bash", home / ".bashrc")
+        add(config_manager, "vim", home / ".vimrc")
+        (home / ".bashrc").unlink()
+        (home / ".vimrc").unlink()
+
+        results = config_manager.deploy_configs(["bash", "vim"])
+
+        assert results == {"bash": True, "vim": True}
+        assert (home / ".bashrc").read_text() == "export A=1\n"
+        assert (home / ".vimrc").read_text() == "set number\n"
+        assert config_manager.get_config("bash").status == ConfigStatus.TRACKED
+
+    def test_deploy_configs_respects_existing_targets(self, config_manager, home):
+        """Test that existing targets are kept unless forced."""
+        add(config_manager, "bash", home / ".bashrc")
+
+        assert config_manager.deploy_configs(["bash"]) == {"bash": False}
+        assert config_manager.deploy_configs(["bash"], force=True) == {"bash": True}
+
+    def test_deploy_configs_dangling_target_in_shared_directory(self, config_manager, home):
+        """Test that a broken link counts as missing, as it does for a single deploy."""
+        add(config_manager, "bash", home / ".bashrc")
+        add(config_manager, "vim", home / ".vimrc")
+        (home / ".bashrc").unlink()
+        (home / ".bashrc").symlink_to(home / "nowhere")
+        (home / ".vimrc").unlink()
+
+        assert config_manager.deploy_configs(["bash", "vim"]) == {"bash": True, "vim": True}
+        assert (home / ".bashrc").read_text() == "export A=1\n"
+
+    def test_deploy_configs_unknown_name(self, config_manager):
+        """Test that unknown names are reported as failures."""
+        assert config_manager.deploy_configs(["missing"]) == {"missing": False}
+
+    def test_deploy_configs_saves_index_once(self, config_manager, home):
+        """Test that the index is written once for the whole batch."""
+        add(config_manager, "bash", home / ".bashrc")
+        add(config_manager, "vim", home / ".vimrc")
+
+        with patch.object(config_manager, '_save_config_index') as mock_save:
+            config_manager.deploy_configs(["bash", "vim"], force=True)
+
+        assert mock_save.call_count == 1
+
+    def test_deploy_all_uses_batch(self, config_manager, home):
+        """Test that deploy_all counts batched results."""
+        add(config_manager, "bash", home / ".bashrc")
+        add(config_manager, "vim", home / ".vimrc")
+
+        assert config_manager.deploy_all(force=True) == 2
+
+
+class TestUpdateConfigs:
+    """Test batched updates from source locations."""
+
+    def test_update_configs_copies_changed_sources(self, config_manager, home):
+        """Test that changed sources are copied and unchanged ones succeed."""
+        add(config_manager, "bash", home / ".bashrc")
+        add(config_manager, "vim", home / ".vimrc")
+        (home / ".bashrc").write_text("export A=2\n")
+
+        results = config_manager.update_configs(["bash", "vim", "missing"])
+
+        assert results == {"bash": True, "vim": True, "missing": False}
+        assert config_manager.get_config("bash").repo_path.read_text() == "export A=2\n"
+
+    def test_update_directory_with_dangling_symlink(self, config_manager, home):
+        """Test that a broken link inside a config directory does not fail the update."""
+        nvim = home / ".config" / "nvim"
+        nvim.mkdir(parents=True)
+        (nvim / "init.lua").write_text("-- lua\n")
+        (nvim / "broken").symlink_to(home / "nowhere")
+        add(config_manager, "nvim", nvim)
+        (nvim / "init.lua").write_text("-- lua 2\n")
+
+        assert config_manager.update_configs(["nvim"]) == {"nvim": True}
+
+        stored = config_manager.get_config("nvim").repo_path
+        assert (stored / "init.lua").read_text() == "-- lua 2\n"
+        assert os.readlink(stored / "broken") == str(home / "nowhere")
+
+    def test_update_configs_saves_index_once(self, config_manager, home):
+        """Test that the index is written once for the whole batch."""
+        add(config_manager, "bash", home / ".bashrc")
+        add(config_manager, "vim", home / ".vimrc")
+        (home / ".bashrc").write_text("export A=2\n")
+        (home / ".vimrc").write_text("set nonumber\n")
+
+        with patch.object(config_manager, '_save_config_index') as mock_save:
+            config_manager.update_configs(["bash", "vim"])
+
+        assert mock_save.call_count == 1
+
+    def test_update_configs_unchanged_skips_save(self, config_manager, home):
+        """Test that nothing is written when every source is up to date."""
+        add(config_manager, "bash", home / ".bashrc")
+
+        with patch.object(config_manager, '_save_config_index') as mock_save:
+            assert config_manager.update_configs(["bash"]) == {"bash": True}
+
+        mock_save.assert_not_called()
+
+
+class TestConfigsByName:
+    """Test the name-keyed configuration view."""
+
+    def test_configs_by_name_tracks_changes(self, config_manager, home):
+        """Test that the view reflects later adds and removes."""
+        view = config_manager.configs_by_name()
+        assert len(view) == 0
+
+        add(config_manager, "bash", home / ".bashrc")
+        assert view["bash"] is config_manager.get_config("bash")
+
+        config_manager.remove_config("bash")
+        assert "bash" not in view
+
+    def test_configs_by_name_is_read_only(self, config_manager):
+        """Test that the view cannot be used to mutate the index."""
+        with pytest.raises(TypeError):
+            config_manager.configs_by_name()["x"] = None
+
+
+class TestCachedPathValues:
+    """Test the cached platform and path values on ConfigFile."""
+
+    def test_platform_values_follow_platform_changes(self, config_manager, home):
+        """Test that adding or removing a platform refreshes the cached names."""
+        from superdots.utils.platform import OSType
+
+        add(config_manager, "bash", home / ".bashrc")
+        config = config_manager.get_config("bash")
+        assert config.platform_values == (config_manager.current_platform.value,)
+
+        other = OSType.WINDOWS if config_manager.current_platform != OSType.WINDOWS else OSType.LINUX
+        config.add_source_path(other, home / ".bashrc")
+        assert other.value in config.platform_values
+
+        config.remove_source_path(other)
+        assert other.value not in config.platform_values
+
+    def test_reassigned_platforms_are_serialized(self, config_manager, home):
+        """Test that replacing the platforms list is reflected in to_dict()."""
+        from superdots.utils.platform import OSType
+
+        add(config_manager, "bash", home / ".bashrc")
+        config = config_manager.get_config("bash")
+        config.to_dict()
+
+        config.platforms = [OSType.LINUX, OSType.MACOS]
+
+        assert config.to_dict()['platforms'] == ['linux', 'darwin']
+        config.platforms.append(OSType.WINDOWS)
+        assert config.to_dict()['platforms'] == ['linux', 'darwin', 'windows']
+
+    def test_source_path_strs_follow_path_changes(self, config_manager, home):
+        """Test that updating a source path refreshes the cached strings."""
+        add(config_manager, "bash", home / ".bashrc")
+        config = config_manager.get_config("bash")
+        platform = config_manager.current_platform
+        assert config.source_path_strs[platform] == str(home / ".bashrc")
+
+        config.add_source_path(platform, home / ".bash_profile")
+        assert config.source_path_strs[platform] == str(home / ".bash_profile")
+
+    def test_source_path_strs_follow_reassignment(self, config_manager, home):
+        """Test that replacing the source_paths dict refreshes the cached strings."""
+        add(config_manager, "bash", home / ".bashrc")
+        config = config_manager.get_config("bash")
+        platform = config_manager.current_platform
+        assert config.source_path_strs[platform] == str(home / ".bashrc")
+
+        config.source_paths = {platform: home / ".bash_profile"}
+
+        assert config.source_path_strs == {platform: str(home / ".bash_profile")}
+
+    def test_config_file_uses_slots(self, config_manager, home):
+        """Test that ConfigFile instances carry no per-instance __dict__."""
+        import copy
+
+        add(config_manager, "bash", home / ".bashrc")
+        config = config_manager.get_config("bash")
+
+        assert not hasattr(config, '__dict__')
+        with pytest.raises(AttributeError):
+            config.unknown = True
+        assert copy.deepcopy(config) == config
+
+
+class TestChecksums:
+    """Test checksum calculation and comparison."""
+
+    def test_directory_checksum_is_deterministic(self, config_manager, tmp_path):
+        """Test that directory checksums depend only on names and contents."""
+        tree = tmp_path / "tree"
+        (tree / "sub").mkdir(parents=True)
+        (tree / "a.conf").write_text("a\n")
+        (tree / "sub" / "b.conf").write_text("b\n")
+
+        checksum = config_manager._calculate_checksum(tree)
+        assert checksum == config_manager._calculate_checksum(tree)
+
+        (tree / "sub" / "b.conf").write_text("changed\n")
+        assert checksum != config_manager._calculate_checksum(tree)
+
+    def test_md5_checksums_still_match(self, config_manager, home):
+        """Test that unprefixed MD5 checksums from older indexes are honoured."""
+        legacy = config_manager._calculate_checksum(home / ".bashrc", 'md5')
+
+        assert ":" not in legacy
+        assert config_manager._matches_checksum(home / ".bashrc", legacy)
+        assert not config_manager._matches_checksum(home / ".vimrc", legacy)
+
+    def test_md5_checksum_matches_file_contents(self, config_manager, tmp_path):
+        """Test that mapped and empty files hash to their plain MD5 digests."""
+        import hashlib
+
+        large = tmp_path / "large"
+        large.write_bytes(b"x" * 100000)
+        empty = tmp_path / "empty"
+        empty.write_bytes(b"")
+
+        assert config_manager._calculate_checksum(large, 'md5') == hashlib.md5(b"x" * 100000).hexdigest()
+        assert config_manager._calculate_checksum(empty, 'md5') == hashlib.md5().hexdigest()
+
+    def test_blake3_checksum_is_prefixed(self, config_manager, home):
+        """Test that BLAKE3 checksums are tagged with their algorithm."""
+        pytest.importorskip("blake3")
+
+        checksum = config_manager._calculate_checksum(home / ".bashrc", 'blake3')
+
+        assert checksum.startswith("blake3:")
+        assert config_manager._matches_checksum(home / ".bashrc", checksum)
+
+    def test_blake3_directory_checksum_combines_file_digests(self, config_manager, tmp_path):
+        """Test that parallel directory hashing combines digests in walk order."""
+        blake3 = pytest.importorskip("blake3")
+
+        tree = tmp_path / "tree"
+        (tree / "sub").mkdir(parents=True)
+        for index in range(20):
+            (tree / f"f{index:02d}.conf").write_text(f"{index}\n")
+        (tree / "sub" / "z.conf").write_text("z\n")
+
+        expected = blake3.blake3()
+        for rel_path in sorted(f"f{index:02d}.conf" for index in range(20)) + ["sub/z.conf"]:
+            expected.update(rel_path.encode())
+            expected.update(blake3.blake3((tree / rel_path).read_bytes()).digest())
+
+        assert config_manager._calculate_checksum(tree, 'blake3') == "blake3:" + expected.hexdigest()
+
+
+class TestChecksumCache:
+    """Test reuse of checksums for unchanged paths."""
+
+    @staticmethod
+    def settle(path):
+        """Backdate a path so its checksum is eligible for caching."""
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    def test_unchanged_file_is_not_rehashed(self, config_manager, home):
+        """Test that a cached checksum is returned without hashing again."""
+        self.settle(home / ".bashrc")
+        checksum = config_manager._cached_checksum(home / ".bashrc")
+
+        with patch.object(config_manager, '_calculate_checksum') as mock_calc:
+            assert config_manager._cached_checksum(home / ".bashrc") == checksum
+
+        mock_calc.assert_not_called()
+
+    def test_modified_file_is_rehashed(self, config_manager, home):
+        """Test that a size or mtime change invalidates the cached checksum."""
+        self.settle(home / ".bashrc")
+        checksum = config_manager._cached_checksum(home / ".bashrc")
+
+        (home / ".bashrc").write_text("export A=2\n")
+
+        assert config_manager._cached_checksum(home / ".bashrc") != checksum
+
+    def test_directory_change_invalidates_cache(self, config_manager, tmp_path):
+        """Test that adding a file to a directory changes its cache key."""
+        tree = tmp_path / "tree"
+        tree.mkdir()
+        (tree / "a.conf").write_text("a\n")
+        self.settle(tree / "a.conf")
+        self.settle(tree)
+        checksum = config_manager._cached_checksum(tree)
+
+        (tree / "b.conf").write_text("b\n")
+
+        assert config_manager._cached_checksum(tree) != checksum
+
+    def test_cache_persists_with_index(self, config_manager, home):
+        """Test that cached checksums are saved and reloaded."""
+        self.settle(home / ".bashrc")
+        checksum = config_manager._cached_checksum(home / ".bashrc")
+        config_manager._save_config_index()
+
+        reloaded = ConfigManager(config_manager.repo_path)
+
+        assert reloaded._checksum_cache[str(home / ".bashrc")][3] == checksum
+
+    def test_cache_kept_outside_repository(self, config_manager, home, checksum_cache_dir):
+        """Test that the machine-specific cache is never written into the synced repo."""
+        self.settle(home / ".bashrc")
+        config_manager._cached_checksum(home / ".bashrc")
+        config_manager._save_config_index()
+
+        assert config_manager.checksum_cache_file.parent == checksum_cache_dir
+        assert config_manager.checksum_cache_file.exists()
+        assert not list(config_manager.repo_path.rglob("checksum*"))
+
+
+class TestConfigIndex:
+    """Test persistence of the configuration index."""
+
+    def test_index_round_trips(self, config_manager, home):
+        """Test that the index stays plain JSON and reloads every config."""
+        import json
+
+        add(config_manager, "bash", home / ".bashrc")
+
+        data = json.loads(config_manager.config_index_file.read_text(encoding='utf-8'))
+        reloaded = ConfigManager(config_manager.repo_path)
+
+        assert list(data['configs']) == ["bash"]
+        assert reloaded.get_config("bash").to_dict() == config_manager.get_config("bash").to_dict()
+
+    def test_index_matches_indented_json(self, config_manager, home):
+        """Test that the streamed index is byte-for-byte indented JSON."""
+        import json
+
+        add(config_manager, "bash", home / ".bashrc")
+        add(config_manager, "vïm", home / ".vimrc")
+        config_manager.get_config("bash").template_vars = {"k": [1, {}], "e": []}
+        config_manager._save_config_index()
+
+        raw = config_manager.config_index_file.read_text(encoding='utf-8')
+
+        assert raw == json.dumps(json.loads(raw), indent=2, ensure_ascii=False)
+        assert not list(config_manager.config_index_file.parent.glob("*.tmp"))
+
+    def test_save_reserializes_only_changed_configs(self, config_manager, home):
+        """Test that unchanged configs reuse their serialized index entries."""
+        from superdots.core.config import ConfigFile
+
+        add(config_manager, "bash", home / ".bashrc")
+        add(config_manager, "vim", home / ".vimrc")
+        config_manager.get_config("vim").description = "editor"
+
+        with patch.object(ConfigFile, 'to_dict', autospec=True, side_effect=ConfigFile.to_dict) as mock_to_dict:
+            config_manager._save_config_index()
+
+        assert [call.args[0].name for call in mock_to_dict.call_args_list] == ["vim"]
+        assert ConfigManager(config_manager.repo_path).get_config("vim").description == "editor"
+
+    def test_in_place_edits_are_saved(self, config_manager, home):
+        """Test that editing a returned config's mutable fields reaches the index."""
+        add(config_manager, "bash", home / ".bashrc")
+        config_manager._save_config_index()
+
+        config_manager.get_config("bash").tags.append("work")
+        config_manager._save_config_index()
+        config_manager.list_configs()[0].template_vars = {"user": "me"}
+        config_manager._save_config_index()
+
+        reloaded = ConfigManager(config_manager.repo_path).get_config("bash")
+        assert reloaded.tags == ["work"]
+        assert reloaded.template_vars == {"user": "me"}
+
+    def test_internal_changes_reserialize_only_that_config(self, config_manager, home):
+        """Test that manager-side changes drop just the changed config's cached entry."""
+        from superdots.core.config import ConfigFile
+
+        add(config_manager, "bash", home / ".bashrc")
+        add(config_manager, "vim", home / ".vimrc")
+
+        with patch.object(ConfigFile, 'to_dict', autospec=True, side_effect=ConfigFile.to_dict) as mock_to_dict:
+            assert config_manager.deploy_configs(["vim"], force=True) == {"vim": True}
+
+        assert [call.args[0].name for call in mock_to_dict.call_args_list] == ["vim"]
+
+    def test_to_dict_lists_every_field(self, config_manager, home):
+        """Test that to_dict keeps field order and returns independent values."""
+        from dataclasses import fields
+        from superdots.core.config import ConfigFile
+
+        add(config_manager, "bash", home / ".bashrc")
+        config = config_manager.get_config("bash")
+        config.template_vars = {"shell": {"name": "bash"}}
+
+        data = config.to_dict()
+        data['tags'].append("changed")
+        data['template_vars']['shell']['name'] = "zsh"
+
+        assert list(data) == [field.name for field in fields(ConfigFile)]
+        assert data['repo_path'] == str(config.repo_path)
+        assert config.tags == []
+        assert config.template_vars == {"shell": {"name": "bash"}}
+
+    def test_home_relative_paths_expand_on_load(self, config_manager, home):
+        """Test that '~/' paths in the index load under the home directory."""
+        from superdots.core.config import ConfigFile
+        from superdots.utils.platform import platform_detector
+
+        add(config_manager, "bash", home / ".bashrc")
+        data = config_manager.get_config("bash").to_dict()
+        data['source_paths'] = {config_manager.current_platform.value: "~/.bashrc"}
+        data['backup_path'] = "~"
+
+        config = ConfigFile.from_dict(data)
+
+        assert config.get_source_path(config_manager.current_platform) == platform_detector.home_dir / ".bashrc"
+        assert config.backup_path == Path.home()
+
+    def test_unknown_enum_value_skips_only_that_config(self, config_manager, home):
+        """Test that a config with an unrecognised platform is skipped on load."""
+        import json
+
+        add(config_manager, "bash", home / ".bashrc")
+        add(config_manager, "vim", home / ".vimrc")
+        data = json.loads(config_manager.config_index_file.read_text(encoding='utf-8'))
+        data['configs']['vim']['platforms'] = ["amiga"]
+        config_manager.config_index_file.write_text(json.dumps(data), encoding='utf-8')
+
+        reloaded = ConfigManager(config_manager.repo_path)
+
+        assert list(reloaded.configs_by_name()) == ["bash"]
+
+    def test_timestamps_reformatted_only_when_changed(self, config_manager, home):
+        """Test that cached ISO timestamps track reassigned datetimes."""
+        from datetime import datetime
+
+        add(config_manager, "bash", home / ".bashrc")
+        config = ConfigManager(config_manager.repo_path).get_config("bash")
+        created_at = config.to_dict()['created_at']
+
+        config.updated_at = datetime(2024, 1, 2, 3, 4, 5)
+        data = config.to_dict()
+
+        assert data['created_at'] == created_at
+        assert data['updated_at'] == "2024-01-02T03:04:05"
+
+
+class TestDetectConfigType:
+    """Test configuration type detection."""
+
+    def test_template_markers_detected(self, config_manager, tmp_path):
+        """Test that template markers near the top mark a template."""
+        path = tmp_path / "gitconfig"
+        path.write_text("[user]\n    name = {{ name }}\n")
+
+        assert config_manager._detect_config_type(path).value == "template"
+
+    def test_markers_past_scanned_prefix_ignored(self, config_manager, tmp_path):
+        """Test that only the head of a large file is scanned for markers."""
+        path = tmp_path / "large.conf"
+        path.write_bytes(b"x" * 70000 + b"{{ late }}")
+
+        assert config_manager._detect_config_type(path).value == "dotfile"
+
+
+class TestCheckStatus:
+    """Test status checks."""
+
+    def test_check_status_reports_changes(self, config_manager, home):
+        """Test that edited and deleted sources are reported."""
+        add(config_manager, "bash", home / ".bashrc")
+        add(config_manager, "vim", home / ".vimrc")
+        (home / ".bashrc").write_text("export A=22\n")
+        (home / ".vimrc").unlink()
+
+        status = config_manager.check_status()
+
+        assert status['modified'] == ["bash"]
+        assert status['missing'] == ["vim"]
+
+    def test_check_status_detects_same_size_edits(self, config_manager, home):
+        """Test that edits keeping the file size are still found by hashing."""
+        add(config_manager, "bash", home / ".bashrc")
+        (home / ".bashrc").write_text("export A=2\n")
+
+        assert config_manager.check_status()['modified'] == ["bash"]
+
+    def test_check_status_skips_save_when_unchanged(self, config_manager, home):
+        """Test that the index is only rewritten when a status changes."""
+        add(config_manager, "bash", home / ".bashrc")
+
+        with patch.object(config_manager, '_save_config_index') as mock_save:
+            assert config_manager.check_status()['tracked'] == ["bash"]
+            mock_save.assert_not_called()
+
+            (home / ".bashrc").write_text("changed\n")
+            config_manager.check_status()
+            mock_save.assert_called_once()
+
+
+class TestGetStats:
+    """Test aggregate statistics."""
+
+    def test_get_stats_counts(self, config_manager, home):
+        """Test counts by type, platform and status and the latest update."""
+        assert config_manager.get_stats() == {
+            'total_configs': 0,
+            'by_type': {},
+            'by_platform': {},
+            'by_status': {},
+            'last_updated': None,
+        }
+
+        add(config_manager, "bash", home / ".bashrc")
+        add(config_manager, "vim", home / ".vimrc")
+        config_manager.get_config("vim").status = ConfigStatus.MODIFIED
+
+        stats = config_manager.get_stats()
+        platform = config_manager.current_platform.value
+
+        assert stats['total_configs'] == 2
+        assert stats['by_type'] == {"dotfile": 2}
+        assert stats['by_platform'] == {platform: 2}
+        assert stats['by_status'] == {"tracked": 1, "modified": 1}
+        assert stats['last_updated'] == max(c.updated_at for c in config_manager.list_configs())
+
+
+class TestBatch:
+    """Test deferred index writes."""
+
+    def test_batch_writes_index_once(self, config_manager, home):
+        """Test that several platform paths are saved with a single write."""
+        from superdots.utils.platform import OSType
+
+        add(config_manager, "bash", home / ".bashrc")
+        others = [p for p in (OSType.LINUX, OSType.MACOS, OSType.WINDOWS) if p != config_manager.current_platform]
+
+        with patch.object(ConfigManager, '_write_index', autospec=True,
+                          side_effect=ConfigManager._write_index) as mock_write:
+            with config_manager.batch():
+                with config_manager.batch():
+                    for platform in others:
+                        assert config_manager.add_platform_path("bash", platform, home / ".bashrc")
+                mock_write.assert_not_called()
+
+        assert mock_write.call_count == 1
+        reloaded = ConfigManager(config_manager.repo_path)
+        assert set(others) <= set(reloaded.get_config("bash").platforms)
+
+    def test_batch_saves_when_block_raises(self, config_manager, home):
+        """Test that deferred changes are still written if the block fails."""
+        add(config_manager, "bash", home / ".bashrc")
+
+        with pytest.raises(RuntimeError):
+            with config_manager.batch():
+                config_manager.get_config("bash").description = "changed"
+                config_manager._save_config_index()
+                raise RuntimeError("boom")
+
+        assert ConfigManager(config_manager.repo_path).get_config("bash").description == "changed"
+
+    def test_flush_writes_inside_batch(self, config_manager, home):
+        """Test that flush() forces pending changes out during a batch."""
+        add(config_manager, "bash", home / ".bashrc")
+
+        with config_manager.batch():
+            config_manager.get_config("bash").description = "flushed"
+            config_manager._save_config_index()
+            config_manager.flush()
+
+            assert ConfigManager(config_manager.repo_path).get_config("bash").description == "flushed"
+
+    def test_batch_shares_updated_at(self, config_manager, home):
+        """Test that changes inside a batch get one timestamp."""
+        from superdots.utils.platform import OSType
+
+        for name in ("bash", "zsh"):
+            (home / f".{name}rc").write_text(f"# {name}\n")
+            add(config_manager, name, home / f".{name}rc")
+        other = next(p for p in (OSType.LINUX, OSType.MACOS) if p != config_manager.current_platform)
+
+        with config_manager.batch():
+            for name in ("bash", "zsh"):
+                assert config_manager.add_platform_path(name, other, home / f".{name}rc")
+
+        bash, zsh = config_manager.get_config("bash"), config_manager.get_config("zsh")
+        assert bash.updated_at == zsh.updated_at
+        assert bash.updated_at > bash.created_at
+        assert config_manager._batch_time is None
+
+
+class TestListPlatformPaths:
+    """Test listing of per-platform source paths."""
+
+    def test_list_platform_paths_reports_existence(self, config_manager, home):
+        """Test shared-parent and standalone paths alike."""
+        from superdots.utils.platform import OSType
+
+        platforms = [OSType.LINUX, OSType.MACOS, OSType.WINDOWS]
+        (home / "sub").mkdir()
+        (home / "sub" / "init.vim").write_text("set nu\n")
+        paths = {
+            platforms[0]: home / ".bashrc",
+            platforms[1]: home / ".missing",
+            platforms[2]: home / "sub" / "init.vim",
+        }
+        assert config_manager.add_config(source_paths=paths, name="multi", use_symlink=False)
+
+        listed = config_manager.list_platform_paths("multi")
+
+        assert listed == {
+            platforms[0]: (home / ".bashrc", True),
+            platforms[1]: (home / ".missing", False),
+            platforms[2]: (home / "sub" / "init.vim", True),
+        }
+        assert config_manager.list_platform_paths("unknown") == {}
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Tests for GitHandler read-only queries.
+"""
+
+import shutil
+import pytest
+
+from superdots.core import git_handler
+from superdots.core.git_handler import GitError, GitHandler
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git executable not available")
+
+
+@pytest.fixture
+def git_env(monkeypatch):
+    """Provide a commit identity so no global git config is needed."""
+    for var in ('GIT_AUTHOR_NAME', 'GIT_COMMITTER_NAME'):
+        monkeypatch.setenv(var, "SuperDots Test")
+    for var in ('GIT_AUTHOR_EMAIL', 'GIT_COMMITTER_EMAIL'):
+        monkeypatch.setenv(var, "test@example.com")
+
+
+@pytest.fixture
+def subprocess_handler(tmp_path, monkeypatch, git_env):
+    """Create a GitHandler that uses the git executable instead of GitPython."""
+    monkeypatch.setattr(git_handler, 'HAS_GITPYTHON', False)
+    handler = GitHandler(tmp_path / "repo")
+    yield handler
+    handler.close()
+
+
+class TestBatchLookups:
+    """Test lookups through the persistent git process."""
+
+    def test_resolve_object_reuses_one_process(self, subprocess_handler):
+        """Test that repeated lookups share a single worker."""
+        head = subprocess_handler._resolve_object('HEAD')
+        worker = subprocess_handler._git_proc
+
+        assert head is not None and head[1] == 'commit'
+        assert subprocess_handler._resolve_object('HEAD^{tree}')[1] == 'tree'
+        assert subprocess_handler._resolve_object('no-such-branch') is None
+        assert subprocess_handler._git_proc is worker
+
+    def test_close_stops_worker(self, subprocess_handler):
+        """Test that close() terminates the worker and a new lookup restarts it."""
+        subprocess_handler._resolve_object('HEAD')
+        worker = subprocess_handler._git_proc
+
+        subprocess_handler.close()
+
+        assert worker.poll() is not None
+        assert subprocess_handler._resolve_object('HEAD') is not None
+
+    def test_properties_without_gitpython(self, subprocess_handler):
+        """Test the fallback properties on a fresh repository."""
+        assert subprocess_handler.is_valid_repo
+        assert subprocess_handler.current_branch == subprocess_handler._run_git_command(['branch', '--show-current'])
+
+    def test_lookup_outside_repository_fails(self, subprocess_handler, tmp_path, monkeypatch):
+        """Test that a lookup in a non-repository raises GitError."""
+        monkeypatch.setenv('GIT_CEILING_DIRECTORIES', str(tmp_path))
+        shutil.rmtree(subprocess_handler.repo_path / '.git')
+        subprocess_handler.close()
+
+        with pytest.raises(GitError):
+            subprocess_handler._resolve_object('HEAD')
+        assert not subprocess_handler.is_valid_repo
+        assert not subprocess_handler.is_dirty
+        assert not subprocess_handler.has_conflicts()
+        assert subprocess_handler.remotes == []
+
+    def test_detached_head_with_gitpython(self, tmp_path, git_env):
+        """Test that a detached HEAD reports the default branch name."""
+        pytest.importorskip("git")
+        handler = GitHandler(tmp_path / "repo")
+        handler._run_git_command(['checkout', '--detach'])
+        handler.invalidate_cache()
+
+        assert handler.current_branch == "main"
+
+
+class TestQueryCache:
+    """Test caching of read-only queries."""
+
+    def test_status_queries_share_one_command(self, subprocess_handler, monkeypatch):
+        """Test that is_dirty, has_conflicts and get_status run git status once."""
+        (subprocess_handler.repo_path / "new.txt").write_text("x\n")
+        subprocess_handler.invalidate_cache()
+        calls = []
+        stream = GitHandler._stream_git_command
+
+        def counting_stream(self, args, sep=b'\0'):
+            calls.append(args)
+            return stream(self, args, sep)
+
+        monkeypatch.setattr(GitHandler, '_stream_git_command', counting_stream)
+
+        assert subprocess_handler.is_dirty
+        assert not subprocess_handler.has_conflicts()
+        assert subprocess_handler.get_status()['untracked'] == ["new.txt"]
+        assert calls == [['status', '--porcelain=v2', '-z']]
+
+    def test_mutations_invalidate_cache(self, subprocess_handler):
+        """Test that committing refreshes cached status."""
+        (subprocess_handler.repo_path / "new.txt").write_text("x\n")
+        subprocess_handler.invalidate_cache()
+        assert subprocess_handler.is_dirty
+
+        subprocess_handler.add_all()
+        subprocess_handler.commit("Add new.txt")
+
+        assert not subprocess_handler.is_dirty
+
+    def test_remotes_returns_fresh_list(self, subprocess_handler):
+        """Test that callers cannot modify the cached remote names."""
+        subprocess_handler.add_remote('origin', "https://example.com/dots.git")
+
+        subprocess_handler.remotes.append("bogus")
+
+        assert subprocess_handler.remotes == ["origin"]
+
+
+class TestStatusSnapshot:
+    """Test parsing of porcelain v2 status output."""
+
+    def test_snapshot_classifies_changes(self, subprocess_handler):
+        """Test staged, modified, renamed and untracked paths, including spaces."""
+        repo = subprocess_handler.repo_path
+        (repo / "tracked file.txt").write_text("one\n")
+        (repo / "old.txt").write_text("rename me\n")
+        subprocess_handler.add_all()
+        subprocess_handler.commit("Add files")
+
+        (repo / "tracked file.txt").write_text("two\n")
+        subprocess_handler._run_git_command(['mv', 'old.txt', 'new name.txt'])
+        (repo / "untracked.txt").write_text("?\n")
+        subprocess_handler.invalidate_cache()
+
+        status = subprocess_handler.get_status()
+
+        assert status == {
+            'staged': ["new name.txt"],
+            'modified': ["tracked file.txt"],
+            'untracked': ["untracked.txt"],
+        }
+        assert not subprocess_handler.has_conflicts()
+
+    def test_get_status_with_gitpython(self, tmp_path, git_env):
+        """Test that the GitPython backend reports status from the same snapshot."""
+        pytest.importorskip("git")
+        handler = GitHandler(tmp_path / "repo")
+        assert handler.repo is not None
+        (handler.repo_path / "README.md").write_text("changed\n")
+        (handler.repo_path / "staged.txt").write_text("new\n")
+        handler.add_file(handler.repo_path / "staged.txt")
+        (handler.repo_path / "untracked.txt").write_text("?\n")
+
+        assert handler.get_status() == {
+            'staged': ["staged.txt"],
+            'modified': ["README.md"],
+            'untracked': ["untracked.txt"],
+        }
+
+    def test_snapshot_reports_conflicts(self, subprocess_handler):
+        """Test that unmerged paths are reported as conflicts."""
+        repo = subprocess_handler.repo_path
+        base = subprocess_handler.current_branch
+        (repo / "shared.txt").write_text("base\n")
+        subprocess_handler.add_all()
+        subprocess_handler.commit("Base")
+
+        subprocess_handler.create_branch("other")
+        (repo / "shared.txt").write_text("other\n")
+        subprocess_handler.add_all()
+        subprocess_handler.commit("Other")
+        subprocess_handler.checkout_branch(base)
+        (repo / "shared.txt").write_text("mine\n")
+        subprocess_handler.add_all()
+        subprocess_handler.commit("Mine")
+
+        with pytest.raises(GitError):
+            subprocess_handler._run_git_command(['merge', 'other'])
+        subprocess_handler.invalidate_cache()
+
+        assert subprocess_handler.has_conflicts()
+        assert subprocess_handler.is_dirty
+
+    def test_records_spanning_reads(self, subprocess_handler):
+        """Test that output larger than one pipe read is split into whole records."""
+        names = sorted(f"{'x' * 60}-{i:04d}.txt" for i in range(2000))
+        for name in names:
+            (subprocess_handler.repo_path / name).touch()
+        subprocess_handler.invalidate_cache()
+
+        assert subprocess_handler.get_status()['untracked'] == names
+
+    def test_stream_failure_raises(self, subprocess_handler):
+        """Test that a failing streamed command raises GitError."""
+        with pytest.raises(GitError):
+            list(subprocess_handler._stream_git_command(['log', 'no-such-branch']))
+
+
+class TestInitialStructure:
+    """Test creation of a new repository."""
+
+    def test_initial_commit_tracks_structure(self, subprocess_handler):
+        """Test that the skeleton files are committed and the tree is clean."""
+        tracked = subprocess_handler._run_git_command(['ls-files']).split('\n')
+
+        assert {"README.md", ".gitignore", "configs/.gitkeep", "backups/.gitkeep"} <= set(tracked)
+        assert not subprocess_handler.is_dirty
+
+    def test_existing_files_are_kept(self, tmp_path, monkeypatch, git_env):
+        """Test that an existing README is committed as-is, not replaced."""
+        monkeypatch.setattr(git_handler, 'HAS_GITPYTHON', False)
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / "README.md").write_text("my dotfiles\n")
+
+        handler = GitHandler(repo)
+        handler.close()
+
+        assert (repo / "README.md").read_text() == "my dotfiles\n"
+        assert handler._run_git_command(['show', 'HEAD:README.md']) == "my dotfiles"
+
+
+class TestCloneRepository:
+    """Test cloning and refreshing clones."""
+
+    @pytest.fixture
+    def remote(self, tmp_path, monkeypatch, git_env):
+        """Create a source repository to clone from."""
+        monkeypatch.setattr(git_handler, 'HAS_GITPYTHON', False)
+        handler = GitHandler(tmp_path / "remote")
+        (handler.repo_path / "dotfile").write_text("v1\n")
+        handler.add_all()
+        handler.commit("v1")
+        handler.close()
+        return handler
+
+    @pytest.mark.parametrize('use_gitpython', [False, True])
+    def test_clone_new_target(self, remote, subprocess_handler, tmp_path, monkeypatch, use_gitpython):
+        """Test a fresh clone with either backend."""
+        monkeypatch.setattr(git_handler, 'HAS_GITPYTHON', use_gitpython and git_handler.Repo is not None)
+        url = remote.repo_path.as_uri()
+
+        assert subprocess_handler.clone_repository(url, tmp_path / "clone", shallow=True)
+        assert (tmp_path / "clone" / "dotfile").read_text() == "v1\n"
+
+    def test_existing_clone_is_updated_in_place(self, remote, subprocess_handler, tmp_path):
+        """Test that re-cloning the same URL fetches instead of deleting the clone."""
+        url = remote.repo_path.as_uri()
+        target = tmp_path / "clone"
+        assert subprocess_handler.clone_repository(url, target)
+        marker = target / ".git" / "marker"
+        marker.write_text("kept\n")
+        (target / "stray.txt").write_text("untracked\n")
+
+        (remote.repo_path / "dotfile").write_text("v2\n")
+        remote.add_all()
+        remote.commit("v2")
+
+        assert subprocess_handler.clone_repository(url, target)
+        assert (target / "dotfile").read_text() == "v2\n"
+        assert marker.exists()
+        assert not (target / "stray.txt").exists()
+
+
+class TestFetchAll:
+    """Test fetching several remotes."""
+
+    def test_fetch_all_reports_each_remote(self, subprocess_handler, tmp_path):
+        """Test that every remote is fetched and failures are reported per remote."""
+        for name in ("one", "two"):
+            remote = GitHandler(tmp_path / name)
+            (remote.repo_path / "dotfile").write_text(f"{name}\n")
+            remote.add_all()
+            remote.commit(name)
+            remote.close()
+            subprocess_handler.add_remote(name, remote.repo_path.as_uri())
+        subprocess_handler.add_remote("broken", (tmp_path / "missing").as_uri())
+
+        assert subprocess_handler.fetch_all() == {"broken": False, "one": True, "two": True}
+        for name in ("one", "two"):
+            assert subprocess_handler._resolve_object(f"refs/remotes/{name}/{subprocess_handler.current_branch}")
+
+
+class TestGetCommits:
+    """Test commit history listing."""
+
+    def test_get_commits_matches_gitpython_fields(self, subprocess_handler):
+        """Test that log parsing reports what GitPython's Commit objects did."""
+        repo_module = pytest.importorskip("git")
+        (subprocess_handler.repo_path / "a.txt").write_text("a\n")
+        subprocess_handler.add_all()
+        subprocess_handler.commit("Subject | with bar\n\nBody line")
+
+        commits = subprocess_handler.get_commits(max_count=1)
+        head = repo_module.Repo(subprocess_handler.repo_path).head.commit
+
+        assert commits == [{
+            'hash': head.hexsha[:8],
+            'message': head.message.strip(),
+            'author': str(head.author),
+            'date': head.committed_datetime.isoformat(),
+        }]
+        assert len(subprocess_handler.get_commits()) == 2
+
+
+class TestCommit:
+    """Test committing without GitPython."""
+
+    def test_fast_commit_updates_branch(self, subprocess_handler):
+        """Test that a plumbing commit advances the branch with the right parent and author."""
+        parent = subprocess_handler._resolve_object('HEAD')[0]
+        (subprocess_handler.repo_path / "a.txt").write_text("a\n")
+        subprocess_handler.add_all()
+
+        assert subprocess_handler.commit("Add a", author_name="Someone", author_email="someone@example.com")
+
+        run = subprocess_handler._run_git_command
+        assert run(['log', '-1', '--format=%P|%an|%ae|%s']) == f"{parent}|Someone|someone@example.com|Add a"
+        assert run(['reflog', '-1', '--format=%gs']) == "commit: Add a"
+        assert not subprocess_handler.is_dirty
+
+    def test_nothing_to_commit(self, subprocess_handler):
+        """Test that committing an unchanged index succeeds without a new commit."""
+        head = subprocess_handler._resolve_object('HEAD')
+
+        assert subprocess_handler.commit("Nothing")
+        assert subprocess_handler.commit("Nothing", fast_commit=False)
+        assert subprocess_handler._resolve_object('HEAD') == head
+
+    @pytest.mark.parametrize("fast_commit, runs_hook", [(True, False), (False, True)])
+    def test_hooks(self, subprocess_handler, fast_commit, runs_hook):
+        """Test that only the porcelain path runs commit hooks."""
+        marker = subprocess_handler.repo_path / "hook-ran"
+        hook = subprocess_handler.repo_path / ".git" / "hooks" / "post-commit"
+        hook.write_text(f"#!/bin/sh\ntouch '{marker}'\n")
+        hook.chmod(0o755)
+        (subprocess_handler.repo_path / "a.txt").write_text("a\n")
+        subprocess_handler.add_all()
+
+        assert subprocess_handler.commit("Add a", fast_commit=fast_commit)
+        assert marker.exists() == runs_hook
+        assert subprocess_handler._run_git_command(['log', '-1', '--format=%s']) == "Add a"
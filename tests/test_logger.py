@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests for logging utilities.
+"""
+
+import logging
+import logging.handlers
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+from superdots.utils import logger as logger_module
+
+from superdots.utils.logger import CachedSizeRotatingFileHandler, SuperDotsLogger, get_logger
+
+
+class TestQueueLogging:
+    """Test that file records go through the shared listener thread."""
+
+    def test_logger_has_console_and_queue_handlers(self):
+        """Test that a new logger writes the console directly and queues file records."""
+        logger = get_logger('queue_only')
+
+        assert logger.logger.handlers == [SuperDotsLogger._console_handler, SuperDotsLogger._queue_handler]
+        assert isinstance(logger.logger.handlers[1], logging.handlers.QueueHandler)
+
+    def test_console_handler_not_on_listener(self):
+        """Test that console output is not deferred to the listener thread."""
+        get_logger()
+
+        assert SuperDotsLogger._console_handler not in SuperDotsLogger._listener.handlers
+
+    def test_child_logger_relies_on_parent_handlers(self):
+        """Test that superdots.* loggers propagate instead of logging twice."""
+        logger = get_logger('superdots.tests.child')
+        get_logger()
+
+        assert logger.logger.handlers == []
+        assert SuperDotsLogger._console_handler in logging.getLogger('superdots').handlers
+
+    def test_loggers_share_one_listener(self):
+        """Test that separate loggers reuse the same listener and queue."""
+        first = get_logger('tests_first')
+        second = get_logger('tests_second')
+
+        assert SuperDotsLogger._listener is not None
+        assert first.logger.handlers[1].queue is second.logger.handlers[1].queue
+        assert first.logger.handlers[1].queue is SuperDotsLogger._log_queue
+
+    def test_records_reach_listener_handlers(self):
+        """Test that records are delivered by the listener thread."""
+        logger = get_logger('superdots.tests.delivery')
+        records = []
+
+        class _Collect(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+
+        collector = _Collect()
+        listener = SuperDotsLogger._listener
+        original = listener.handlers
+        listener.handlers = original + (collector,)
+        try:
+            logger.warning("queued %s", "message")
+            listener.stop()
+            listener.start()
+        finally:
+            listener.handlers = original
+
+        assert [record.getMessage() for record in records] == ["queued message"]
+
+
+class TestGetLogger:
+    """Test logger memoization and the module-level shortcuts."""
+
+    def test_get_logger_returns_same_instance(self):
+        """Test that repeated lookups reuse the cached logger."""
+        assert get_logger('superdots.tests.cached') is get_logger('superdots.tests.cached')
+        assert get_logger('superdots.tests.cached') is not get_logger('superdots.tests.other')
+
+    def test_convenience_functions_use_default_logger(self):
+        """Test that module-level helpers log through the default logger."""
+        with patch.object(get_logger(), 'info') as mock_info:
+            logger_module.info("hello %s", "world")
+
+        mock_info.assert_called_once_with("hello %s", "world")
+
+    def test_import_does_not_start_logging(self, tmp_path):
+        """Test that importing the module leaves handlers and log files alone."""
+        code = (
+            "import superdots.utils.logger as logger\n"
+            "assert logger.SuperDotsLogger._console_handler is None\n"
+            "assert logger.SuperDotsLogger._listener is None\n"
+        )
+        env = dict(os.environ, HOME=str(tmp_path), PYTHONPATH=os.pathsep.join(sys.path))
+
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+        assert not (tmp_path / ".config").exists()
+
+
+class TestCachedSizeRotatingFileHandler:
+    """Test rollover decisions made from the cached file size."""
+
+    @staticmethod
+    def _record(message):
+        return logging.makeLogRecord({'msg': message, 'levelno': logging.INFO, 'levelname': 'INFO'})
+
+    def test_size_starts_from_existing_file(self, tmp_path):
+        """Test that an existing log file's size is picked up on open."""
+        log_file = tmp_path / "app.log"
+        log_file.write_text("x" * 40)
+
+        handler = CachedSizeRotatingFileHandler(log_file, maxBytes=100, backupCount=1)
+        try:
+            assert handler._cached_size == 40
+            handler.emit(self._record("a" * 9))
+            assert handler._cached_size == 50
+        finally:
+            handler.close()
+
+    def test_rolls_over_at_threshold(self, tmp_path):
+        """Test that crossing maxBytes rotates the file and resets the size."""
+        log_file = tmp_path / "app.log"
+        handler = CachedSizeRotatingFileHandler(log_file, maxBytes=25, backupCount=2)
+        try:
+            for _ in range(3):
+                handler.emit(self._record("a" * 9))
+        finally:
+            handler.close()
+
+        assert (tmp_path / "app.log.1").read_text() == "aaaaaaaaa\naaaaaaaaa\n"
+        assert log_file.read_text() == "aaaaaaaaa\n"
+        assert handler._cached_size == 10
+
+    def test_zero_max_bytes_never_rolls_over(self, tmp_path):
+        """Test that a handler without a size limit keeps a single file."""
+        log_file = tmp_path / "app.log"
+        handler = CachedSizeRotatingFileHandler(log_file, maxBytes=0, backupCount=2)
+        try:
+            for _ in range(5):
+                handler.emit(self._record("a" * 9))
+        finally:
+            handler.close()
+
+        assert not (tmp_path / "app.log.1").exists()
+        assert log_file.read_text() == "aaaaaaaaa\n" * 5
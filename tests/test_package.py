@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Tests for package-level metadata and lazy exports.
+"""
+
+import superdots
+
+
+def test_version_info_matches_version():
+    """Test that the VERSION_INFO literal is kept in sync with __version__."""
+    assert superdots.VERSION_INFO == tuple(map(int, superdots.__version__.split('.')))
+
+
+def test_version_alias():
+    """Test that VERSION mirrors __version__."""
+    assert superdots.VERSION == superdots.__version__
+
+
+def test_lazy_export_loads_on_access():
+    """Test that exports are resolved from their submodules on first access."""
+    from superdots.core.config import ConfigManager
+
+    assert superdots.ConfigManager is ConfigManager
+    assert 'ConfigManager' in dir(superdots)
+
+
+def test_lazy_export_missing_dependency(monkeypatch):
+    """Test that an export whose module cannot be imported resolves to None."""
+    import importlib
+
+    def fail(name, package=None):
+        raise ImportError(name)
+
+    original = vars(superdots).pop('SyncManager', None)
+    monkeypatch.setattr(importlib, 'import_module', fail)
+    try:
+        assert superdots.SyncManager is None
+    finally:
+        vars(superdots).pop('SyncManager', None)
+        if original is not None:
+            superdots.SyncManager = original
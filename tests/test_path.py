@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests for path utilities.
+"""
+
+import os
+import pytest
+
+from superdots.utils.path import clone_file, copy_file, copy_tree, resolve_path
+
+
+class TestCopyTree:
+    """Test concurrent directory tree copies."""
+
+    def test_copy_tree_copies_contents_and_modes(self, tmp_path):
+        """Test that files, nested directories and permissions are copied."""
+        src = tmp_path / "src"
+        (src / "nested" / "deeper").mkdir(parents=True)
+        (src / "empty").mkdir()
+        for index in range(10):
+            (src / f"file{index}").write_text(f"{index}\n")
+        script = src / "nested" / "deeper" / "run.sh"
+        script.write_text("#!/bin/sh\n")
+        script.chmod(0o755)
+
+        copy_tree(src, tmp_path / "dst")
+
+        dst = tmp_path / "dst"
+        assert (dst / "empty").is_dir()
+        assert [(dst / f"file{index}").read_text() for index in range(10)] == [f"{index}\n" for index in range(10)]
+        assert (dst / "nested" / "deeper" / "run.sh").stat().st_mode == script.stat().st_mode
+
+    def test_copy_tree_keeps_directory_mtime(self, tmp_path):
+        """Test that directory timestamps survive copying their files."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a").write_text("a\n")
+        os.utime(src, ns=(1_000_000_000, 1_000_000_000))
+
+        copy_tree(src, tmp_path / "dst")
+
+        assert (tmp_path / "dst").stat().st_mtime_ns == 1_000_000_000
+
+    def test_copy_tree_recreates_symlinks(self, tmp_path):
+        """Test that file and directory links are copied as links, not followed."""
+        src = tmp_path / "src"
+        (src / "sub").mkdir(parents=True)
+        (src / "real").write_text("real\n")
+        (src / "file_link").symlink_to("real")
+        (src / "sub" / "loop").symlink_to("..", target_is_directory=True)
+
+        copy_tree(src, tmp_path / "dst")
+
+        dst = tmp_path / "dst"
+        assert os.readlink(dst / "file_link") == "real"
+        assert (dst / "file_link").read_text() == "real\n"
+        assert os.readlink(dst / "sub" / "loop") == ".."
+
+    def test_copy_tree_refuses_existing_destination(self, tmp_path):
+        """Test that an existing destination is not merged into."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (tmp_path / "dst").mkdir()
+
+        with pytest.raises(FileExistsError):
+            copy_tree(src, tmp_path / "dst")
+
+
+class TestCloneFile:
+    """Test copy-on-write file clones."""
+
+    def test_clone_file_clones_or_leaves_nothing(self, tmp_path):
+        """Test that a failed clone leaves no partial destination behind."""
+        src = tmp_path / "src"
+        src.write_text("data\n")
+        src.chmod(0o750)
+
+        if clone_file(src, tmp_path / "dst"):
+            assert (tmp_path / "dst").read_text() == "data\n"
+            assert (tmp_path / "dst").stat().st_mode == src.stat().st_mode
+        else:
+            assert not (tmp_path / "dst").exists()
+
+    def test_clone_file_missing_source(self, tmp_path):
+        """Test that a missing source reports failure instead of raising."""
+        assert not clone_file(tmp_path / "missing", tmp_path / "dst")
+
+
+class TestCopyFile:
+    """Test single-file copies."""
+
+    @pytest.mark.parametrize("method", ["clone", "copy_file_range", "copy2"])
+    def test_copy_file_keeps_metadata(self, tmp_path, monkeypatch, method):
+        """Test that content, mode and timestamps are kept by every copy method."""
+        from superdots.utils import path as path_module
+        if method != "clone":
+            monkeypatch.setattr(path_module, 'clone_file', lambda src, dst: False)
+        if method == "copy2":
+            monkeypatch.delattr(os, 'copy_file_range', raising=False)
+        src = tmp_path / "src.txt"
+        src.write_text("payload\n" * 10000)
+        src.chmod(0o640)
+        os.utime(src, (1_000_000_000, 1_000_000_000))
+        dst = tmp_path / "dst.txt"
+
+        copy_file(src, dst)
+
+        assert dst.read_text() == "payload\n" * 10000
+        assert dst.stat().st_mode & 0o777 == 0o640
+        assert dst.stat().st_mtime == 1_000_000_000
+
+    def test_copy_tree_keeps_file_times(self, tmp_path):
+        """Test that files in a copied tree keep their modification times."""
+        src = tmp_path / "src"
+        src.mkdir()
+        for name in ("a", "b"):
+            (src / name).write_text(name)
+            os.utime(src / name, (1_000_000_000, 1_000_000_000))
+
+        copy_tree(src, tmp_path / "dst")
+
+        assert all((tmp_path / "dst" / name).stat().st_mtime == 1_000_000_000 for name in ("a", "b"))
+
+
+class TestResolvePath:
+    """Test cached path resolution."""
+
+    def test_matches_path_resolve(self, tmp_path):
+        """Test that symlinks and '..' are resolved like Path.resolve()."""
+        (tmp_path / "real").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        path = tmp_path / "link" / ".." / "link" / "file"
+
+        assert resolve_path(path) == path.resolve()
+        assert resolve_path(str(path)) == path.resolve()
+
+    def test_relative_paths_follow_working_directory(self, tmp_path, monkeypatch):
+        """Test that a cached relative path is not reused after chdir."""
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+
+        monkeypatch.chdir(tmp_path / "a")
+        first = resolve_path("file")
+        monkeypatch.chdir(tmp_path / "b")
+
+        assert first == (tmp_path / "a" / "file").resolve()
+        assert resolve_path("file") == (tmp_path / "b" / "file").resolve()
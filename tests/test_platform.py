@@ -136,6 +136,26 @@ class TestPlatformDetector:
         assert any('.bashrc' in str(path) for path in shell_paths)
         assert any('.zshrc' in str(path) for path in shell_paths)
 
+    def test_locations_built_lazily(self):
+        """Test that config paths and dotfile locations wait for first use."""
+        detector = PlatformDetector()
+        assert '_config_paths' not in vars(detector)
+        assert '_dotfiles_locations' not in vars(detector)
+
+        detector.get_config_dir()
+        detector.get_dotfiles_locations()
+        assert '_config_paths' in vars(detector)
+        assert '_dotfiles_locations' in vars(detector)
+
+    def test_get_dotfiles_locations_returns_copies(self):
+        """Test that callers cannot mutate the cached dotfile locations."""
+        detector = PlatformDetector()
+
+        locations = detector.get_dotfiles_locations()
+        locations['shell'].clear()
+
+        assert detector.get_dotfiles_locations()['shell'] == list(detector._dotfiles_locations['shell'])
+
     def test_get_shell_config_files(self):
         """Test getting existing shell config files."""
         detector = PlatformDetector()
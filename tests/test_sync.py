@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Tests for SyncManager deployment helpers.
+"""
+
+import os
+import platform
+import shutil
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from superdots.core.config import ConfigFile, ConfigManager, ConfigStatus, ConfigType
+from superdots.core.git_handler import GitHandler
+from superdots.core.sync import SyncManager
+from superdots.utils.platform import OSType, platform_detector
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git executable not available")
+
+
+@pytest.fixture
+def sync_manager(tmp_path, monkeypatch):
+    """Create a SyncManager over a fresh repository."""
+    for var in ('GIT_AUTHOR_NAME', 'GIT_COMMITTER_NAME'):
+        monkeypatch.setenv(var, "SuperDots Test")
+    for var in ('GIT_AUTHOR_EMAIL', 'GIT_COMMITTER_EMAIL'):
+        monkeypatch.setenv(var, "test@example.com")
+
+    repo_path = tmp_path / "repo"
+    git_handler = GitHandler(repo_path)
+    yield SyncManager(ConfigManager(repo_path), git_handler)
+    git_handler.close()
+
+
+def make_config(repo_path, target, config_type=ConfigType.DOTFILE):
+    """Create a copy-deployed configuration for the current platform."""
+    platform = platform_detector.os_type
+    return ConfigFile(
+        name=repo_path.name,
+        source_paths={platform: target},
+        repo_path=repo_path,
+        config_type=config_type,
+        platforms=[platform],
+        current_platform=platform,
+        status=ConfigStatus.TRACKED,
+        use_symlink=False,
+    )
+
+
+class TestDeploySingleConfig:
+    """Test copying configurations out of the repository."""
+
+    def test_file_copy_keeps_metadata(self, sync_manager, tmp_path):
+        """Test that a deployed file keeps content, mode and timestamps."""
+        source = tmp_path / "stored"
+        source.write_text("set number\n")
+        source.chmod(0o640)
+        os.utime(source, (1_000_000_000, 1_000_000_000))
+        target = tmp_path / "home" / ".vimrc"
+
+        assert sync_manager._deploy_single_config(make_config(source, target), target)
+
+        assert target.read_text() == "set number\n"
+        assert target.stat().st_mode & 0o777 == 0o640
+        assert target.stat().st_mtime == 1_000_000_000
+
+    def test_identical_copy_is_left_alone(self, sync_manager, tmp_path):
+        """Test that an unchanged target is not rewritten but a changed one is."""
+        source = tmp_path / "stored"
+        source.write_text("set number\n")
+        target = tmp_path / "home" / ".vimrc"
+        config = make_config(source, target)
+        assert sync_manager._deploy_single_config(config, target)
+        inode = target.stat().st_ino
+
+        assert sync_manager._deploy_single_config(config, target)
+        assert target.stat().st_ino == inode
+
+        source.write_text("set nonumber\n")
+        assert sync_manager._deploy_single_config(config, target)
+        assert target.read_text() == "set nonumber\n"
+
+    def test_mode_change_is_redeployed(self, sync_manager, tmp_path):
+        """Test that an identical copy with the wrong permissions is fixed."""
+        source = tmp_path / "stored"
+        source.write_text("#!/bin/sh\n")
+        target = tmp_path / "home" / "script"
+        config = make_config(source, target)
+        assert sync_manager._deploy_single_config(config, target)
+
+        config.executable = True
+        assert sync_manager._deploy_single_config(config, target)
+
+        assert target.stat().st_mode & 0o777 == 0o755
+
+    def test_dangling_symlink_is_replaced(self, sync_manager, tmp_path):
+        """Test that a broken symlink at the target is replaced by the copy."""
+        source = tmp_path / "stored"
+        source.write_text("set number\n")
+        target = tmp_path / "home" / ".vimrc"
+        target.parent.mkdir()
+        target.symlink_to(tmp_path / "gone")
+
+        assert sync_manager._deploy_single_config(make_config(source, target), target)
+
+        assert not target.is_symlink()
+        assert target.read_text() == "set number\n"
+
+    def test_existing_symlink_is_kept(self, sync_manager, tmp_path):
+        """Test that a symlink already pointing at the repository copy is kept."""
+        source = tmp_path / "stored"
+        source.write_text("set number\n")
+        target = tmp_path / "home" / ".vimrc"
+        config = make_config(source, target)
+        config.use_symlink = True
+        assert sync_manager._deploy_single_config(config, target)
+        assert target.is_symlink()
+        inode = os.lstat(target).st_ino
+
+        assert sync_manager._deploy_single_config(config, target)
+        assert os.lstat(target).st_ino == inode
+
+    def test_directory_copy_replaces_target(self, sync_manager, tmp_path):
+        """Test that a deployed directory replaces what was at the target."""
+        source = tmp_path / "stored"
+        (source / "nested").mkdir(parents=True)
+        (source / "nested" / "init.lua").write_text("-- lua\n")
+        target = tmp_path / "home" / "nvim"
+        target.mkdir(parents=True)
+        (target / "stale").write_text("old\n")
+
+        assert sync_manager._deploy_single_config(make_config(source, target, ConfigType.CONFIG_DIR), target)
+
+        assert (target / "nested" / "init.lua").read_text() == "-- lua\n"
+        assert not (target / "stale").exists()
+
+    def test_directory_copy_keeps_dangling_symlink(self, sync_manager, tmp_path):
+        """Test that a broken link inside a config directory does not abort the deploy."""
+        source = tmp_path / "stored"
+        source.mkdir()
+        (source / "init.lua").write_text("-- lua\n")
+        (source / "broken").symlink_to(tmp_path / "nowhere")
+        target = tmp_path / "home" / ".config" / "nvim"
+
+        assert sync_manager._deploy_single_config(make_config(source, target, ConfigType.CONFIG_DIR), target)
+
+        assert (target / "init.lua").read_text() == "-- lua\n"
+        assert os.readlink(target / "broken") == str(tmp_path / "nowhere")
+
+    def test_template_substitution(self, sync_manager, tmp_path):
+        """Test that known placeholders are filled in and unknown ones are kept."""
+        source = tmp_path / "stored"
+        source.write_text("user={{NAME}} id={{ID}}{{ID}} keep={{UNKNOWN}} {{{NAME}}}\n")
+        target = tmp_path / "home" / ".gitconfig"
+        config = make_config(source, target, ConfigType.TEMPLATE)
+        config.template_vars = {'NAME': "{{ID}}", 'ID': 7}
+
+        assert sync_manager._deploy_single_config(config, target)
+
+        assert target.read_text() == "user={{ID}} id=77 keep={{UNKNOWN}} {{{ID}}}\n"
+
+    def test_template_defaults(self, sync_manager, tmp_path):
+        """Test the built-in variables and that config variables override them."""
+        source = tmp_path / "stored"
+        source.write_text("{{HOSTNAME}} {{PLATFORM}} {{HOME}}\n")
+        target = tmp_path / "home" / ".hostrc"
+        config = make_config(source, target, ConfigType.TEMPLATE)
+        config.template_vars = {'HOME': "/custom"}
+
+        assert sync_manager._deploy_single_config(config, target)
+
+        assert target.read_text() == f"{platform.node()} {platform_detector.os_type.value} /custom\n"
+
+    def test_template_keeps_bytes(self, sync_manager, tmp_path):
+        """Test that non-ASCII text and line endings pass through rendering unchanged."""
+        source = tmp_path / "stored"
+        source.write_bytes("# café\r\nname={{NAME}}\r\n".encode('utf-8'))
+        target = tmp_path / "home" / ".profile"
+        config = make_config(source, target, ConfigType.TEMPLATE)
+        config.template_vars = {'NAME': "Zoë"}
+
+        assert sync_manager._deploy_single_config(config, target)
+
+        assert target.read_bytes() == "# café\r\nname=Zoë\r\n".encode('utf-8')
+
+
+class TestMapPathForPlatform:
+    """Test cross-platform path mapping."""
+
+    def test_config_paths_are_mapped(self, sync_manager):
+        """Test that ~/.config paths move to the target platform's config directory."""
+        home = Path.home()
+
+        mapped = sync_manager._map_path_for_platform(home / ".config" / "nvim", OSType.WINDOWS)
+
+        assert mapped == home / "AppData" / "Roaming" / "nvim"
+        assert sync_manager._map_path_for_platform(home / ".vimrc", OSType.WINDOWS) == home / ".vimrc"
+
+    def test_mappings_load_on_first_use(self, sync_manager, monkeypatch):
+        """Test that mappings are not loaded until a path is mapped."""
+        calls = []
+        load = SyncManager._load_platform_mappings
+        monkeypatch.setattr(SyncManager, '_load_platform_mappings', lambda self: calls.append(1) or load(self))
+
+        manager = SyncManager(sync_manager.config_manager, sync_manager.git_handler)
+        assert calls == []
+
+        manager._map_path_for_platform(Path.home() / ".config" / "git", OSType.WINDOWS)
+        manager._map_path_for_platform(Path.home() / ".config" / "nvim", OSType.WINDOWS)
+        assert calls == [1]
+
+    def test_custom_mappings_are_used(self, sync_manager):
+        """Test that mappings loaded from platform_mappings.json are applied."""
+        mappings_file = sync_manager.config_manager.repo_path / 'platform_mappings.json'
+        mappings_file.write_text('{"home_config_paths": {"linux": "~/.local/config"}}')
+
+        manager = SyncManager(sync_manager.config_manager, sync_manager.git_handler)
+
+        mapped = manager._map_path_for_platform(Path.home() / ".config" / "git", OSType.LINUX)
+        assert mapped == Path.home() / ".local" / "config" / "git"
+        assert manager._map_path_for_platform(Path.home() / ".config" / "git", OSType.MACOS) == Path.home() / ".config" / "git"
+
+
+class TestPushChanges:
+    """Test pushing local changes."""
+
+    def test_push_updates_changed_configs(self, sync_manager, tmp_path):
+        """Test that changed sources are copied, committed and pushed in one pass."""
+        remote = tmp_path / "remote.git"
+        sync_manager.git_handler._run_git_command(['init', '--bare', str(remote)])
+        sync_manager.git_handler.add_remote('origin', str(remote))
+
+        platform = platform_detector.os_type
+        sources = []
+        for name in ("bashrc", "vimrc"):
+            source = tmp_path / f".{name}"
+            source.write_text(f"# {name}\n")
+            assert sync_manager.config_manager.add_config({platform: source}, name=name, use_symlink=False)
+            sources.append(source)
+        sync_manager.git_handler.add_all()
+        sync_manager.git_handler.commit("Track configs")
+        sync_manager.git_handler._run_git_command(['push', '-u', 'origin', 'HEAD'])
+        for source in sources:
+            source.write_text(source.read_text() + "changed\n")
+        sync_manager.git_handler.invalidate_cache()
+
+        result = sync_manager.push_changes(message="Update configs", force=True)
+
+        assert result.errors == []
+        assert result.configs_synced == 2
+        for name in ("bashrc", "vimrc"):
+            assert sync_manager.config_manager.get_config(name).repo_path.read_text() == f"# {name}\nchanged\n"
+        log = sync_manager.git_handler._run_git_command(['--git-dir', str(remote), 'log', '-1', '--format=%s'])
+        assert log == "Update configs"
+
+    def test_push_skips_missing_sources(self, sync_manager, tmp_path):
+        """Test that configs whose source is gone are skipped rather than failed."""
+        platform = platform_detector.os_type
+        for name in ("bashrc", "vimrc", "zshrc"):
+            source = tmp_path / f".{name}"
+            source.write_text(f"# {name}\n")
+            assert sync_manager.config_manager.add_config({platform: source}, name=name, use_symlink=False)
+        (tmp_path / ".vimrc").unlink()
+
+        with patch.object(sync_manager.config_manager, 'update_configs', return_value={}) as update:
+            sync_manager.push_changes(message="Update configs", force=True)
+
+        assert sorted(update.call_args[0][0]) == ["bashrc", "zshrc"]
+
+    def test_push_skips_dangling_sources_in_shared_directory(self, sync_manager, tmp_path):
+        """Test that a broken source link is skipped like a missing source."""
+        platform = platform_detector.os_type
+        for name in ("bashrc", "vimrc"):
+            source = tmp_path / f".{name}"
+            source.write_text(f"# {name}\n")
+            assert sync_manager.config_manager.add_config({platform: source}, name=name, use_symlink=False)
+        (tmp_path / ".vimrc").unlink()
+        (tmp_path / ".vimrc").symlink_to(tmp_path / "nowhere")
+
+        with patch.object(sync_manager.config_manager, 'update_configs', return_value={}) as update:
+            sync_manager.push_changes(message="Update configs", force=True)
+
+        assert update.call_args[0][0] == ["bashrc"]
+
+
+class TestPullChanges:
+    """Test pulling remote changes."""
+
+    def test_pull_merges_fetched_commits(self, sync_manager, tmp_path):
+        """Test that remote commits are fetched once and merged."""
+        git = sync_manager.git_handler
+        remote = tmp_path / "remote.git"
+        git._run_git_command(['init', '--bare', str(remote)])
+        git.add_remote('origin', str(remote))
+        git.add_all()
+        git.commit("Track index")
+        git._run_git_command(['push', '-u', 'origin', 'HEAD'])
+
+        other = tmp_path / "other"
+        git._run_git_command(['clone', str(remote), str(other)])
+        (other / "remote.txt").write_text("from elsewhere\n")
+        git._run_git_command(['add', 'remote.txt'], cwd=other)
+        git._run_git_command(['commit', '-m', "Remote change"], cwd=other)
+        git._run_git_command(['push'], cwd=other)
+
+        result = sync_manager.pull_changes()
+
+        assert result.errors == []
+        assert (git.repo_path / "remote.txt").read_text() == "from elsewhere\n"
+        assert git.get_commits(max_count=1)[0]['message'] == "Remote change"
+
+
+class TestSyncStatus:
+    """Test the cached sync status."""
+
+    def test_status_is_reused_briefly(self, sync_manager):
+        """Test that back-to-back calls check configurations once and return independent copies."""
+        with patch.object(sync_manager.config_manager, 'check_status', return_value={'tracked': []}) as check:
+            first = sync_manager.get_sync_status()
+            first['configurations']['tracked'].append("bogus")
+            second = sync_manager.get_sync_status()
+
+        assert check.call_count == 1
+        assert second['configurations'] == {'tracked': []}
+
+    def test_sync_operations_discard_status(self, sync_manager):
+        """Test that pulling refreshes the status on the next call."""
+        with patch.object(sync_manager.config_manager, 'check_status', return_value={}) as check:
+            sync_manager.get_sync_status()
+            sync_manager.pull_changes()
+            sync_manager.get_sync_status()
+
+        assert check.call_count == 2